@@ -18,8 +18,20 @@ CONFIG = PlexConfig(CONFIG_PATH)
 PROJECT = 'PlexAPI'
 VERSION = __version__ = const.__version__
 TIMEOUT = CONFIG.get('plexapi.timeout', 30, int)
+X_PLEX_AUTORELOAD_STRICT = CONFIG.get('plexapi.autoreload_strict', False, bool)
 X_PLEX_CONTAINER_SIZE = CONFIG.get('plexapi.container_size', 100, int)
+X_PLEX_CONTAINER_WORKERS = CONFIG.get('plexapi.container_workers', 1, int)
 X_PLEX_ENABLE_FAST_CONNECT = CONFIG.get('plexapi.enable_fast_connect', False, bool)
+X_PLEX_XML_PARSER = CONFIG.get('plexapi.xml_parser', 'etree')
+X_PLEX_LEAN_OBJECTS = CONFIG.get('plexapi.lean_objects', False, bool)
+X_PLEX_POOL_CONNECTIONS = CONFIG.get('plexapi.pool_connections', 10, int)
+X_PLEX_POOL_SIZE = CONFIG.get('plexapi.pool_size', 10, int)
+X_PLEX_MAX_RETRIES = CONFIG.get('plexapi.max_retries', 0, int)
+X_PLEX_RETRY_BACKOFF = CONFIG.get('plexapi.retry_backoff', 0.5, float)
+X_PLEX_SHARED_SESSION = CONFIG.get('plexapi.shared_session', False, bool)
+X_PLEX_FILTER_CHOICES_TTL = CONFIG.get('plexapi.filter_choices_ttl', 300, int)
+X_PLEX_CONNECTION_CACHE = CONFIG.get('plexapi.connection_cache')
+X_PLEX_CONNECTION_CACHE_TTL = CONFIG.get('plexapi.connection_cache_ttl', 3600, int)
 
 # Plex Header Configuration
 X_PLEX_PROVIDES = CONFIG.get('header.provides', 'controller')
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from xml.etree.ElementTree import Element
+
+from plexapi import X_PLEX_CONTAINER_SIZE, log, metrics, utils
+from plexapi.alert import AsyncAlertListener
+from plexapi.base import MediaContainer, PlexObject
+from plexapi.exceptions import BadRequest, NotFound, Unauthorized, Unsupported
+from plexapi.server import PlexServer
+from requests.status_codes import _codes as codes
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncPlexServer:
+    """ asyncio interface to a Plex Media Server. Requests are sent with an ``aiohttp`` session
+        while the responses are parsed into the same PlexAPI objects as a regular
+        :class:`~plexapi.server.PlexServer`. Many requests can therefore be awaited concurrently
+        from a single event loop without using a thread per request.
+
+        The built objects are bound to the synchronous :class:`~plexapi.server.PlexServer`
+        available as :attr:`server`, so every regular (blocking) method keeps working on them.
+        The :class:`~plexapi.cache.ResponseCache` of the server is shared by both interfaces.
+        Use :func:`~plexapi.aio.AsyncPlexServer.connect` to create a new instance.
+
+        Note: ``aiohttp`` must be installed in order to use this feature.
+
+        .. code-block:: python
+
+            >> pip install aiohttp
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The synchronous server the built objects are bound to.
+            session (aiohttp.ClientSession, optional): Use your own aiohttp session.
+            maxConcurrency (int, optional): Max number of concurrent requests when fetching the
+                pages of a listing (default 10).
+
+        Example:
+
+            .. code-block:: python
+
+                import asyncio
+                from plexapi.aio import AsyncPlexServer
+
+                async def main():
+                    async with await AsyncPlexServer.connect('http://localhost:32400', token='xxxx') as plex:
+                        movies, shows = await asyncio.gather(
+                            plex.fetchItems('/library/sections/1/all'),
+                            plex.fetchItems('/library/sections/2/all'),
+                        )
+                        movie = await plex.reload(movies[0])
+
+                asyncio.run(main())
+
+    """
+
+    def __init__(self, server, session=None, maxConcurrency=10):
+        if aiohttp is None:
+            raise Unsupported('aiohttp must be installed to use the AsyncPlexServer.')
+        self.server = server
+        self._session = session
+        self._ownSession = session is None
+        self._maxConcurrency = maxConcurrency
+        # Created on first use so it is bound to the running event loop
+        self._semaphore = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.server._baseurl}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @classmethod
+    async def connect(cls, baseurl=None, token=None, session=None, timeout=None, cache=None,
+                      aiosession=None, maxConcurrency=10):
+        """ Connect to the Plex Media Server and return a new :class:`~plexapi.aio.AsyncPlexServer`.
+            See :class:`~plexapi.server.PlexServer` for the parameters, the extra parameters are
+            the ``aiohttp`` session and the max number of concurrent requests.
+
+            Parameters:
+                aiosession (aiohttp.ClientSession, optional): Use your own aiohttp session.
+                maxConcurrency (int, optional): Max number of concurrent requests (default 10).
+        """
+        server = PlexServer.__new__(PlexServer)
+        server._setup(baseurl, token, session, timeout, cache)
+        self = cls(server, session=aiosession, maxConcurrency=maxConcurrency)
+        data = await self.query(server.key, timeout=server._timeout)
+        PlexObject.__init__(server, server, data, server.key)
+        return self
+
+    async def close(self):
+        """ Close the aiohttp session if it was created by this object. """
+        if self._ownSession and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def alertListener(self, **kwargs):
+        """ Returns a new :class:`~plexapi.alert.AsyncAlertListener` for the server sharing the aiohttp
+            session. Start it with ``await listener.start()`` or ``async with listener:``.
+            See :class:`~plexapi.alert.AsyncAlertListener` for the parameters.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        kwargs.setdefault('session', self._session)
+        return AsyncAlertListener(self.server, **kwargs)
+
+    async def query(self, key, method='get', headers=None, params=None, timeout=None, **kwargs):
+        """ asyncio version of :func:`~plexapi.server.PlexServer.query`. Returns the parsed
+            ElementTree object or None if no data exists in the response.
+
+            Parameters:
+                key (str): API URL path in Plex to request.
+                method (str): HTTP method to use (default 'get').
+                headers (dict, optional): Additional headers to send.
+                params (dict, optional): Additional query parameters to send.
+                timeout (int, optional): Timeout in seconds (default the server timeout).
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._maxConcurrency)
+        url = self.server.url(key)
+        timeout = aiohttp.ClientTimeout(total=timeout or self.server._timeout)
+        headers = self.server._headers(**headers or {})
+        if params:
+            params = {k: str(v) for k, v in params.items() if v is not None}
+        log.debug('%s %s', method.upper(), url)
+        cache = self.server._cache
+        with metrics.track('aio', method, url) as request:
+            cacheKey, cached = None, None
+            invalidate = cache is not None and cache.changesState(method, url)
+            if cache is not None and not invalidate and cache.cacheable(url):
+                cacheKey = cache.key('get', url, params, headers)
+                cached = cache.get(cacheKey)
+                if cached is not None and cached.fresh:
+                    log.debug('Using cached response for %s', url)
+                    request.cached(cached.content)
+                    return utils.parseXML(cached.content)
+                if cached is not None:
+                    headers.update(cached.conditionalHeaders())
+
+            async with self._semaphore:
+                async with self._session.request(
+                    method, url, headers=headers, params=params, timeout=timeout, **kwargs
+                ) as response:
+                    content = await response.read()
+            request.response(status=response.status, content=content)
+            if invalidate:
+                cache.invalidateRequest(url, params)
+            if cached is not None and response.status == 304:
+                cache.revalidated(cacheKey, url)
+                return utils.parseXML(cached.content)
+            _checkResponse(response, content)
+            if cacheKey is not None:
+                cache.set(cacheKey, url, _Response(content, response.headers))
+            return utils.parseXML(content)
+
+    async def fetchItems(self, ekey, cls=None, container_start=None, container_size=None,
+                         maxresults=None, params=None, **kwargs):
+        """ asyncio version of :func:`~plexapi.base.PlexObject.fetchItems`. The first page is
+            fetched to get the total number of items, then all remaining pages are fetched
+            concurrently. When filtering with maxresults, the pages are fetched ``maxConcurrency``
+            at a time until enough items have matched.
+            See :func:`~plexapi.base.PlexObject.fetchItems` for the parameters.
+        """
+        if ekey is None:
+            raise BadRequest('ekey was not provided')
+
+        if isinstance(ekey, list) and all(isinstance(key, int) for key in ekey):
+            ekey = f'/library/metadata/{",".join(str(key) for key in ekey)}'
+
+        container_start = container_start or 0
+        container_size = container_size or X_PLEX_CONTAINER_SIZE
+        page_size = container_size
+        if maxresults is not None:
+            container_size = min(container_size, maxresults)
+
+        results = MediaContainer[cls](self.server, Element('MediaContainer'), initpath=ekey)
+        data, subresults = await self._fetchPage(ekey, cls, container_start, container_size, params, **kwargs)
+        results.extend(subresults)
+
+        total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or len(subresults)
+        container_end = total_size
+        if maxresults is not None and not kwargs:
+            container_end = min(total_size, container_start + maxresults)
+
+        starts = list(range(container_start + container_size, container_end, page_size))
+        # Filtered pages may hold fewer matches than requested, so fetch them a wave at a time
+        # until enough items have matched instead of requesting the whole listing at once.
+        wave = self._maxConcurrency if maxresults is not None and kwargs else len(starts)
+        for i in range(0, len(starts), max(wave, 1)):
+            if maxresults is not None and len(results) >= maxresults:
+                break
+            pages = await asyncio.gather(*(
+                self._fetchPage(ekey, cls, start, min(page_size, container_end - start), params, **kwargs)
+                for start in starts[i:i + wave]
+            ))
+            for _, subresults in pages:
+                results.extend(subresults)
+
+        if maxresults is not None:
+            del results[maxresults:]
+        return results
+
+    async def fetchItem(self, ekey, cls=None, **kwargs):
+        """ asyncio version of :func:`~plexapi.base.PlexObject.fetchItem`.
+            See :func:`~plexapi.base.PlexObject.fetchItem` for the parameters.
+        """
+        if isinstance(ekey, int):
+            ekey = f'/library/metadata/{ekey}'
+
+        try:
+            return (await self.fetchItems(ekey, cls, **kwargs))[0]
+        except IndexError:
+            clsname = cls.__name__ if cls else 'None'
+            raise NotFound(f'Unable to find elem: cls={clsname}, attrs={kwargs}') from None
+
+    async def reload(self, item, key=None, **kwargs):
+        """ asyncio version of :func:`~plexapi.base.PlexObject.reload`. Reloads the data for the
+            item in place and returns the item.
+
+            Parameters:
+                item (:class:`~plexapi.base.PlexObject`): The object to reload.
+                key (string, optional): Override the key to reload.
+                **kwargs (dict): A dictionary of XML include parameters to include/exclude or override.
+        """
+        details_key = item._buildDetailsKey(**kwargs) if kwargs else item._details_key
+        key = key or details_key or item.key
+        if not key:
+            raise Unsupported('Cannot reload an object not built from a URL.')
+        data = await self.query(key)
+        item._initpath = key
+        item._loadData(data[0])
+        item._leanData()
+        return item
+
+    async def _fetchPage(self, ekey, cls, container_start, container_size, params=None, **kwargs):
+        headers = {
+            'X-Plex-Container-Start': str(container_start),
+            'X-Plex-Container-Size': str(container_size),
+        }
+        data = await self.query(ekey, headers=headers, params=params)
+        return data, self.server._buildPage(data, cls, ekey, **kwargs)
+
+
+def _checkResponse(response, content):
+    """ Raises the PlexAPI exception matching the status of an unsuccessful aiohttp response. """
+    if response.status in (200, 201, 204):
+        return
+    codename = codes.get(response.status)[0]
+    errtext = content.decode('utf-8', errors='replace').replace('\n', ' ')
+    message = f'({response.status}) {codename}; {response.url} {errtext}'
+    if response.status == 401:
+        raise Unauthorized(message)
+    elif response.status == 404:
+        raise NotFound(message)
+    raise BadRequest(message)
+
+
+class _Response:
+    """ Response content and headers stored in the :class:`~plexapi.cache.ResponseCache`. """
+
+    def __init__(self, content, headers):
+        self.content = content
+        self.headers = headers
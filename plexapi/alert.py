@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import functools
+import inspect
 import json
+import re
 import socket
+from fnmatch import fnmatchcase
 from typing import Callable
 import threading
 
 from plexapi import log
+from plexapi.exceptions import BadRequest, Unsupported
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Matches the notification type at the start of a raw alert message
+_TYPE_RE = re.compile(r'^\s*\{\s*"NotificationContainer"\s*:\s*\{\s*"type"\s*:\s*"([^"]+)"')
 
 
 class AlertListener(threading.Thread):
@@ -95,3 +109,268 @@ class AlertListener(threading.Thread):
                 self._callbackError(err)
         except Exception as err:  # pragma: no cover
             log.error('AlertListener Error: Error: %s', err)
+
+
+class AlertEvent:
+    """ A single alert notification received by the :class:`~plexapi.alert.AsyncAlertListener`.
+        The JSON message is only decoded when :attr:`data` or :attr:`entries` is first accessed.
+
+        Attributes:
+            raw (str): The raw JSON message received from the websocket.
+    """
+    __slots__ = ('raw', '_type', '_data')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._type = None
+        self._data = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.type}>'
+
+    @property
+    def type(self):
+        """ The notification type (e.g. ``timeline``, ``playing``, ``activity``, ``transcodeSession.update``). """
+        if self._type is None:
+            match = _TYPE_RE.match(self.raw)
+            self._type = match.group(1) if match else self.data.get('type')
+        return self._type
+
+    @property
+    def data(self):
+        """ The decoded ``NotificationContainer`` dictionary, the same data sent to the
+            :class:`~plexapi.alert.AlertListener` callback.
+        """
+        if self._data is None:
+            self._data = json.loads(self.raw)['NotificationContainer']
+        return self._data
+
+    @property
+    def entries(self):
+        """ The list of notifications in the container (e.g. the ``TimelineEntry`` or
+            ``PlaySessionStateNotification`` items).
+        """
+        return next((value for value in self.data.values() if isinstance(value, list)), [])
+
+
+class AsyncAlertListener:
+    """ asyncio version of the :class:`~plexapi.alert.AlertListener`. Messages are read from the
+        websocket into a bounded queue and dispatched to the subscribers from a separate task, so
+        slow subscribers never stall reading the websocket. The connection is automatically
+        reopened with an exponential backoff when it drops.
+
+        Note: ``aiohttp`` must be installed in order to use this feature.
+
+        .. code-block:: python
+
+            >> pip install aiohttp
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer this listener is connected to.
+            queueSize (int): Max number of messages waiting to be dispatched (default 1000).
+            overflow (str): What to do when the queue is full. ``block`` stops reading the websocket
+                until there is room, ``dropOldest`` (default) discards the oldest queued message and
+                ``dropNewest`` discards the received message. Discarded messages are counted in
+                :attr:`dropped`.
+            reconnect (bool): True to reconnect when the connection drops (default True).
+            backoff (float): Seconds to wait before the first reconnect attempt (default 1).
+                The delay doubles after every failed attempt up to ``maxBackoff``.
+            maxBackoff (float): Max seconds to wait between reconnect attempts (default 60).
+            heartbeat (float): Seconds between websocket pings to detect dead connections (default 30).
+            session (aiohttp.ClientSession, optional): Use your own aiohttp session.
+            callbackError (func, optional): Function called with every connection error.
+
+        Attributes:
+            dropped (int): Number of messages discarded because the queue was full.
+            connected (bool): True while the websocket is connected.
+
+        Example:
+
+            .. code-block:: python
+
+                import asyncio
+                from plexapi.alert import AsyncAlertListener
+
+                async def onTimeline(event):
+                    for entry in event.entries:
+                        print(entry['itemID'], entry['state'])
+
+                async def main():
+                    async with AsyncAlertListener(plex) as listener:
+                        listener.subscribe(onTimeline, 'timeline')
+                        listener.subscribe(print, ['playing', 'transcodeSession.*'])
+                        await asyncio.sleep(3600)
+
+                asyncio.run(main())
+
+    """
+    key = AlertListener.key
+    OVERFLOW_POLICIES = ('block', 'dropOldest', 'dropNewest')
+
+    def __init__(self, server, queueSize=1000, overflow='dropOldest', reconnect=True, backoff=1.0,
+                 maxBackoff=60.0, heartbeat=30.0, session=None, callbackError: Callable = None):
+        if aiohttp is None:
+            raise Unsupported('aiohttp must be installed to use the AsyncAlertListener.')
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise BadRequest(f'Unknown overflow policy "{overflow}". Available policies: {self.OVERFLOW_POLICIES}')
+        self._server = server
+        self.queueSize = queueSize
+        self.overflow = overflow
+        self.reconnect = reconnect
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.heartbeat = heartbeat
+        self._session = session
+        self._ownSession = session is None
+        self._callbackError = callbackError
+        self._subscribers = []
+        self._queue = None
+        self._tasks = []
+        self._ws = None
+        self._stopping = False
+        self.dropped = 0
+        self.connected = False
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self._server._baseurl}>'
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    def subscribe(self, callback, types=None):
+        """ Registers a callback for the alerts of the specified types and returns the callback.
+            The callback is called with the :class:`~plexapi.alert.AlertEvent` and may be a coroutine
+            function, in which case it is awaited on the event loop. Plain functions are run in the
+            default executor so blocking calls (e.g. the synchronous PlexServer API) do not block the
+            websocket. Every callback finishes before the next alert is dispatched, and exceptions
+            raised by a callback are logged without stopping the listener.
+
+            Parameters:
+                callback (func): Function or coroutine function accepting a single event argument.
+                types (str or list<str>, optional): Alert types to receive. Wildcards are supported
+                    (e.g. ``transcodeSession.*``). Default receives all alerts.
+        """
+        if isinstance(types, str):
+            types = [types]
+        self._subscribers.append((tuple(types) if types else None, callback))
+        return callback
+
+    def unsubscribe(self, callback):
+        """ Removes all subscriptions of the callback. """
+        self._subscribers = [(types, cb) for types, cb in self._subscribers if cb != callback]
+
+    async def start(self):
+        """ Connects to the websocket and starts dispatching the alerts. """
+        if self._tasks:
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue(maxsize=self.queueSize)
+        self._tasks = [asyncio.create_task(self._receive()), asyncio.create_task(self._dispatch())]
+
+    async def stop(self):
+        """ Closes the websocket and stops dispatching alerts. Queued alerts which were not
+            dispatched yet are discarded.
+        """
+        log.info('Stopping AsyncAlertListener.')
+        self._stopping = True
+        if self._ws is not None:
+            await self._ws.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._ownSession and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def join(self):
+        """ Waits until all received alerts have been dispatched. """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _receive(self):
+        """ Reads the websocket messages into the queue, reconnecting when the connection drops. """
+        url = self._server.url(self.key, includeToken=True).replace('http', 'ws')
+        delay = self.backoff
+        while not self._stopping:
+            try:
+                if self._session is None:
+                    self._session = aiohttp.ClientSession()
+                async with self._session.ws_connect(url, heartbeat=self.heartbeat) as ws:
+                    self._ws = ws
+                    self.connected = True
+                    delay = self.backoff
+                    log.info('AsyncAlertListener connected: %s', self._server._baseurl)
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            await self._enqueue(message.data)
+                        elif message.type == aiohttp.WSMsgType.ERROR:
+                            raise ws.exception()
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                log.error('AsyncAlertListener Error: %s', err)
+                self._onError(err)
+            finally:
+                self._ws = None
+                self.connected = False
+            if self._stopping or not self.reconnect:
+                break
+            log.info('AsyncAlertListener reconnecting in %s seconds', delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.maxBackoff)
+
+    async def _enqueue(self, raw):
+        """ Adds a message to the queue applying the overflow policy. """
+        if self.overflow == 'block':
+            await self._queue.put(raw)
+            return
+        if self._queue.full():
+            self.dropped += 1
+            if self.overflow == 'dropNewest':
+                return
+            self._queue.get_nowait()
+            self._queue.task_done()
+        self._queue.put_nowait(raw)
+
+    async def _dispatch(self):
+        """ Dispatches the queued messages to the subscribers. """
+        while True:
+            raw = await self._queue.get()
+            try:
+                await self._handle(AlertEvent(raw))
+            finally:
+                self._queue.task_done()
+
+    async def _handle(self, event):
+        for types, callback in list(self._subscribers):
+            try:
+                if types is not None and not any(fnmatchcase(event.type, t) for t in types):
+                    continue
+                if _isCoroutineFunction(callback):
+                    result = callback(event)
+                else:
+                    # Run plain callbacks in a thread so they cannot block the event loop
+                    result = await asyncio.get_running_loop().run_in_executor(None, callback, event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as err:
+                log.exception('AsyncAlertListener callback %s failed: %s', callback, err)
+
+    def _onError(self, err):
+        try:
+            if self._callbackError:
+                self._callbackError(err)
+        except Exception as err:  # pragma: no cover
+            log.error('AsyncAlertListener Error: Error: %s', err)
+
+
+def _isCoroutineFunction(callback):
+    """ Returns True if the callback is a coroutine function or an object with an async ``__call__``. """
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    return inspect.iscoroutinefunction(callback) or inspect.iscoroutinefunction(getattr(callback, '__call__', None))
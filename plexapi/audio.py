@@ -8,7 +8,7 @@ from urllib.parse import quote_plus
 from typing import Any, Dict, List, Optional, TypeVar
 
 from plexapi import media, utils
-from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession
+from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, lazyItems
 from plexapi.exceptions import BadRequest
 from plexapi.mixins import (
     AdvancedSettingsMixin, SplitMergeMixin, UnmatchMatchMixin, ExtrasMixin, HubsMixin, PlayedUnplayedMixin, RatingMixin,
@@ -57,6 +57,10 @@ class Audio(PlexPartialObject, PlayedUnplayedMixin):
     """
     METADATA_TYPE = 'track'
 
+    fields = lazyItems(media.Field)
+    images = lazyItems(media.Image)
+    moods = lazyItems(media.Mood)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self._data = data
@@ -64,9 +68,7 @@ class Audio(PlexPartialObject, PlayedUnplayedMixin):
         self.art = data.attrib.get('art')
         self.artBlurHash = data.attrib.get('artBlurHash')
         self.distance = utils.cast(float, data.attrib.get('distance'))
-        self.fields = self.findItems(data, media.Field)
         self.guid = data.attrib.get('guid')
-        self.images = self.findItems(data, media.Image)
         self.index = utils.cast(int, data.attrib.get('index'))
         self.key = data.attrib.get('key', '')
         self.lastRatedAt = utils.toDatetime(data.attrib.get('lastRatedAt'))
@@ -75,7 +77,6 @@ class Audio(PlexPartialObject, PlayedUnplayedMixin):
         self.librarySectionKey = data.attrib.get('librarySectionKey')
         self.librarySectionTitle = data.attrib.get('librarySectionTitle')
         self.listType = 'audio'
-        self.moods = self.findItems(data, media.Mood)
         self.musicAnalysisVersion = utils.cast(int, data.attrib.get('musicAnalysisVersion'))
         self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
         self.summary = data.attrib.get('summary')
@@ -200,21 +201,22 @@ class Artist(
     TAG = 'Directory'
     TYPE = 'artist'
 
+    collections = lazyItems(media.Collection)
+    countries = lazyItems(media.Country)
+    genres = lazyItems(media.Genre)
+    guids = lazyItems(media.Guid)
+    labels = lazyItems(media.Label)
+    similar = lazyItems(media.Similar)
+    styles = lazyItems(media.Style)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         Audio._loadData(self, data)
         self.albumSort = utils.cast(int, data.attrib.get('albumSort', '-1'))
         self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.collections = self.findItems(data, media.Collection)
-        self.countries = self.findItems(data, media.Country)
-        self.genres = self.findItems(data, media.Genre)
-        self.guids = self.findItems(data, media.Guid)
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.labels = self.findItems(data, media.Label)
         self.locations = self.listAttrs(data, 'path', etag='Location')
         self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.similar = self.findItems(data, media.Similar)
-        self.styles = self.findItems(data, media.Style)
         self.theme = data.attrib.get('theme')
         self.ultraBlurColors = self.findItem(data, media.UltraBlurColors)
 
@@ -351,16 +353,19 @@ class Album(
     TAG = 'Directory'
     TYPE = 'album'
 
+    collections = lazyItems(media.Collection)
+    formats = lazyItems(media.Format)
+    genres = lazyItems(media.Genre)
+    guids = lazyItems(media.Guid)
+    labels = lazyItems(media.Label)
+    styles = lazyItems(media.Style)
+    subformats = lazyItems(media.Subformat)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         Audio._loadData(self, data)
         self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.collections = self.findItems(data, media.Collection)
-        self.formats = self.findItems(data, media.Format)
-        self.genres = self.findItems(data, media.Genre)
-        self.guids = self.findItems(data, media.Guid)
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.labels = self.findItems(data, media.Label)
         self.leafCount = utils.cast(int, data.attrib.get('leafCount'))
         self.loudnessAnalysisVersion = utils.cast(int, data.attrib.get('loudnessAnalysisVersion'))
         self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
@@ -372,8 +377,6 @@ class Album(
         self.parentTitle = data.attrib.get('parentTitle')
         self.rating = utils.cast(float, data.attrib.get('rating'))
         self.studio = data.attrib.get('studio')
-        self.styles = self.findItems(data, media.Style)
-        self.subformats = self.findItems(data, media.Subformat)
         self.ultraBlurColors = self.findItem(data, media.UltraBlurColors)
         self.viewedLeafCount = utils.cast(int, data.attrib.get('viewedLeafCount'))
         self.year = utils.cast(int, data.attrib.get('year'))
@@ -490,16 +493,20 @@ class Track(
     TAG = 'Track'
     TYPE = 'track'
 
+    chapters = lazyItems(media.Chapter)
+    collections = lazyItems(media.Collection)
+    genres = lazyItems(media.Genre)
+    guids = lazyItems(media.Guid)
+    labels = lazyItems(media.Label)
+    media = lazyItems(media.Media)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         Audio._loadData(self, data)
         Playable._loadData(self, data)
         self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.chapters = self.findItems(data, media.Chapter)
         self.chapterSource = data.attrib.get('chapterSource')
-        self.collections = self.findItems(data, media.Collection)
         self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.genres = self.findItems(data, media.Genre)
         self.grandparentArt = data.attrib.get('grandparentArt')
         self.grandparentGuid = data.attrib.get('grandparentGuid')
         self.grandparentKey = data.attrib.get('grandparentKey')
@@ -507,9 +514,6 @@ class Track(
         self.grandparentTheme = data.attrib.get('grandparentTheme')
         self.grandparentThumb = data.attrib.get('grandparentThumb')
         self.grandparentTitle = data.attrib.get('grandparentTitle')
-        self.guids = self.findItems(data, media.Guid)
-        self.labels = self.findItems(data, media.Label)
-        self.media = self.findItems(data, media.Media)
         self.originalTitle = data.attrib.get('originalTitle')
         self.parentGuid = data.attrib.get('parentGuid')
         self.parentIndex = utils.cast(int, data.attrib.get('parentIndex'))
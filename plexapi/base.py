@@ -1,14 +1,21 @@
 # -*- coding: utf-8 -*-
 import re
+import sys
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import TYPE_CHECKING, Generic, Iterable, List, Optional, TypeVar, Union
 import weakref
-from functools import cached_property
+from functools import cached_property, partial
 from urllib.parse import parse_qsl, urlencode, urlparse
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
-from plexapi import CONFIG, X_PLEX_CONTAINER_SIZE, log, utils
-from plexapi.exceptions import BadRequest, NotFound, UnknownType, Unsupported
+from plexapi import (
+    CONFIG, X_PLEX_AUTORELOAD_STRICT, X_PLEX_CONTAINER_SIZE, X_PLEX_CONTAINER_WORKERS, X_PLEX_LEAN_OBJECTS, log, metrics, utils
+)
+from plexapi.exceptions import BadRequest, NotFound, ReloadRequired, UnknownType, Unsupported
 
 if TYPE_CHECKING:
     from plexapi.server import PlexServer
@@ -18,6 +25,25 @@ MediaContainerT = TypeVar("MediaContainerT", bound="MediaContainer")
 
 USER_DONT_RELOAD_FOR_KEYS = set()
 _DONT_RELOAD_FOR_KEYS = {'key', 'sourceURI'}
+# Number of automatic reloads triggered for each (class name, attribute)
+AUTORELOAD_STATS = Counter()
+# Raise ReloadRequired instead of automatically reloading partial objects
+AUTORELOAD_STRICT = X_PLEX_AUTORELOAD_STRICT
+# Only keep the attributes of the XML data and share identical tag objects between items
+LEAN_OBJECTS = X_PLEX_LEAN_OBJECTS
+# Tag objects shared between items in lean mode
+_SHARED_OBJECTS = weakref.WeakValueDictionary()
+# Cast functions of the XML attributes returned by PlexObject.fetchColumns
+COLUMN_CASTS = {
+    **dict.fromkeys((
+        'ratingKey', 'parentRatingKey', 'grandparentRatingKey', 'librarySectionID', 'year', 'parentYear',
+        'index', 'parentIndex', 'duration', 'viewCount', 'skipCount', 'viewOffset', 'leafCount',
+        'viewedLeafCount', 'childCount', 'ratingCount', 'size', 'width', 'height', 'bitrate',
+    ), partial(utils.cast, int)),
+    **dict.fromkeys(('rating', 'audienceRating', 'userRating'), partial(utils.cast, float)),
+    **dict.fromkeys(('addedAt', 'updatedAt', 'lastViewedAt', 'lastRatedAt', 'lastSkippedAt'), utils.toDatetime),
+    'originallyAvailableAt': lambda value: utils.toDatetime(value, '%Y-%m-%d'),
+}
 OPERATORS = {
     'exact': lambda v, q: v == q,
     'iexact': lambda v, q: v.lower() == q.lower(),
@@ -51,13 +77,16 @@ class PlexObject:
     TAG = None      # xml element tag
     TYPE = None     # xml element type
     key = None      # plex relative url
+    _SHAREABLE = False  # share identical objects between parents in lean mode
+    _LEAN_DATA = False  # only keep the attributes of the xml data in lean mode
+    _LAZY_ITEMS = {}    # lazyItems attributes by name
 
     def __init__(self, server, data, initpath=None, parent=None):
         self._server = server
-        self._data = data
         self._initpath = initpath or self.key
         self._parent = weakref.ref(parent) if parent is not None else None
         self._details_key = None
+        self.__dict__['_data'] = data
 
         # Allow overwriting previous attribute values with `None` when manually reloading
         self._overwriteNone = True
@@ -68,6 +97,7 @@ class PlexObject:
 
         if data is not None:
             self._loadData(data)
+            self._leanData()
         self._details_key = self._buildDetailsKey()
 
     def __repr__(self):
@@ -76,11 +106,34 @@ class PlexObject:
         return f"<{':'.join([p for p in [self.__class__.__name__, uid, name] if p])}>"
 
     def __setattr__(self, attr, value):
+        if attr == '_data':
+            self._setData(value)
+            return
         overwriteNone = self.__dict__.get('_overwriteNone')
         # Don't overwrite an attr with None unless it's a private variable or overwrite None is True
         if value is not None or attr.startswith('_') or attr not in self.__dict__ or overwriteNone:
             self.__dict__[attr] = value
 
+    def _setData(self, data):
+        """ Sets the XML data of the object and clears the cached :class:`~plexapi.base.lazyItems`
+            attributes so they are rebuilt from the new data.
+        """
+        for name in self._LAZY_ITEMS:
+            self.__dict__.pop(name, None)
+        self.__dict__['_data'] = data
+
+    def _leanData(self):
+        """ In lean mode, builds the :class:`~plexapi.base.lazyItems` attributes and only keeps the
+            attributes of the XML data. Called after ``_loadData`` so the child objects are built
+            once all the attributes of the parent are loaded.
+        """
+        data = self.__dict__.get('_data')
+        if data is None or not len(data) or not (LEAN_OBJECTS and self._LEAN_DATA):
+            return
+        for name, descriptor in self._LAZY_ITEMS.items():
+            self.__dict__[name] = descriptor.build(self, data)
+        self.__dict__['_data'] = _leanElement(data)
+
     def _clean(self, value):
         """ Clean attr value for display in __repr__. """
         if value:
@@ -95,6 +148,8 @@ class PlexObject:
         # cls is specified, build the object and return
         initpath = initpath or self._initpath
         if cls is not None:
+            if LEAN_OBJECTS and cls._SHAREABLE:
+                return self._buildSharedItem(elem, cls, initpath)
             return cls(self._server, elem, initpath, parent=self)
         # cls is not specified, try looking it up in PLEXOBJECTS
         etype = elem.attrib.get('streamType', elem.attrib.get('tagType', elem.attrib.get('type')))
@@ -109,6 +164,16 @@ class PlexObject:
             return ecls(self._server, elem, initpath, parent=self)
         raise UnknownType(f"Unknown library type <{elem.tag} type='{etype}'../>")
 
+    def _buildSharedItem(self, elem, cls, initpath):
+        """ Returns a shared object for identical tags of items of the same type and library section. """
+        parentData = self.__dict__.get('_data')
+        sectionKey = parentData.attrib.get('librarySectionKey') if parentData is not None else None
+        key = (cls, getattr(self._server, '_baseurl', None), self.TYPE, sectionKey, tuple(elem.attrib.items()))
+        item = _SHARED_OBJECTS.get(key)
+        if item is None:
+            item = _SHARED_OBJECTS[key] = cls(self._server, elem, initpath, parent=self)
+        return item
+
     def _buildItemOrNone(self, elem, cls=None, initpath=None):
         """ Calls :func:`~plexapi.base.PlexObject._buildItem` but returns
             None if elem is an unknown type.
@@ -124,23 +189,32 @@ class PlexObject:
             or disable each parameter individually by setting it to False or 0.
         """
         details_key = self.key
+        params = self._buildDetailsParams(**kwargs) if details_key else {}
+
+        if params:
+            details_key += '?' + urlencode(sorted(params.items()))
+        return details_key
+
+    @classmethod
+    def _buildDetailsParams(cls, **kwargs):
+        """ Builds the dict of XML include parameters used by
+            :func:`~plexapi.base.PlexObject._buildDetailsKey`.
+        """
         params = {}
 
-        if details_key and hasattr(self, '_INCLUDES'):
-            for k, v in self._INCLUDES.items():
+        if hasattr(cls, '_INCLUDES'):
+            for k, v in cls._INCLUDES.items():
                 value = kwargs.pop(k, v)
                 if value not in [False, 0, '0']:
                     params[k] = 1 if value is True else value
 
-        if details_key and hasattr(self, '_EXCLUDES'):
-            for k, v in self._EXCLUDES.items():
+        if hasattr(cls, '_EXCLUDES'):
+            for k, v in cls._EXCLUDES.items():
                 value = kwargs.pop(k, None)
                 if value is not None:
                     params[k] = 1 if value is True else value
 
-        if params:
-            details_key += '?' + urlencode(sorted(params.items()))
-        return details_key
+        return params
 
     def _isChildOf(self, **kwargs):
         """ Returns True if this object is a child of the given attributes.
@@ -258,6 +332,128 @@ class PlexObject:
                     fetchItem(ekey, Media__Part__file__startswith="D:\\Movies")
 
         """
+        results = MediaContainer[cls](self._server, Element('MediaContainer'), initpath=ekey)
+        for subresults in self._fetchContainers(ekey, cls, container_start, container_size, maxresults, params, **kwargs):
+            results.extend(subresults)
+        if maxresults is not None:
+            del results[maxresults:]
+        return results
+
+    def fetchItemsIter(
+        self,
+        ekey,
+        cls=None,
+        container_start=None,
+        container_size=None,
+        maxresults=None,
+        params=None,
+        **kwargs,
+    ):
+        """ Same as :func:`~plexapi.base.PlexObject.fetchItems` but returns a generator which
+            yields the items one page at a time instead of loading all the items into memory at once.
+            The next page is only requested from the server once all the items of the previous
+            page have been consumed, so breaking out of the loop early will not fetch the
+            remaining pages. See :func:`~plexapi.base.PlexObject.fetchItems` for the parameters.
+
+            Example:
+
+                .. code-block:: python
+
+                    for track in plex.fetchItemsIter('/library/sections/1/all?type=10'):
+                        print(track.title)
+
+        """
+        count = 0
+        for subresults in self._fetchContainers(ekey, cls, container_start, container_size, maxresults, params, **kwargs):
+            for item in subresults:
+                if maxresults is not None and count >= maxresults:
+                    return
+                count += 1
+                yield item
+
+    def fetchColumns(
+        self,
+        ekey,
+        fields,
+        container_start=None,
+        container_size=None,
+        maxresults=None,
+        params=None,
+        **kwargs,
+    ):
+        """ Load the specified key and return the requested XML attributes of the items as a
+            dictionary of ``{field: [values]}`` columns. The values are read straight from the
+            XML elements page by page without building a Python object for each item, which is
+            much faster and uses less memory for reporting on large listings.
+
+            Parameters:
+                ekey (str or List<int>): API URL path in Plex to fetch items from.
+                    See :func:`~plexapi.base.PlexObject.fetchItems`.
+                fields (list<str> or dict): The XML attributes to return (e.g. ``['ratingKey', 'title', 'year']``).
+                    Attributes of child elements are returned as a list of values for each item by
+                    prepending the element tags ``Tag__`` (e.g. ``Genre__tag``, ``Media__Part__file``).
+                    Known attributes are cast with :data:`~plexapi.base.COLUMN_CASTS` and all other
+                    values are returned as strings. Pass a dictionary of ``{field: cast}`` to choose
+                    the cast function of each field (``None`` to keep the raw strings).
+                container_start (None, int): offset to get a subset of the data
+                container_size (None, int): How many items in data
+                maxresults (int, optional): Only return the specified number of results.
+                params (dict, optional): Any additional params to add to the request.
+                **kwargs (dict): Optionally add XML attribute to filter the items.
+                    See :func:`~plexapi.base.PlexObject.fetchItems` for the filters and operators.
+
+            Example:
+
+                .. code-block:: python
+
+                    columns = plex.fetchColumns('/library/sections/1/all', ['ratingKey', 'title', 'addedAt'])
+                    columns['title']  # ['Big Buck Bunny', 'Sita Sings the Blues', ...]
+
+        """
+        if ekey is None:
+            raise BadRequest('ekey was not provided')
+
+        if isinstance(ekey, list) and all(isinstance(key, int) for key in ekey):
+            ekey = f'/library/metadata/{",".join(str(key) for key in ekey)}'
+
+        if not isinstance(fields, dict):
+            fields = {field: COLUMN_CASTS.get(field.split('__')[-1]) for field in fields}
+        readers = [(field, _columnReader(field, cast)) for field, cast in fields.items()]
+        columns = {field: [] for field in fields}
+
+        container_start = container_start or 0
+        container_size = container_size or X_PLEX_CONTAINER_SIZE
+        if maxresults is not None:
+            container_size = min(container_size, maxresults)
+        attrFilter = AttrFilter(**kwargs)
+        count = 0
+
+        while maxresults is None or count < maxresults:
+            headers = {
+                'X-Plex-Container-Start': str(container_start),
+                'X-Plex-Container-Size': str(container_size),
+            }
+            data = self._server.query(ekey, headers=headers, params=params)
+            if data is None or not len(data):
+                break
+            for elem in data:
+                if maxresults is not None and count >= maxresults:
+                    break
+                if attrFilter(elem):
+                    for field, reader in readers:
+                        columns[field].append(reader(elem))
+                    count += 1
+            total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or 0
+            container_start += container_size
+            if container_start >= total_size:
+                break
+        return columns
+
+    def _fetchContainers(self, ekey, cls, container_start, container_size, maxresults, params=None, **kwargs):
+        """ Generator that fetches the specified key page by page and yields the
+            :class:`~plexapi.base.MediaContainer` of built items for each page.
+            See :func:`~plexapi.base.PlexObject.fetchItems` for the parameters.
+        """
         if ekey is None:
             raise BadRequest('ekey was not provided')
 
@@ -267,46 +463,119 @@ class PlexObject:
         container_start = container_start or 0
         container_size = container_size or X_PLEX_CONTAINER_SIZE
         offset = container_start
+        fetched = 0
+        page_size = container_size
 
         if maxresults is not None:
             container_size = min(container_size, maxresults)
 
-        results = MediaContainer[cls](self._server, Element('MediaContainer'), initpath=ekey)
-        headers = {}
-
         while True:
-            headers['X-Plex-Container-Start'] = str(container_start)
-            headers['X-Plex-Container-Size'] = str(container_size)
-
-            data = self._server.query(ekey, headers=headers, params=params)
-            subresults = self.findItems(data, cls, ekey, **kwargs)
+            data, subresults = self._fetchPage(ekey, cls, container_start, container_size, params, **kwargs)
             total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or len(subresults)
 
             if not subresults:
                 if offset > total_size:
                     log.info('container_start is greater than the number of items')
 
-            librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-            if librarySectionID:
-                for item in subresults:
-                    item.librarySectionID = librarySectionID
-
-            results.extend(subresults)
+            fetched += len(subresults)
+            yield subresults
+            del data, subresults
 
             container_start += container_size
 
             if container_start > total_size:
                 break
 
-            wanted_number_of_items = total_size - offset
-            if maxresults is not None:
-                wanted_number_of_items = min(maxresults, wanted_number_of_items)
-                container_size = min(container_size, wanted_number_of_items - len(results))
+            wanted_number_of_items, container_size = self._nextContainerSize(
+                total_size - offset, fetched, maxresults, container_size, page_size, bool(kwargs))
 
-            if wanted_number_of_items <= len(results):
+            if wanted_number_of_items <= fetched:
                 break
 
-        return results
+            if X_PLEX_CONTAINER_WORKERS > 1:
+                yield from self._fetchRemainingPages(
+                    ekey, cls, container_start, page_size, offset, total_size, wanted_number_of_items,
+                    fetched, maxresults, params, **kwargs)
+                break
+
+    @staticmethod
+    def _nextContainerSize(wanted_number_of_items, fetched, maxresults, container_size, page_size, filtered):
+        """ Returns a tuple of the number of items wanted from the listing and the size of the next page. """
+        if maxresults is None:
+            return wanted_number_of_items, container_size
+        wanted_number_of_items = min(maxresults, wanted_number_of_items)
+        # Filtered pages may hold fewer matches than requested, so keep full pages when filtering
+        if filtered:
+            return wanted_number_of_items, page_size
+        return wanted_number_of_items, min(container_size, wanted_number_of_items - fetched)
+
+    def _fetchRemainingPages(self, ekey, cls, container_start, page_size, offset, total_size,
+                             wanted_number_of_items, fetched, maxresults, params=None, **kwargs):
+        """ Fetch the remaining pages of the listing concurrently and yield the list of built items
+            for each page. No more pages are requested once ``maxresults`` items were fetched.
+        """
+        # Filtered pages may hold fewer matches than requested, so keep
+        # fetching up to the end of the listing when filters are given.
+        container_end = total_size if kwargs else offset + wanted_number_of_items
+        pages = self._fetchPagesConcurrently(ekey, cls, container_start, page_size, container_end, params, **kwargs)
+        try:
+            for subresults in pages:
+                fetched += len(subresults)
+                yield subresults
+                # Stop requesting pages once enough filtered items have matched
+                if maxresults is not None and fetched >= maxresults:
+                    break
+        finally:
+            pages.close()
+
+    def _fetchPage(self, ekey, cls, container_start, container_size, params=None, **kwargs):
+        """ Fetch a single page of items starting at container_start.
+            Returns a tuple of the raw response data and the list of built items.
+        """
+        headers = {
+            'X-Plex-Container-Start': str(container_start),
+            'X-Plex-Container-Size': str(container_size),
+        }
+        data = self._server.query(ekey, headers=headers, params=params)
+        return data, self._buildPage(data, cls, ekey, **kwargs)
+
+    def _buildPage(self, data, cls, ekey, **kwargs):
+        """ Build the items of a single page of data fetched from ekey. """
+        start = time.perf_counter()
+        subresults = self.findItems(data, cls, ekey, **kwargs)
+
+        librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
+        if librarySectionID:
+            for item in subresults:
+                item.librarySectionID = librarySectionID
+
+        if metrics.enabled():
+            metrics.emit(metrics.BuildEvent(ekey, len(subresults), time.perf_counter() - start))
+        return subresults
+
+    def _fetchPagesConcurrently(self, ekey, cls, container_start, container_size, container_end, params=None, **kwargs):
+        """ Fetch the pages between container_start and container_end using a pool of
+            X_PLEX_CONTAINER_WORKERS threads. Yields the list of built items for each
+            page in the same order as the server returns them. At most one page per
+            worker is requested ahead of the page being consumed.
+        """
+        pages = iter(
+            (start, min(container_size, container_end - start))
+            for start in range(container_start, container_end, container_size)
+        )
+        executor = ThreadPoolExecutor(max_workers=X_PLEX_CONTAINER_WORKERS)
+        try:
+            futures = deque(
+                executor.submit(self._fetchPage, ekey, cls, start, size, params, **kwargs)
+                for start, size in islice(pages, X_PLEX_CONTAINER_WORKERS)
+            )
+            while futures:
+                _, subresults = futures.popleft().result()
+                for start, size in islice(pages, 1):
+                    futures.append(executor.submit(self._fetchPage, ekey, cls, start, size, params, **kwargs))
+                yield subresults
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def fetchItem(self, ekey, cls=None, **kwargs):
         """ Load the specified key to find and build the first item with the
@@ -350,8 +619,9 @@ class PlexObject:
             data = next(utils.iterXMLBFS(data, rtag), Element('Empty'))
         # loop through all data elements to find matches
         items = MediaContainer[cls](self._server, data, initpath=initpath) if data.tag == 'MediaContainer' else []
+        attrFilter = AttrFilter(**kwargs)
         for elem in data:
-            if self._checkAttrs(elem, **kwargs):
+            if attrFilter(elem):
                 item = self._buildItemOrNone(elem, cls, initpath)
                 if item is not None:
                     items.append(item)
@@ -380,9 +650,10 @@ class PlexObject:
         # rtag to iter on a specific root tag using breadth-first search
         if rtag:
             data = next(utils.iterXMLBFS(data, rtag), [])
+        kwargs[f'{attr}__exists'] = True
+        attrFilter = AttrFilter(**kwargs)
         for elem in data:
-            kwargs[f'{attr}__exists'] = True
-            if self._checkAttrs(elem, **kwargs):
+            if attrFilter(elem):
                 results.append(elem.attrib.get(attr))
         return results
 
@@ -436,66 +707,12 @@ class PlexObject:
         data = self._server.query(key)
         self._overwriteNone = _overwriteNone
         self._loadData(data[0])
+        self._leanData()
         self._overwriteNone = True
         return self
 
     def _checkAttrs(self, elem, **kwargs):
-        attrsFound = {}
-        for attr, query in kwargs.items():
-            attr, op, operator = self._getAttrOperator(attr)
-            values = self._getAttrValue(elem, attr)
-            # special case query in (None, 0, '') to include missing attr
-            if op == 'exact' and not values and query in (None, 0, ''):
-                return True
-            # return if attr were looking for is missing
-            attrsFound[attr] = False
-            for value in values:
-                value = self._castAttrValue(op, query, value)
-                if operator(value, query):
-                    attrsFound[attr] = True
-                    break
-        # log.debug('Checking %s for %s found: %s', elem.tag, kwargs, attrsFound)
-        return all(attrsFound.values())
-
-    def _getAttrOperator(self, attr):
-        for op, operator in OPERATORS.items():
-            if attr.endswith(f'__{op}'):
-                attr = attr.rsplit('__', 1)[0]
-                return attr, op, operator
-        # default to exact match
-        return attr, 'exact', OPERATORS['exact']
-
-    def _getAttrValue(self, elem, attrstr, results=None):
-        # log.debug('Fetching %s in %s', attrstr, elem.tag)
-        parts = attrstr.split('__', 1)
-        attr = parts[0]
-        attrstr = parts[1] if len(parts) == 2 else None
-        if attrstr:
-            results = [] if results is None else results
-            for child in (c for c in elem if c.tag.lower() == attr.lower()):
-                results += self._getAttrValue(child, attrstr, results)
-            return [r for r in results if r is not None]
-        # check were looking for the tag
-        if attr.lower() == 'etag':
-            return [elem.tag]
-        # loop through attrs so we can perform case-insensitive match
-        for _attr, value in elem.attrib.items():
-            if attr.lower() == _attr.lower():
-                return [value]
-        return []
-
-    def _castAttrValue(self, op, query, value):
-        if op == 'exists':
-            return value
-        if isinstance(query, bool):
-            return bool(int(value))
-        if isinstance(query, int) and '.' in value:
-            return float(value)
-        if isinstance(query, int):
-            return int(value)
-        if isinstance(query, float):
-            return float(value)
-        return value
+        return AttrFilter(**kwargs)(elem)
 
     def _loadData(self, data):
         raise NotImplementedError('Abstract method not implemented.')
@@ -505,6 +722,167 @@ class PlexObject:
         return self.TYPE
 
 
+class lazyItems:
+    """ Descriptor for a list of child objects which are only built from the XML data of the
+        object the first time the attribute is accessed. The built list is cached on the object
+        until new XML data is loaded. Use this instead of calling
+        :func:`~plexapi.base.PlexObject.findItems` in ``_loadData`` for child tags which are
+        not needed by most callers.
+
+        Parameters:
+            cls (:class:`~plexapi.base.PlexObject`): The class of the child objects.
+            **kwargs (dict): Additional filters passed into :func:`~plexapi.base.PlexObject.findItems`.
+
+        Example:
+
+            .. code-block:: python
+
+                class Movie(Video, Playable):
+                    genres = lazyItems(media.Genre)
+
+    """
+
+    def __init__(self, cls, **kwargs):
+        self.cls = cls
+        self.kwargs = kwargs
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        owner._LAZY_ITEMS = {**owner._LAZY_ITEMS, name: self}
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = self.build(obj, obj.__dict__.get('_data'))
+        return value
+
+    def build(self, obj, data):
+        """ Returns the list of child objects built from the XML data. """
+        if data is None:
+            return []
+        return obj.findItems(data, self.cls, **self.kwargs)
+
+
+def _columnReader(field, cast=None):
+    """ Returns a function reading the value of a field from an XML element for
+        :func:`~plexapi.base.PlexObject.fetchColumns`.
+    """
+    *tags, attr = field.split('__')
+    if not tags:
+        def read(elem):
+            value = elem.attrib.get(attr)
+            return value if value is None or cast is None else cast(value)
+        return read
+
+    tags, attr = [tag.lower() for tag in tags], attr.lower()
+
+    def readAll(elem):
+        values = AttrFilter._values(elem, tags, attr)
+        return values if cast is None else [cast(value) for value in values]
+    return readAll
+
+
+def _leanElement(elem):
+    """ Returns a copy of the element with only its (interned) attributes and no children. """
+    if not len(elem):
+        return elem
+    return Element(elem.tag, {sys.intern(k): v for k, v in elem.attrib.items()})
+
+
+class AttrFilter:
+    """ Compiled XML attribute filter used by :func:`~plexapi.base.PlexObject.findItems`.
+        The ``**kwargs`` filters are parsed once into a list of attribute paths, operators,
+        compiled regular expressions and value casts, so checking each XML element does not
+        need to parse the filters again. Calling the filter with an element returns True
+        if the element matches all the filters. See :func:`~plexapi.base.PlexObject.fetchItems`
+        for the available filters and operators.
+
+        Parameters:
+            **kwargs (dict): The XML attribute filters to compile.
+    """
+    __slots__ = ('_filters', '_numIncludeMissing')
+
+    def __init__(self, **kwargs):
+        filters = [self._compile(attr, query) for attr, query in kwargs.items()]
+        # Filters which include elements missing the attribute are checked first
+        # since they match the element regardless of the other filters.
+        filters.sort(key=lambda f: not f[0])
+        self._filters = filters
+        self._numIncludeMissing = sum(1 for f in filters if f[0])
+
+    def __call__(self, elem):
+        failed = False
+        for i, (includeMissing, tags, attr, match) in enumerate(self._filters):
+            if failed and i >= self._numIncludeMissing:
+                return False
+            values = self._values(elem, tags, attr)
+            if includeMissing and not values:
+                return True
+            if not failed and not match(values):
+                failed = True
+        return not failed
+
+    def _compile(self, attrstr, query):
+        """ Returns a tuple of (includeMissing, tags, attr, match) for a single filter. """
+        op = 'exact'
+        parts = attrstr.rsplit('__', 1)
+        if len(parts) == 2 and parts[1] in OPERATORS:
+            attrstr, op = parts
+        *tags, attr = attrstr.lower().split('__')
+        # special case query in (None, 0, '') to include missing attr
+        includeMissing = op == 'exact' and query in (None, 0, '')
+
+        if op == 'exists':
+            return includeMissing, tags, attr, lambda values: bool(values) is bool(query)
+
+        if op in ('regex', 'iregex'):
+            pattern = re.compile(query, flags=re.IGNORECASE if op == 'iregex' else 0)
+            operator = lambda v: bool(pattern.search(v))
+        elif op in ('iexact', 'icontains', 'istartswith', 'iendswith'):
+            lowerQuery = query.lower()
+            operator = {
+                'iexact': lambda v: v.lower() == lowerQuery,
+                'icontains': lambda v: lowerQuery in v.lower(),
+                'istartswith': lambda v: v.lower().startswith(lowerQuery),
+                'iendswith': lambda v: v.lower().endswith(lowerQuery),
+            }[op]
+        else:
+            func = OPERATORS[op]
+            operator = lambda v: func(v, query)
+
+        if isinstance(query, bool):
+            cast = lambda v: bool(int(v))
+        elif isinstance(query, int):
+            cast = lambda v: float(v) if '.' in v else int(v)
+        elif isinstance(query, float):
+            cast = float
+        else:
+            cast = None
+
+        if cast is None:
+            return includeMissing, tags, attr, lambda values: any(operator(v) for v in values)
+        return includeMissing, tags, attr, lambda values: any(operator(cast(v)) for v in values)
+
+    @staticmethod
+    def _values(elem, tags, attr):
+        """ Returns a list of attribute values found by walking down the child elements
+            matching each tag in tags (case-insensitive).
+        """
+        elems = (elem,)
+        for tag in tags:
+            elems = [child for e in elems for child in e if child.tag.lower() == tag]
+        if attr == 'etag':
+            return [e.tag for e in elems]
+        values = []
+        for e in elems:
+            for _attr, value in e.attrib.items():
+                if _attr.lower() == attr:
+                    values.append(value)
+                    break
+        return values
+
+
 class PlexPartialObject(PlexObject):
     """ Not all objects in the Plex listings return the complete list of elements
         for the object. This object will allow you to assume each object is complete,
@@ -539,6 +917,7 @@ class PlexPartialObject(PlexObject):
         'excludeFields': 'summary,tagline',
         'skipRefresh': 1,
     }
+    _LEAN_DATA = True
 
     def __eq__(self, other):
         if isinstance(other, PlexPartialObject):
@@ -566,9 +945,14 @@ class PlexPartialObject(PlexObject):
         clsname = self.__class__.__name__
         title = self.__dict__.get('title', self.__dict__.get('name'))
         objname = f"{clsname} '{title}'" if title else clsname
+        AUTORELOAD_STATS[(clsname, attr)] += 1
+        if AUTORELOAD_STRICT:
+            raise ReloadRequired(f"Accessing '{attr}' requires reloading {objname}.")
         log.debug("Reloading %s for attr '%s'", objname, attr)
         # Reload and return the value
-        self._reload(_overwriteNone=False)
+        batch = self.__dict__.get('_reloadBatch')
+        if batch is None or not batch.reload(self):
+            self._reload(_overwriteNone=False)
         return super(PlexPartialObject, self).__getattribute__(attr)
 
     def analyze(self):
@@ -753,6 +1137,71 @@ class PlexPartialObject(PlexObject):
         return PlayQueue.create(self._server, self, *args, **kwargs)
 
 
+class AutoReloadBatch:
+    """ Coalesces the automatic reloads of many partial objects into a few requests. The first time
+        a missing attribute is accessed on any of the objects, all the objects in the batch which are
+        still partial are reloaded together using ``/library/metadata/<key1,key2,...>`` requests
+        instead of reloading each object separately. The batch can be used as a context manager
+        which detaches the objects from the batch on exit.
+
+        Parameters:
+            items (list): List of :class:`~plexapi.base.PlexPartialObject` to reload together.
+            chunksize (int, optional): Max number of objects to reload in a single request (default 100).
+            **kwargs (dict): XML include parameters to include/exclude or override when reloading.
+                See :class:`~plexapi.base.PlexPartialObject` for all the available include parameters.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.base import AutoReloadBatch
+
+                with AutoReloadBatch(plex.library.section('Movies').all()) as movies:
+                    for movie in movies:
+                        print(movie.title, movie.studio)  # Reloads 100 movies per request
+
+    """
+
+    def __init__(self, items, chunksize=100, **kwargs):
+        self.items = list(items)
+        self.chunksize = chunksize
+        self._kwargs = kwargs
+        self._pending = {id(item): item for item in self.items if isinstance(item, PlexPartialObject)}
+        for item in self._pending.values():
+            item._reloadBatch = self
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Detach the remaining objects from the batch. """
+        for item in self._pending.values():
+            item._reloadBatch = None
+        self._pending = {}
+
+    def reload(self, item=None):
+        """ Reload all pending partial objects in the batch. Returns True if the specified item
+            was reloaded.
+        """
+        pending = [i for i in self._pending.values() if i.key and i.isPartialObject()]
+        self.close()
+        servers = defaultdict(list)
+        for i in pending:
+            servers[i._server].append(i)
+        for server, items in servers.items():
+            server.fetchItemsByRatingKeys(items, chunksize=self.chunksize, **self._kwargs)
+        return item is not None and item.isFullObject()
+
+
 class Playable:
     """ This is a general place to store functions specific to media that is Playable.
         Things were getting mixed up a bit when dealing with Shows, Season, Artists,
@@ -865,24 +1314,12 @@ class Playable:
             * Episode: ``<show title> - s00e00 - <episode title>``
             * Track: ``<artist title> - <album title> - 00 - <track title>``
             * Photo: ``<photoalbum title> - <photo/clip title>`` or ``<photo/clip title>``
+
+            Use a :class:`~plexapi.download.DownloadManager` to download many items concurrently
+            and resume interrupted downloads.
         """
         filepaths = []
-        parts = [i for i in self.iterParts() if i]
-
-        for part in parts:
-            if not keep_original_name:
-                filename = utils.cleanFilename(f'{self._prettyfilename()}.{part.container}')
-            else:
-                filename = part.file
-
-            if kwargs:
-                # So this seems to be a a lot slower but allows transcode.
-                kwargs['mediaIndex'] = self.media.index(part._parent())
-                kwargs['partIndex'] = part._parent().parts.index(part)
-                download_url = self.getStreamURL(**kwargs)
-            else:
-                download_url = self._server.url(f'{part.key}?download=1')
-
+        for download_url, filename, _ in self._downloadParts(keep_original_name, **kwargs):
             filepath = utils.download(
                 download_url,
                 self._server._token,
@@ -896,6 +1333,26 @@ class Playable:
 
         return filepaths
 
+    def _downloadParts(self, keep_original_name=False, **kwargs):
+        """ Yields a tuple of the download URL, filename and expected size in bytes (None for
+            transcoded streams) for each media part. See :func:`~plexapi.base.Playable.download`.
+        """
+        for part in self.iterParts():
+            if not part:
+                continue
+            if not keep_original_name:
+                filename = utils.cleanFilename(f'{self._prettyfilename()}.{part.container}')
+            else:
+                filename = part.file
+
+            if kwargs:
+                # So this seems to be a a lot slower but allows transcode.
+                kwargs['mediaIndex'] = self.media.index(part._parent())
+                kwargs['partIndex'] = part._parent().parts.index(part)
+                yield self.getStreamURL(**kwargs), filename, None
+            else:
+                yield self._server.url(f'{part.key}?download=1'), filename, part.size
+
     def updateProgress(self, time, state='stopped'):
         """ Set the watched progress for this video.
 
@@ -989,6 +1446,7 @@ class PlexSession(object):
         for elem in data:
             if elem.attrib.get('sessionKey') == str(self.sessionKey):
                 self._loadData(elem)
+                self._leanData()
                 break
         return self
 
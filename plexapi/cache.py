@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from plexapi import X_PLEX_CONNECTION_CACHE, X_PLEX_CONNECTION_CACHE_TTL, log, utils
+
+# Default time-to-live in seconds for near-static server endpoints.
+# The keys are regular expressions matched against the request path and query string.
+DEFAULT_TTLS = {
+    r'^/library/sections/?$': 60,
+    r'^/library/sections/\d+/(all|collections)\?.*includeMeta=1': 300,
+    r'^/media/providers': 300,
+    r'^/:/prefs/?$': 60,
+}
+
+# Endpoints requested with GET which change the server state, matched against the request path.
+STATE_CHANGING_PATHS = re.compile(r'^/:/(scrobble|unscrobble|progress|timeline)/?$')
+
+# Request headers which change the response and are included in the cache key.
+CACHE_KEY_HEADERS = ('X-Plex-Token', 'X-Plex-Container-Start', 'X-Plex-Container-Size')
+
+# Library timeline states which change the cached data (created, processed and deleted).
+# See :class:`~plexapi.alert.AlertListener` for all the states.
+TIMELINE_STATE_CREATED = 0
+TIMELINE_STATE_PROCESSED = 5
+TIMELINE_STATE_DELETED = 9
+# Activities which change the items of a library section when they end.
+LIBRARY_ACTIVITIES = ('library.update.section', 'library.refresh.items')
+
+
+class CachedResponse:
+    """ A single response stored in the :class:`~plexapi.cache.ResponseCache`.
+
+        Attributes:
+            content (bytes): The raw response body.
+            etag (str): The ETag header of the response (or None).
+            expires (float): Timestamp (``time.monotonic()``) when the response becomes stale.
+            lastModified (str): The Last-Modified header of the response (or None).
+    """
+
+    def __init__(self, content, expires, etag=None, lastModified=None):
+        self.content = content
+        self.expires = expires
+        self.etag = etag
+        self.lastModified = lastModified
+
+    @property
+    def fresh(self):
+        """ Returns True if the response has not expired yet. """
+        return time.monotonic() < self.expires
+
+    def conditionalHeaders(self):
+        """ Returns the headers to revalidate this response with the server. """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.lastModified:
+            headers['If-Modified-Since'] = self.lastModified
+        return headers
+
+
+class ResponseCache:
+    """ Thread-safe LRU cache for GET responses from a :class:`~plexapi.server.PlexServer`.
+        Responses are cached by method, URL, parameters and the headers which change the response
+        (see ``CACHE_KEY_HEADERS``). Only endpoints matching one of the ``ttls`` patterns are
+        cached. Any non-GET request sent through :func:`~plexapi.server.PlexServer.query`, and the
+        GET requests changing the watched state (see ``STATE_CHANGING_PATHS``), remove the cached
+        responses they may change with :func:`~plexapi.cache.ResponseCache.invalidateRequest`.
+
+        Subclass this to store responses somewhere else by overriding
+        :func:`~plexapi.cache.ResponseCache.get`, :func:`~plexapi.cache.ResponseCache.set`,
+        :func:`~plexapi.cache.ResponseCache.invalidate` and :func:`~plexapi.cache.ResponseCache.clear`.
+
+        Parameters:
+            maxsize (int): Maximum number of responses to keep (default 256).
+            ttls (dict, optional): Dictionary of ``{regex: seconds}`` time-to-live values matched against
+                the request path and query string. Default :data:`~plexapi.cache.DEFAULT_TTLS`.
+            conditional (bool): True to revalidate stale responses with the server using the
+                ``If-None-Match`` and ``If-Modified-Since`` headers instead of dropping them (default False).
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.cache import ResponseCache
+                from plexapi.server import PlexServer
+
+                cache = ResponseCache(ttls={r'^/library/sections/?$': 30, r'^/status/sessions$': 2})
+                plex = PlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx', cache=cache)
+                plex.sessions()  # Fetched from the server
+                plex.sessions()  # Returned from the cache for the next 2 seconds
+                cache.invalidate(r'^/status/sessions')
+
+    """
+
+    def __init__(self, maxsize=256, ttls=None, conditional=False):
+        self.maxsize = maxsize
+        self.conditional = conditional
+        self._ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or DEFAULT_TTLS).items()]
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl(self, url):
+        """ Returns the time-to-live in seconds for the specified URL or None if it should not be cached. """
+        path = self._path(url)
+        for pattern, ttl in self._ttls:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    def cacheable(self, url):
+        """ Returns True if responses for the specified URL can be cached. Endpoints with a time-to-live
+            of 0 are only cached when stale responses are revalidated with conditional requests.
+        """
+        ttl = self.ttl(url)
+        return ttl is not None and (ttl > 0 or self.conditional)
+
+    def changesState(self, method, url):
+        """ Returns True if the request may change the server state. """
+        return method.lower() != 'get' or bool(STATE_CHANGING_PATHS.search(urlsplit(url).path))
+
+    def key(self, method, url, params=None, headers=None):
+        """ Returns the cache key for the specified request. """
+        headers = headers or {}
+        params = urlencode(sorted(params.items())) if isinstance(params, dict) else params
+        return (method.upper(), url, params, tuple(headers.get(h) for h in CACHE_KEY_HEADERS))
+
+    def get(self, key):
+        """ Returns the :class:`~plexapi.cache.CachedResponse` for the specified key or None if not cached.
+            Stale responses are only returned when conditional requests are enabled.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if not entry.fresh and not (self.conditional and (entry.etag or entry.lastModified)):
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+            return entry
+
+    def set(self, key, url, response):
+        """ Stores the response for the specified key if the URL is cacheable.
+
+            Parameters:
+                key (tuple): Cache key returned by :func:`~plexapi.cache.ResponseCache.key`.
+                url (str): URL of the request.
+                response (requests.Response): Response to store.
+        """
+        if not self.cacheable(url):
+            return
+        ttl = self.ttl(url)
+        entry = CachedResponse(
+            content=response.content,
+            expires=time.monotonic() + ttl,
+            etag=response.headers.get('ETag'),
+            lastModified=response.headers.get('Last-Modified'),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key, url):
+        """ Marks a stale response as fresh again after the server returned ``304 Not Modified``. """
+        ttl = self.ttl(url) or 0
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires = time.monotonic() + ttl
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+    def invalidate(self, pattern):
+        """ Removes all cached responses with a path and query string matching the regular expression.
+
+            Parameters:
+                pattern (str): Regular expression to match (e.g. ``r'^/library/sections'``).
+        """
+        regex = re.compile(pattern)
+        with self._lock:
+            for key in [k for k in self._entries if regex.search(self._path(k[1]))]:
+                del self._entries[key]
+        log.debug('Invalidated cached responses matching %s', pattern)
+
+    def invalidateRequest(self, url, params=None):
+        """ Removes the cached responses which may be changed by a request changing the server state.
+            Requests for an item (``/library/metadata/<ratingKey>`` or the ``ratingKey`` or ``key``
+            parameter of the ``/:/`` endpoints) remove the responses of the item and the library section
+            listings. Other requests remove the responses below the first two segments of their path
+            (e.g. ``/library/sections`` or ``/:/prefs``).
+
+            Parameters:
+                url (str): URL of the request.
+                params (dict, optional): Parameters of the request.
+        """
+        parts = urlsplit(url)
+        ratingKey = self._ratingKey(parts.path, {**dict(parse_qsl(parts.query)), **dict(params or {})})
+        if ratingKey:
+            self.invalidate(rf'^/library/metadata/{ratingKey}(/|\?|$)')
+            self.invalidate(r'^/library/sections/\d+/')
+            return
+        prefix = '/'.join(parts.path.rstrip('/').split('/')[:3]) or '/'
+        self.invalidate(rf'^{re.escape(prefix)}(/|\?|$)')
+        if prefix.startswith('/library'):
+            self.invalidate(r'^/media/providers')
+
+    def clear(self):
+        """ Removes all cached responses. """
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _ratingKey(path, params):
+        """ Returns the ratingKey of the item changed by a request or None. """
+        match = re.match(r'^/library/metadata/(\d+)', path)
+        if match:
+            return match.group(1)
+        if path.startswith('/:/'):
+            for name in ('ratingKey', 'key'):
+                match = re.match(r'^(?:/library/metadata/)?(\d+)$', str(params.get(name, '')))
+                if match:
+                    return match.group(1)
+        return None
+
+    @staticmethod
+    def _path(url):
+        parts = urlsplit(url)
+        return f'{parts.path}?{parts.query}' if parts.query else parts.path
+
+
+class ConnectionCache:
+    """ Thread-safe cache of the connection address chosen for each server by
+        :func:`~plexapi.myplex.MyPlexResource.connect`, keyed by the server's ``clientIdentifier``.
+        When a ``path`` is specified, the addresses are stored in a JSON file which is shared between
+        processes. Only the addresses are stored, never the access tokens.
+
+        Parameters:
+            path (str, optional): Path of the JSON file. Default only keeps the addresses in memory.
+            ttl (int): Number of seconds an address is reused before all the connections of the
+                server are probed again (default 3600).
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.cache import ConnectionCache
+
+                cache = ConnectionCache('~/.cache/plexapi/connections.json', ttl=86400)
+                plex = account.resource('Living Room').connect(cache=cache)
+
+    """
+
+    def __init__(self, path=None, ttl=3600):
+        self.path = os.path.expanduser(path) if path else None
+        self.ttl = ttl
+        self._entries = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, identifier):
+        """ Returns the remembered address for the server identifier or None if unknown or expired. """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(identifier)
+        if entry and time.time() - entry.get('verified', 0) < self.ttl:
+            return entry.get('url')
+        return None
+
+    def set(self, identifier, url):
+        """ Remembers the address for the server identifier. """
+        with self._lock:
+            self._load()
+            self._entries[identifier] = {'url': url, 'verified': time.time()}
+            self._save()
+
+    def remove(self, identifier):
+        """ Forgets the address for the server identifier. """
+        with self._lock:
+            self._load()
+            if self._entries.pop(identifier, None) is not None:
+                self._save()
+
+    def clear(self):
+        """ Forgets all addresses. """
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def _load(self):
+        """ Reloads the entries from the file if it was changed by another process. """
+        if not self.path:
+            return
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path) as handle:
+                entries = json.load(handle)
+            self._entries = entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError) as e:
+            log.warning('Unable to read the connection cache %s: %s', self.path, e)
+            self._entries = {}
+        self._mtime = mtime
+
+    def _save(self):
+        """ Writes the entries to a temporary file which atomically replaces the cache file. """
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmppath = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmppath, 'w') as handle:
+                json.dump(self._entries, handle)
+            os.replace(tmppath, self.path)
+            self._mtime = os.path.getmtime(self.path)
+        except OSError as e:
+            log.warning('Unable to write the connection cache %s: %s', self.path, e)
+
+
+_defaultConnectionCache = None
+
+
+def defaultConnectionCache():
+    """ Returns the :class:`~plexapi.cache.ConnectionCache` used by
+        :func:`~plexapi.myplex.MyPlexResource.connect` when no cache is specified. The cache file
+        and time-to-live are set with the ``plexapi.connection_cache`` and
+        ``plexapi.connection_cache_ttl`` settings.
+    """
+    global _defaultConnectionCache
+    if _defaultConnectionCache is None:
+        _defaultConnectionCache = ConnectionCache(X_PLEX_CONNECTION_CACHE, X_PLEX_CONNECTION_CACHE_TTL)
+    return _defaultConnectionCache
+
+
+class CacheInvalidator:
+    """ Alert callback keeping the cached state of a :class:`~plexapi.server.PlexServer` up to date.
+        Library ``timeline`` alerts for created, processed and deleted items and the end of library
+        scan ``activity`` alerts invalidate:
+
+        * The responses of the section and item in the server :class:`~plexapi.cache.ResponseCache`.
+        * The cached totals, filter choices and guid index of the loaded library section
+          (see :func:`~plexapi.library.LibrarySection.invalidate`).
+        * The cached sections of the server library when an unknown section is changed.
+        * The tracked items (see :func:`~plexapi.cache.CacheInvalidator.track`), which are marked as
+          stale and reloaded with :func:`~plexapi.cache.CacheInvalidator.refreshStale`.
+
+        The invalidator can be used as the callback of :func:`~plexapi.server.PlexServer.startAlertListener`
+        or subscribed to an :class:`~plexapi.alert.AsyncAlertListener`.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The server to keep up to date.
+            reload (bool): True to reload the stale tracked items as soon as an alert is received.
+                Default only marks them as stale.
+
+        Attributes:
+            stale (set): The ratingKeys of the tracked items which changed on the server.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.cache import CacheInvalidator
+
+                invalidator = CacheInvalidator(plex)
+                plex.startAlertListener(invalidator)
+                movies = invalidator.track(*plex.library.section('Movies').all())
+                ...
+                invalidator.refreshStale()  # Reloads the movies which changed since they were loaded
+
+    """
+
+    def __init__(self, server, reload=False):
+        self._server = server
+        self.reload = reload
+        self.stale = set()
+        self._items = defaultdict(weakref.WeakSet)
+        self._lock = threading.Lock()
+
+    def __call__(self, data):
+        self.handleAlert(data)
+
+    def track(self, *items):
+        """ Tracks the items to mark them as stale when they change on the server.
+            Returns the list of items.
+        """
+        with self._lock:
+            for item in items:
+                self._items[item.ratingKey].add(item)
+        return list(items)
+
+    def untrack(self, *items):
+        """ Stops tracking the items. """
+        with self._lock:
+            for item in items:
+                self._items.get(item.ratingKey, set()).discard(item)
+                self.stale.discard(item.ratingKey)
+
+    def handleAlert(self, data):
+        """ Invalidates the cached state from an alert. Accepts the data dictionary sent to the
+            :class:`~plexapi.alert.AlertListener` callback or an :class:`~plexapi.alert.AlertEvent`.
+        """
+        data = getattr(data, 'data', data)
+        if data.get('type') == 'timeline':
+            for entry in data.get('TimelineEntry', []):
+                if entry.get('identifier', 'com.plexapp.plugins.library') != 'com.plexapp.plugins.library':
+                    continue
+                state = entry.get('state')
+                if state in (TIMELINE_STATE_CREATED, TIMELINE_STATE_PROCESSED, TIMELINE_STATE_DELETED):
+                    self.invalidateItem(
+                        utils.cast(int, entry.get('sectionID')), utils.cast(int, entry.get('itemID')),
+                        deleted=state == TIMELINE_STATE_DELETED)
+        elif data.get('type') == 'activity':
+            for entry in data.get('ActivityNotification', []):
+                activity = entry.get('Activity', {})
+                if entry.get('event') == 'ended' and activity.get('type') in LIBRARY_ACTIVITIES:
+                    sectionID = utils.cast(int, activity.get('Context', {}).get('librarySectionID'))
+                    self.invalidateSection(sectionID)
+        if self.reload and self.stale:
+            self.refreshStale()
+
+    def invalidateItem(self, sectionID, ratingKey, deleted=False):
+        """ Invalidates the cached state of an item and its library section. """
+        cache = getattr(self._server, '_cache', None)
+        if cache is not None and ratingKey:
+            cache.invalidate(rf'^/library/metadata/{ratingKey}(/|\?|$)')
+        self.invalidateSection(sectionID, [ratingKey] if ratingKey else None, deleted)
+        with self._lock:
+            if deleted:
+                self._items.pop(ratingKey, None)
+                self.stale.discard(ratingKey)
+            elif self._items.get(ratingKey):
+                self.stale.add(ratingKey)
+
+    def invalidateSection(self, sectionID, ratingKeys=None, deleted=False):
+        """ Invalidates the cached state of a library section. """
+        cache = getattr(self._server, '_cache', None)
+        if cache is not None:
+            cache.invalidate(r'^/library/sections/?$')
+            cache.invalidate(r'^/media/providers')
+            if sectionID:
+                cache.invalidate(rf'^/library/sections/{sectionID}/')
+        if not sectionID or sectionID < 0:
+            return
+        # Only invalidate the library if it was already loaded
+        library = self._server.__dict__.get('library')
+        if library is None:
+            return
+        section = library._sectionsByID.get(sectionID)
+        if section is None:
+            library._sectionsByID = {}
+            library._sectionsByTitle = {}
+        else:
+            section.invalidate(ratingKeys, deleted)
+
+    def refreshStale(self):
+        """ Reloads all stale tracked items in place with as few requests as possible and returns
+            the list of reloaded items.
+        """
+        with self._lock:
+            stale, self.stale = self.stale, set()
+            items = [item for ratingKey in sorted(stale) for item in self._items.get(ratingKey, ())]
+        if items:
+            self._server.fetchItemsByRatingKeys(items)
+        return items
@@ -3,9 +3,7 @@ import time
 import weakref
 from xml.etree import ElementTree
 
-import requests
-
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter, utils
+from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter, metrics, utils
 from plexapi.base import PlexObject
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized, Unsupported
 from plexapi.playqueue import PlayQueue
@@ -71,7 +69,7 @@ class PlexClient(PlexObject):
         self._token = logfilter.add_secret(token)
         self._showSecrets = CONFIG.get('log.show_secrets', '').lower() == 'true'
         server_session = server._session if server else None
-        self._session = session or server_session or requests.Session()
+        self._session = session or server_session or utils.defaultSession()
         self._timeout = timeout or TIMEOUT
         self._proxyThroughServer = False
         self._commandId = 0
@@ -186,19 +184,20 @@ class PlexClient(PlexObject):
         timeout = timeout or self._timeout
         log.debug('%s %s', method.__name__.upper(), url)
         headers = self._headers(**headers or {})
-        response = method(url, headers=headers, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201, 204):
-            codename = codes.get(response.status_code)[0]
-            errtext = response.text.replace('\n', ' ')
-            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-            if response.status_code == 401:
-                raise Unauthorized(message)
-            elif response.status_code == 404:
-                raise NotFound(message)
-            else:
-                raise BadRequest(message)
-        data = utils.cleanXMLString(response.text).encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+        with metrics.track('client', method.__name__, url) as request:
+            response = method(url, headers=headers, timeout=timeout, **kwargs)
+            request.response(response)
+            if response.status_code not in (200, 201, 204):
+                codename = codes.get(response.status_code)[0]
+                errtext = response.text.replace('\n', ' ')
+                message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+                if response.status_code == 401:
+                    raise Unauthorized(message)
+                elif response.status_code == 404:
+                    raise NotFound(message)
+                else:
+                    raise BadRequest(message)
+            return utils.parseXML(response.content)
 
     def sendCommand(self, command, proxy=None, **params):
         """ Convenience wrapper around :func:`~plexapi.client.PlexClient.query` to more easily
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.status_codes import _codes as codes
+
+from plexapi import log, utils
+from plexapi.base import Playable
+from plexapi.exceptions import BadRequest, NotFound, Unauthorized
+
+# Size of the buffer used to read and write each chunk of a download (1 MiB)
+DEFAULT_CHUNKSIZE = 1024 * 1024
+# Minimum size of a segment when downloading a single file with multiple connections (64 MiB)
+MIN_SEGMENT_SIZE = 64 * 1024 * 1024
+
+
+class DownloadJob:
+    """ A single file queued in a :class:`~plexapi.download.DownloadManager`.
+
+        Attributes:
+            url (str): URL of the file.
+            filepath (str): Local path the file is saved to.
+            size (int): Expected size of the file in bytes (None if unknown).
+            downloaded (int): Number of bytes downloaded so far.
+            error (Exception): The exception raised while downloading the file (or None).
+    """
+
+    def __init__(self, url, filepath, size=None):
+        self.url = url
+        self.filepath = filepath
+        self.size = size
+        self.downloaded = 0
+        self.error = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{os.path.basename(self.filepath)}>'
+
+    @property
+    def partpath(self):
+        """ Path of the partially downloaded file. """
+        return f'{self.filepath}.part'
+
+    @property
+    def statepath(self):
+        """ Path of the file storing the completed segments of a segmented download. """
+        return f'{self.filepath}.part.json'
+
+
+class DownloadManager:
+    """ Downloads media files with multiple concurrent transfers. Files are written to a
+        ``<filename>.part`` file first and renamed once complete, so an interrupted download
+        is resumed with an HTTP Range request the next time it is run. Large files can be split
+        into multiple segments which are downloaded in parallel, and the size of every file is
+        verified against the size reported by the Plex server.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): Server to download the files from.
+            workers (int): Number of files downloaded concurrently (default 4).
+            segments (int): Number of concurrent connections used for a single file (default 1).
+                Only files larger than ``segments * MIN_SEGMENT_SIZE`` are split.
+            chunksize (int): Size of the buffer used for each read and write (default 1 MiB).
+            session (requests.Session, optional): Use your own session object. By default a new pooled
+                session is created with enough connections for all transfers. It copies the TLS
+                verification, client certificate, proxies, headers, cookies and auth of the server session.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.download import DownloadManager
+
+                show = plex.library.section('TV Shows').get('The Office')
+                manager = DownloadManager(plex, workers=8, segments=4)
+                manager.addItem(show, savepath='/mnt/cache/tv', subfolders=True)
+                filepaths = manager.run()
+
+    """
+
+    def __init__(self, server, workers=4, segments=1, chunksize=DEFAULT_CHUNKSIZE, session=None):
+        self._server = server
+        self.workers = max(1, workers)
+        self.segments = max(1, segments)
+        self.chunksize = chunksize
+        self._session = session or _pooledSession(server._session, self.workers * self.segments)
+        self._lock = threading.Lock()
+        self.jobs = []
+
+    def add(self, url, filename, savepath=None, size=None):
+        """ Queues a single file and returns the :class:`~plexapi.download.DownloadJob`.
+
+            Parameters:
+                url (str): Full URL of the file.
+                filename (str): Filename to save the file as.
+                savepath (str): Defaults to current working dir.
+                size (int, optional): Expected size of the file in bytes.
+        """
+        savepath = savepath or os.getcwd()
+        job = DownloadJob(url, os.path.join(savepath, os.path.basename(filename)), size)
+        self.jobs.append(job)
+        return job
+
+    def addItem(self, item, savepath=None, keep_original_name=False, subfolders=False, **kwargs):
+        """ Queues all media parts of a media item and returns the list of queued
+            :class:`~plexapi.download.DownloadJob`. Shows, seasons, artists, albums and photo
+            albums queue all of their episodes, tracks, photos and clips.
+
+            Parameters:
+                item (:class:`~plexapi.base.PlexPartialObject`): The item to download.
+                savepath (str): Defaults to current working dir.
+                keep_original_name (bool): True to keep the original filename otherwise
+                    a friendlier filename is generated. See :func:`~plexapi.base.Playable.download`.
+                subfolders (bool): True to separate episodes, tracks and photos in to season,
+                    album and photo album folders.
+                **kwargs (dict): Additional options passed into :func:`~plexapi.base.Playable.getStreamURL`
+                    to download a transcoded stream.
+        """
+        jobs = []
+        if isinstance(item, Playable):
+            for url, filename, size in item._downloadParts(keep_original_name, **kwargs):
+                jobs.append(self.add(url, filename, savepath, size))
+        elif item.TYPE == 'show':
+            for episode in item.episodes():
+                _savepath = os.path.join(savepath or '', f'Season {str(episode.seasonNumber).zfill(2)}') \
+                    if subfolders else savepath
+                jobs += self.addItem(episode, _savepath, keep_original_name, **kwargs)
+        elif item.TYPE == 'artist':
+            for track in item.tracks():
+                _savepath = os.path.join(savepath or '', track.parentTitle) if subfolders else savepath
+                jobs += self.addItem(track, _savepath, keep_original_name, **kwargs)
+        elif item.TYPE in ('season', 'album'):
+            for leaf in item.episodes() if item.TYPE == 'season' else item.tracks():
+                jobs += self.addItem(leaf, savepath, keep_original_name, **kwargs)
+        elif item.TYPE == 'photo':
+            for album in item.albums():
+                _savepath = os.path.join(savepath or '', album.title) if subfolders else savepath
+                jobs += self.addItem(album, _savepath, keep_original_name, subfolders)
+            for photo in item.photos() + item.clips():
+                jobs += self.addItem(photo, savepath, keep_original_name)
+        else:
+            raise BadRequest(f'Unable to download {item.TYPE} items.')
+        return jobs
+
+    def run(self, showstatus=False):
+        """ Downloads all queued files and returns the list of local file paths which were
+            downloaded successfully. Failed downloads keep their ``.part`` file and are resumed
+            by the next run. The exception for each failed file is available as
+            :attr:`~plexapi.download.DownloadJob.error`.
+
+            Parameters:
+                showstatus (bool): Display a progressbar for the total download size.
+        """
+        jobs, self.jobs = self.jobs, []
+        bar = None
+        if showstatus and utils.tqdm:  # pragma: no cover
+            total = sum(job.size or 0 for job in jobs) or None
+            bar = utils.tqdm(unit='B', unit_scale=True, total=total, desc='Downloading')
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda job: self._runJob(job, bar), jobs))
+
+        if bar is not None:  # pragma: no cover
+            bar.close()
+        return [job.filepath for job, ok in zip(jobs, results) if ok]
+
+    def _runJob(self, job, bar=None):
+        try:
+            self.download(job, bar)
+            return True
+        except Exception as e:
+            job.error = e
+            log.error('Failed to download %s: %s', job.filepath, e)
+            return False
+
+    def download(self, job, bar=None):
+        """ Downloads a single :class:`~plexapi.download.DownloadJob` and returns the local file path.
+            Raises :exc:`~plexapi.exceptions.BadRequest` if the size of the downloaded file does not match.
+        """
+        os.makedirs(os.path.dirname(job.filepath) or '.', exist_ok=True)
+        if job.size and os.path.exists(job.filepath) and os.path.getsize(job.filepath) == job.size:
+            log.debug('Already downloaded %s', job.filepath)
+            job.downloaded = job.size
+            return job.filepath
+
+        log.info('Downloading: %s', job.filepath)
+        if job.size and self.segments > 1 and job.size >= self.segments * MIN_SEGMENT_SIZE:
+            self._downloadSegmented(job, bar)
+        else:
+            self._downloadSingle(job, bar)
+
+        size = os.path.getsize(job.partpath)
+        if job.size is not None and size != job.size:
+            raise BadRequest(f'Downloaded size {size} of {job.filepath} does not match the expected size {job.size}.')
+        os.replace(job.partpath, job.filepath)
+        if os.path.exists(job.statepath):
+            os.remove(job.statepath)
+        return job.filepath
+
+    def _request(self, url, start=0, end=None):
+        """ Sends a GET request for the byte range ``start-end`` of the url. """
+        headers = {'X-Plex-Token': self._server._token}
+        if start or end is not None:
+            headers['Range'] = f'bytes={start}-{"" if end is None else end}'
+        response = self._session.get(url, headers=headers, stream=True, timeout=self._server._timeout)
+        if response.status_code not in (200, 206):
+            codename = codes.get(response.status_code)[0]
+            errtext = response.text.replace('\n', ' ')
+            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+            if response.status_code == 401:
+                raise Unauthorized(message)
+            elif response.status_code == 404:
+                raise NotFound(message)
+            else:
+                raise BadRequest(message)
+        return response
+
+    def _copy(self, response, handle, job, bar=None):
+        """ Writes the response body to the open file handle. """
+        for chunk in response.iter_content(chunk_size=self.chunksize):
+            handle.write(chunk)
+            with self._lock:
+                job.downloaded += len(chunk)
+                if bar is not None:  # pragma: no cover
+                    bar.update(len(chunk))
+
+    def _downloadSingle(self, job, bar=None):
+        """ Downloads the file with a single connection, resuming a previous partial download. """
+        offset = os.path.getsize(job.partpath) if os.path.exists(job.partpath) else 0
+        if job.size is not None and offset > job.size:
+            offset = 0
+        if job.size is not None and offset == job.size:
+            job.downloaded = offset
+            return
+        response = self._request(job.url, start=offset)
+        if offset and response.status_code != 206:
+            log.debug('Server ignored the range request for %s, restarting the download', job.filepath)
+            offset = 0
+        job.downloaded = offset
+        with response, open(job.partpath, 'ab' if offset else 'wb', buffering=self.chunksize) as handle:
+            self._copy(response, handle, job, bar)
+
+    def _downloadSegmented(self, job, bar=None):
+        """ Downloads the file with multiple connections, each writing its own byte range in
+            the preallocated ``.part`` file. Completed segments are recorded in a state file
+            and skipped when the download is resumed.
+        """
+        segmentSize = -(-job.size // self.segments)
+        segments = [(start, min(start + segmentSize, job.size) - 1) for start in range(0, job.size, segmentSize)]
+
+        completed = set()
+        if os.path.exists(job.partpath) and os.path.exists(job.statepath):
+            with open(job.statepath) as handle:
+                completed = {tuple(segment) for segment in json.load(handle)}
+        else:
+            with open(job.partpath, 'wb') as handle:
+                handle.truncate(job.size)
+        job.downloaded = sum(end - start + 1 for start, end in completed)
+
+        def _segment(start, end):
+            response = self._request(job.url, start=start, end=end)
+            if response.status_code != 206:
+                raise BadRequest(f'Server does not support range requests for {job.url}.')
+            with response, open(job.partpath, 'r+b', buffering=self.chunksize) as handle:
+                handle.seek(start)
+                self._copy(response, handle, job, bar)
+            with self._lock:
+                completed.add((start, end))
+                with open(job.statepath, 'w') as handle:
+                    json.dump(sorted(completed), handle)
+
+        pending = [segment for segment in segments if segment not in completed]
+        with ThreadPoolExecutor(max_workers=self.segments) as executor:
+            for future in [executor.submit(_segment, start, end) for start, end in pending]:
+                future.result()
+
+
+def _pooledSession(session, poolSize):
+    """ Returns a new pooled session with the connection settings of the server session. """
+    pooled = utils.createSession(poolSize=poolSize)
+    if session is not None:
+        pooled.verify = session.verify
+        pooled.cert = session.cert
+        pooled.proxies = dict(session.proxies)
+        pooled.headers.update(session.headers)
+        pooled.cookies.update(session.cookies)
+        pooled.auth = session.auth
+        pooled.trust_env = session.trust_env
+    return pooled
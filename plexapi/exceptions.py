@@ -26,6 +26,11 @@ class Unsupported(PlexApiException):
     pass
 
 
+class ReloadRequired(PlexApiException):
+    """ Accessing a missing attribute requires reloading a partial object (strict autoreload mode). """
+    pass
+
+
 class Unauthorized(BadRequest):
     """ Invalid username/password or token. """
     pass
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from plexapi import log
+from plexapi.exceptions import BadRequest
+
+
+class FleetResults(list):
+    """ List of the merged results returned by a :class:`~plexapi.fleet.PlexFleet` call. Every item
+        keeps a reference to the :class:`~plexapi.server.PlexServer` it was returned from in
+        ``item._server``, see :func:`~plexapi.fleet.FleetResults.bySource`.
+
+        Attributes:
+            errors (dict): Dictionary of ``{server: exception}`` for the servers which failed or did
+                not respond before the timeout. Servers which timed out have a ``TimeoutError``.
+    """
+
+    def __init__(self, items=(), errors=None):
+        super().__init__(items)
+        self.errors = errors or {}
+
+    def bySource(self):
+        """ Returns a dictionary of ``{server: [items]}`` grouping the results by the server they
+            were returned from.
+        """
+        groups = {}
+        for item in self:
+            groups.setdefault(item._server, []).append(item)
+        return groups
+
+
+class PlexFleet:
+    """ Federation of connected :class:`~plexapi.server.PlexServer` objects. Calls are sent to all
+        servers concurrently and the results are merged into a single
+        :class:`~plexapi.fleet.FleetResults` list, so a lookup across the fleet takes the time of the
+        slowest server instead of the sum of all servers. A server which fails or does not respond
+        within the timeout is skipped and reported in :attr:`~plexapi.fleet.FleetResults.errors`.
+
+        Parameters:
+            servers (list<:class:`~plexapi.server.PlexServer`>): The connected servers.
+            timeout (int, optional): Max number of seconds to wait for all servers to respond to
+                a call. Default is to wait for every server.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.fleet import PlexFleet
+                from plexapi.myplex import MyPlexAccount
+
+                fleet = PlexFleet.fromAccount(MyPlexAccount(), timeout=10)
+                movies = fleet.librarySearch(libtype='movie', title='Alien', sort='addedAt:desc')
+                for movie in movies:
+                    print(movie._server.friendlyName, movie.title)
+                for server, error in movies.errors.items():
+                    print(f'{server.friendlyName} failed: {error}')
+
+    """
+
+    def __init__(self, servers, timeout=None):
+        self.servers = list(servers)
+        self.timeout = timeout
+        self.errors = {}
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{len(self.servers)} servers>'
+
+    def __len__(self):
+        return len(self.servers)
+
+    def __iter__(self):
+        return iter(self.servers)
+
+    @classmethod
+    def fromAccount(cls, account, names=None, timeout=None, connectTimeout=None, **kwargs):
+        """ Connects to the servers of a :class:`~plexapi.myplex.MyPlexAccount` concurrently and returns
+            a new :class:`~plexapi.fleet.PlexFleet`. Servers which could not be connected to are listed
+            in :attr:`~plexapi.fleet.PlexFleet.errors` as ``{resource name: exception}``.
+
+            Parameters:
+                account (:class:`~plexapi.myplex.MyPlexAccount`): The account to load the servers from.
+                names (list<str>, optional): Only connect to the servers with these names.
+                timeout (int, optional): Max number of seconds to wait for each fleet call.
+                connectTimeout (int, optional): Timeout in seconds to attempt each connection.
+                **kwargs (dict): Additional arguments passed to :func:`~plexapi.myplex.MyPlexResource.connect`.
+        """
+        resources = [
+            resource for resource in account.resources()
+            if 'server' in resource.provides and (names is None or resource.name in names)
+        ]
+        fleet = cls([], timeout=timeout)
+        if not resources:
+            return fleet
+        with ThreadPoolExecutor(max_workers=len(resources)) as executor:
+            futures = [executor.submit(resource.connect, timeout=connectTimeout, **kwargs) for resource in resources]
+        for resource, future in zip(resources, futures):
+            try:
+                fleet.servers.append(future.result())
+            except Exception as e:
+                log.warning('Unable to connect to %s: %s', resource.name, e)
+                fleet.errors[resource.name] = e
+        return fleet
+
+    def map(self, func, timeout=None):
+        """ Calls ``func(server)`` for every server concurrently. Returns a tuple of the dictionaries
+            ``({server: result}, {server: exception})`` for the servers which succeeded and failed.
+
+            Parameters:
+                func (func): Function accepting the :class:`~plexapi.server.PlexServer` as its only argument.
+                timeout (int, optional): Max number of seconds to wait for all servers to respond.
+                    Default is the fleet timeout.
+        """
+        results, errors = {}, {}
+        if not self.servers:
+            return results, errors
+        timeout = timeout if timeout is not None else self.timeout
+        executor = ThreadPoolExecutor(max_workers=len(self.servers))
+        try:
+            futures = {executor.submit(func, server): server for server in self.servers}
+            done, pending = wait(futures, timeout=timeout)
+            for future in done:
+                server = futures[future]
+                try:
+                    results[server] = future.result()
+                except Exception as e:
+                    log.warning('Fleet call to %s failed: %s', server._baseurl, e)
+                    errors[server] = e
+            for future in pending:
+                server = futures[future]
+                log.warning('Fleet call to %s timed out after %s seconds', server._baseurl, timeout)
+                errors[server] = TimeoutError(f'{server._baseurl} did not respond within {timeout} seconds')
+        finally:
+            # Do not wait for the servers which timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results, errors
+
+    def merge(self, func, sort=None, reverse=False, maxresults=None, timeout=None, nullsLast=True):
+        """ Calls ``func(server)`` for every server concurrently and returns the results of all servers
+            merged into a single :class:`~plexapi.fleet.FleetResults` list.
+
+            Parameters:
+                func (func): Function accepting the :class:`~plexapi.server.PlexServer` as its only
+                    argument and returning a list of items.
+                sort (str or func, optional): Attribute name or key function to sort the merged results.
+                    Default keeps the results in server order.
+                reverse (bool): True to sort in descending order.
+                maxresults (int, optional): Only return the specified number of merged results.
+                timeout (int, optional): Max number of seconds to wait for all servers to respond.
+                nullsLast (bool): True to sort the items without a value last (default), False to sort them first.
+        """
+        results, errors = self.map(func, timeout)
+        items = [item for server in self.servers if server in results for item in results[server] or []]
+        if sort is not None:
+            items = _sortItems(items, sort, reverse, nullsLast)
+        if maxresults is not None:
+            items = items[:maxresults]
+        return FleetResults(items, errors)
+
+    def search(self, query, mediatype=None, limit=None, timeout=None):
+        """ Returns the merged hub search results of all servers.
+            See :func:`~plexapi.server.PlexServer.search` for the parameters.
+        """
+        return self.merge(lambda server: server.search(query, mediatype, limit), timeout=timeout)
+
+    def librarySearch(self, title=None, libtype=None, sort=None, maxresults=None, timeout=None, **kwargs):
+        """ Returns the merged results of searching all library sections of the specified libtype on all
+            servers. The first field of ``sort`` (e.g. ``addedAt:desc``) is also used to sort the merged
+            results. See :func:`~plexapi.library.LibrarySection.search` for the parameters.
+        """
+        if libtype is None:
+            raise BadRequest('libtype is required to search the library of every server.')
+
+        def _search(server):
+            items = []
+            for section in server.library.sections():
+                if section.TYPE in _SECTION_TYPES.get(libtype, (libtype,)):
+                    items.extend(section.search(
+                        title=title, libtype=libtype, sort=sort, maxresults=maxresults, **kwargs))
+            return items
+
+        mergeSort, reverse, nullsLast = None, False, True
+        if isinstance(sort, str):
+            mergeSort, *modifiers = sort.split(',')[0].split(':')
+            reverse = 'desc' in modifiers
+            # Like the server, items without a value sort first unless descending or nullsLast
+            nullsLast = reverse or 'nullsLast' in modifiers
+        return self.merge(
+            _search, sort=mergeSort, reverse=reverse, nullsLast=nullsLast, maxresults=maxresults, timeout=timeout)
+
+    def all(self, timeout=None, **kwargs):
+        """ Returns the merged list of all media from all library sections of all servers.
+            See :func:`~plexapi.library.Library.all` for the parameters.
+        """
+        return self.merge(lambda server: server.library.all(**kwargs), timeout=timeout)
+
+    def history(self, maxresults=None, mindate=None, timeout=None, **kwargs):
+        """ Returns the merged play history of all servers sorted by the most recently viewed first.
+            See :func:`~plexapi.server.PlexServer.history` for the parameters.
+        """
+        return self.merge(
+            lambda server: server.history(maxresults=maxresults, mindate=mindate, **kwargs),
+            sort='viewedAt', reverse=True, maxresults=maxresults, timeout=timeout)
+
+    def sessions(self, timeout=None):
+        """ Returns the merged list of active sessions of all servers. """
+        return self.merge(lambda server: server.sessions(), timeout=timeout)
+
+    def transcodeSessions(self, timeout=None):
+        """ Returns the merged list of active transcode sessions of all servers. """
+        return self.merge(lambda server: server.transcodeSessions(), timeout=timeout)
+
+
+# Library section types containing each libtype
+_SECTION_TYPES = {
+    'show': ('show',), 'season': ('show',), 'episode': ('show',),
+    'artist': ('artist',), 'album': ('artist',), 'track': ('artist',),
+    'photoalbum': ('photo',), 'photo': ('photo',),
+    'collection': ('movie', 'show', 'artist', 'photo'),
+}
+
+
+def _sortItems(items, sort, reverse=False, nullsLast=True):
+    """ Returns the items sorted by the attribute name or key function. Items without a value are
+        sorted last, or first when nullsLast is False.
+    """
+    if callable(sort):
+        getter = sort
+    else:
+        # Read the loaded value first to avoid reloading partial objects without a value
+        def getter(item):
+            return item.__dict__[sort] if sort in item.__dict__ else getattr(item, sort, None)
+    keyed = [(getter(item), item) for item in items]
+    present = [(value, item) for value, item in keyed if value is not None]
+    present.sort(key=lambda pair: pair[0], reverse=reverse)
+    nulls = [item for value, item in keyed if value is None]
+    present = [item for _, item in present]
+    return present + nulls if nullsLast else nulls + present
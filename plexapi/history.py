@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+import os
+import threading
+
+from plexapi import log, utils
+from plexapi.exceptions import BadRequest, Unsupported
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Default fields of the exported history rows
+FIELDS = ('historyKey', 'ratingKey', 'accountID', 'deviceID', 'viewedAt')
+
+# History attributes exported as integers, all other attributes are exported as strings
+INT_FIELDS = {
+    'ratingKey', 'accountID', 'deviceID', 'viewedAt', 'librarySectionID',
+    'parentRatingKey', 'grandparentRatingKey', 'index', 'parentIndex', 'duration',
+}
+
+# Fields added to the rows when joining the accounts and devices
+JOIN_FIELDS = ('accountName', 'deviceName', 'devicePlatform')
+
+
+class HistoryExporter:
+    """ Streams the play history of a :class:`~plexapi.server.PlexServer` as lightweight rows. The
+        history is requested in ``viewedAt`` order with a cursor on the last ``viewedAt`` value
+        instead of an increasing container offset, and every row is read straight from the XML
+        attributes without building a :class:`~plexapi.base.PlexHistory` object. The position of
+        the cursor is written to the checkpoint file after every page, so an interrupted export
+        resumes where it stopped.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The server to export the history from.
+            checkpoint (str, optional): Path of the JSON checkpoint file. Default does not resume.
+            fields (list<str>, optional): The history attributes to export. Default is
+                ``historyKey``, ``ratingKey``, ``accountID``, ``deviceID`` and ``viewedAt``.
+            join (bool, optional): True to add the ``accountName``, ``deviceName`` and
+                ``devicePlatform`` of every row. The accounts and devices are only requested once.
+            mindate (datetime, optional): Min datetime to export the history from when there is no checkpoint.
+            accountID (int, optional): Only export the history of the specified account ID.
+            librarySectionID (int, optional): Only export the history of the specified library section ID.
+            pagesize (int, optional): Number of rows to request at a time (default 1000).
+
+        Attributes:
+            cursor (int): The ``viewedAt`` timestamp of the last exported row.
+            exported (int): Total number of rows exported, including the previous runs of the checkpoint.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.history import HistoryExporter
+
+                exporter = HistoryExporter(plex, checkpoint='history.checkpoint', join=True)
+                exporter.export('history.jsonl')  # Only appends the new history when run again
+
+                for row in HistoryExporter(plex, fields=['ratingKey', 'viewedAt', 'title']).rows():
+                    print(row['viewedAt'], row['title'])
+
+    """
+    key = '/status/sessions/history/all'
+
+    def __init__(self, server, checkpoint=None, fields=None, join=False, mindate=None,
+                 accountID=None, librarySectionID=None, pagesize=1000):
+        self._server = server
+        self.checkpoint = os.path.expanduser(checkpoint) if checkpoint else None
+        self.fields = tuple(fields or FIELDS)
+        self.join = join
+        self.accountID = accountID
+        self.librarySectionID = librarySectionID
+        self.pagesize = pagesize
+        self.cursor = int(mindate.timestamp()) if mindate else None
+        self.exported = 0
+        self._seen = set()  # historyKeys already exported at the cursor
+        self._accounts = None
+        self._devices = None
+        self._lock = threading.Lock()
+        self._loadCheckpoint()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self._server._baseurl}:{self.cursor}>'
+
+    @property
+    def columns(self):
+        """ Returns the names of the exported columns. """
+        return self.fields + JOIN_FIELDS if self.join else self.fields
+
+    def pages(self):
+        """ Yields the new history rows a page at a time as lists of dictionaries. The checkpoint is
+            saved when the next page is requested, after the previous page was processed.
+        """
+        if self.join:
+            self._loadJoins()
+        start = 0
+        while True:
+            data = self._server.query(self._pageKey(), headers={
+                'X-Plex-Container-Start': str(start),
+                'X-Plex-Container-Size': str(self.pagesize),
+            })
+            elems = list(data)
+            previous = self.cursor
+            rows = [row for row in (self._row(elem) for elem in elems) if row is not None]
+            if rows:
+                yield rows
+                self.exported += len(rows)
+                self.saveCheckpoint()
+            if len(elems) < self.pagesize:
+                break
+            # Page within the same second when the full page did not move the cursor
+            start = start + len(elems) if self.cursor == previous else 0
+        log.debug('Exported %s history rows from %s up to %s', self.exported, self._server._baseurl, self.cursor)
+
+    def rows(self):
+        """ Yields the new history rows as dictionaries. """
+        for page in self.pages():
+            yield from page
+
+    def export(self, path, format=None):
+        """ Writes the new history rows to a file and returns the number of rows written. Rows are
+            appended to an existing JSONL or CSV file when resuming from a checkpoint.
+
+            Note: ``pyarrow`` must be installed in order to export to Parquet.
+
+            .. code-block:: python
+
+                >> pip install pyarrow
+
+            Parameters:
+                path (str): Path of the file to write.
+                format (str, optional): ``jsonl``, ``csv`` or ``parquet``. Default uses the file extension.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Unknown file format or appending to a Parquet file.
+                :exc:`~plexapi.exceptions.Unsupported`: Exporting to Parquet without ``pyarrow`` installed.
+        """
+        path = os.path.expanduser(path)
+        format = (format or os.path.splitext(path)[1].lstrip('.')).lower()
+        if format not in _WRITERS:
+            raise BadRequest(f'Unknown history export format: {format}. Available formats: {", ".join(_WRITERS)}')
+        append = bool(self.checkpoint) and os.path.exists(self.checkpoint) and os.path.exists(path)
+        writer = _WRITERS[format](path, self.columns, append)
+        count = 0
+        try:
+            for page in self.pages():
+                writer.write(page)
+                count += len(page)
+        finally:
+            writer.close()
+        return count
+
+    def saveCheckpoint(self):
+        """ Writes the cursor to a temporary file which atomically replaces the checkpoint file. """
+        if not self.checkpoint:
+            return
+        with self._lock:
+            state = {'viewedAt': self.cursor, 'historyKeys': sorted(self._seen), 'exported': self.exported}
+            os.makedirs(os.path.dirname(self.checkpoint) or '.', exist_ok=True)
+            tmppath = f'{self.checkpoint}.{os.getpid()}.tmp'
+            with open(tmppath, 'w') as handle:
+                json.dump(state, handle)
+            os.replace(tmppath, self.checkpoint)
+
+    def _loadCheckpoint(self):
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint) as handle:
+            state = json.load(handle)
+        self.cursor = state.get('viewedAt')
+        self._seen = set(state.get('historyKeys', []))
+        self.exported = state.get('exported', 0)
+        log.debug('Resuming the history export of %s from %s', self._server._baseurl, self.cursor)
+
+    def _loadJoins(self):
+        if self._accounts is None:
+            self._accounts = {account.id: account for account in self._server.systemAccounts()}
+        if self._devices is None:
+            self._devices = {device.id: device for device in self._server.systemDevices()}
+
+    def _pageKey(self):
+        args = {'sort': 'viewedAt:asc'}
+        if self.cursor is not None:
+            args['viewedAt>'] = self.cursor  # Inclusive, rows at the cursor are skipped by historyKey
+        if self.accountID:
+            args['accountID'] = self.accountID
+        if self.librarySectionID:
+            args['librarySectionID'] = self.librarySectionID
+        return f'{self.key}{utils.joinArgs(args)}'
+
+    def _row(self, elem):
+        """ Returns the row of a history element and moves the cursor, or None if it was already exported. """
+        attrib = elem.attrib
+        historyKey = attrib.get('historyKey')
+        viewedAt = utils.cast(int, attrib.get('viewedAt'))
+        if self.cursor is not None and viewedAt is not None and (
+                viewedAt < self.cursor or viewedAt == self.cursor and historyKey in self._seen):
+            return None
+        if viewedAt != self.cursor:
+            self.cursor, self._seen = viewedAt, set()
+        self._seen.add(historyKey)
+        row = {
+            field: utils.cast(int, attrib.get(field)) if field in INT_FIELDS else attrib.get(field)
+            for field in self.fields
+        }
+        if self.join:
+            account = self._accounts.get(utils.cast(int, attrib.get('accountID')))
+            device = self._devices.get(utils.cast(int, attrib.get('deviceID')))
+            row['accountName'] = account.name if account else None
+            row['deviceName'] = device.name if device else None
+            row['devicePlatform'] = device.platform if device else None
+        return row
+
+
+class _JSONLWriter:
+    def __init__(self, path, columns, append):
+        self._handle = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, rows):
+        self._handle.writelines(json.dumps(row) + '\n' for row in rows)
+        self._handle.flush()
+
+    def close(self):
+        self._handle.close()
+
+
+class _CSVWriter:
+    def __init__(self, path, columns, append):
+        self._handle = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._handle, fieldnames=columns)
+        if not append:
+            self._writer.writeheader()
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+        self._handle.flush()
+
+    def close(self):
+        self._handle.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path, columns, append):
+        if pyarrow is None:
+            raise Unsupported('pyarrow must be installed to export the history to Parquet.')
+        if append:
+            raise BadRequest(f'Parquet files cannot be appended, export the history to a new file instead of {path}.')
+        self._schema = pyarrow.schema([
+            (column, pyarrow.int64() if column in INT_FIELDS else pyarrow.string()) for column in columns
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write(self, rows):
+        self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+_WRITERS = {'jsonl': _JSONLWriter, 'json': _JSONLWriter, 'csv': _CSVWriter, 'parquet': _ParquetWriter}
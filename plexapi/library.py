@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+import time
 from typing import Any, TYPE_CHECKING
 import warnings
 from collections import defaultdict
@@ -9,9 +10,9 @@ from datetime import datetime
 from functools import cached_property
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse
 
-from plexapi import log, media, utils
+from plexapi import X_PLEX_FILTER_CHOICES_TTL, log, media, utils
 from plexapi.base import OPERATORS, PlexObject
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.exceptions import BadRequest, NotFound, Unsupported
 from plexapi.mixins import (
     MovieEditMixins, ShowEditMixins, SeasonEditMixins, EpisodeEditMixins,
     ArtistEditMixins, AlbumEditMixins, TrackEditMixins, PhotoalbumEditMixins, PhotoEditMixins
@@ -19,6 +20,10 @@ from plexapi.mixins import (
 from plexapi.settings import Setting
 from plexapi.utils import deprecated
 
+try:
+    import pandas
+except ImportError:
+    pandas = None
 
 if TYPE_CHECKING:
     from plexapi.audio import Track
@@ -455,6 +460,9 @@ class LibrarySection(PlexObject):
         self._totalViewSize = None
         self._totalDuration = None
         self._totalStorage = None
+        self._guidIndex = None
+        self._guidIndexPending = set()
+        self._choicesIndex = {}
 
     @cached_property
     def totalSize(self):
@@ -640,7 +648,10 @@ class LibrarySection(PlexObject):
 
     def getGuid(self, guid):
         """ Returns the media item with the specified external Plex, IMDB, TMDB, or TVDB ID.
-            Note: Only available for the Plex Movie and Plex TV Series agents.
+            Plex guids are searched for on the server. Other guids are looked up in the guid index
+            of the library section, which is built with a single pass over the library the first time
+            it is needed (see :func:`~plexapi.library.LibrarySection.buildGuidIndex`). Guids missing
+            from an existing index, or pointing to a deleted item, are looked up on the server.
 
             Parameters:
                 guid (str): The external guid of the item to return.
@@ -659,29 +670,97 @@ class LibrarySection(PlexObject):
                     result3 = library.getGuid('tmdb://1399')
                     result4 = library.getGuid('tvdb://121361')
 
-                    # Alternatively, create your own guid lookup dictionary for faster performance
-                    guidLookup = {}
-                    for item in library.all():
-                        guidLookup[item.guid] = item
-                        guidLookup.update({guid.id: item for guid in item.guids})
-
-                    result1 = guidLookup['plex://show/5d9c086c46115600200aa2fe']
-                    result2 = guidLookup['imdb://tt0944947']
-                    result3 = guidLookup['tmdb://1399']
-                    result4 = guidLookup['tvdb://121361']
+                    # Rebuild the guid index after items were added to the library
+                    library.clearGuidIndex()
 
         """
-
         try:
             if guid.startswith('plex://'):
-                result = self.search(guid=guid)[0]
-                return result
-            else:
-                dummy = self.search(maxresults=1)[0]
-                match = dummy.matches(agent=self.agent, title=guid.replace('://', '-'))
-                return self.search(guid=match[0].guid)[0]
+                return self.search(guid=guid)[0]
+
+            built = self._guidIndex is None
+            ratingKey = self.buildGuidIndex().get(guid)
+            if ratingKey is not None:
+                try:
+                    return self.fetchItem(ratingKey)
+                except NotFound:
+                    # The item was deleted since the index was built
+                    self._removeFromGuidIndex({ratingKey})
+            elif built:
+                raise IndexError
+
+            # The index may be stale, so look the guid up on the server
+            dummy = self.search(maxresults=1)[0]
+            match = dummy.matches(agent=self.agent, title=guid.replace('://', '-'))
+            item = self.search(guid=match[0].guid)[0]
         except IndexError:
             raise NotFound(f"Guid '{guid}' is not found in the library") from None
+        self._guidIndex.update((itemGuid, item.ratingKey) for itemGuid in self._itemGuids(item) + [guid])
+        return item
+
+    def buildGuidIndex(self, rebuild=False):
+        """ Returns a dictionary of ``{guid: ratingKey}`` for the ``guid`` and all external
+            ``Guid`` ids of every item in the library section. The index is built once with a
+            single pass over the library and reused until
+            :func:`~plexapi.library.LibrarySection.clearGuidIndex` is called.
+
+            Parameters:
+                rebuild (bool): True to rebuild the index from the server.
+        """
+        if self._guidIndex is None or rebuild:
+            index = {}
+            for item in self.iterSearch(libtype=self.TYPE, includeGuids=True):
+                index.update((guid, item.ratingKey) for guid in self._itemGuids(item))
+            self._guidIndex = index
+            self._guidIndexPending = set()
+        elif self._guidIndexPending:
+            pending, self._guidIndexPending = self._guidIndexPending, set()
+            self._removeFromGuidIndex(pending)
+            for item in self._server.fetchItemsByRatingKeys(sorted(pending), includeGuids=True):
+                if item is not None and item.TYPE == self.TYPE:
+                    self._guidIndex.update((guid, item.ratingKey) for guid in self._itemGuids(item))
+        return self._guidIndex
+
+    @staticmethod
+    def _itemGuids(item):
+        """ Returns the guid and external guids of an item without triggering a reload. """
+        itemGuids = PlexObject.__getattribute__(item, 'guids') if hasattr(type(item), 'guids') else []
+        guids = [item.__dict__.get('guid')] + [guid.id for guid in itemGuids]
+        return [guid for guid in guids if guid]
+
+    def _removeFromGuidIndex(self, ratingKeys):
+        for guid in [guid for guid, ratingKey in self._guidIndex.items() if ratingKey in ratingKeys]:
+            del self._guidIndex[guid]
+
+    def clearGuidIndex(self):
+        """ Clears the guid index built by :func:`~plexapi.library.LibrarySection.buildGuidIndex`
+            so it is rebuilt with the current items the next time it is used.
+        """
+        self._guidIndex = None
+        self._guidIndexPending = set()
+
+    def invalidate(self, ratingKeys=None, deleted=False):
+        """ Marks the cached data of the library section as stale after items were added, updated or
+            deleted. The cached totals and filter choices are cleared. The guid index is patched: deleted
+            items are removed right away and the guids of the other items are fetched the next time the
+            index is used. See :class:`~plexapi.cache.CacheInvalidator` to call this from alerts.
+
+            Parameters:
+                ratingKeys (list<int>, optional): The ratingKeys of the changed items.
+                deleted (bool): True if the items were deleted.
+        """
+        self.__dict__.pop('totalSize', None)
+        self._totalViewSize = None
+        self._totalDuration = None
+        self._totalStorage = None
+        self.clearFilterChoices()
+        if self._guidIndex is not None and ratingKeys:
+            ratingKeys = {utils.cast(int, key) for key in ratingKeys}
+            if deleted:
+                self._removeFromGuidIndex(ratingKeys)
+                self._guidIndexPending -= ratingKeys
+            else:
+                self._guidIndexPending |= ratingKeys
 
     def all(self, libtype=None, **kwargs):
         """ Returns a list of all items from this library section.
@@ -1166,9 +1245,58 @@ class LibrarySection(PlexObject):
             value = str(value.id or value.tag)
         else:
             value = str(value)
-        filterChoices = self.listFilterChoices(filterField.key, libtype)
-        matchValue = value.lower()
-        return next((f.key for f in filterChoices if matchValue in {f.key.lower(), f.title.lower()}), value)
+        return self._filterChoicesIndex(filterField.key, libtype).get(value.lower(), value)
+
+    def _filterChoicesIndex(self, field, libtype=None):
+        """ Returns the ``{lowercase key or title: key}`` index of the filter choices for the field.
+            The choices are requested from the server once and reused for the number of seconds
+            set by the ``plexapi.filter_choices_ttl`` setting.
+        """
+        cacheKey = (libtype or self.TYPE, getattr(field, 'key', field))
+        expires, index = self._choicesIndex.get(cacheKey, (0, None))
+        if index is None or time.monotonic() >= expires:
+            index = {}
+            for choice in self.listFilterChoices(field, libtype):
+                index.setdefault(choice.key.lower(), choice.key)
+                index.setdefault(choice.title.lower(), choice.key)
+            self._choicesIndex[cacheKey] = (time.monotonic() + X_PLEX_FILTER_CHOICES_TTL, index)
+        return index
+
+    def resolveFilterChoices(self, field, values, libtype=None):
+        """ Returns the list of filter choice keys (tag ids) for the specified tag names, using
+            the cached index of the filter choices. Values which do not match any choice are
+            returned unchanged. See :func:`~plexapi.library.LibrarySection.listFilterChoices`.
+
+            Parameters:
+                field (str): :class:`~plexapi.library.FilteringFilter` object,
+                    or the name of the field (genre, actor, director, etc.).
+                values (list): List of tag names, tag ids, :class:`~plexapi.library.FilterChoice`
+                    or :class:`~plexapi.media.MediaTag` objects to resolve.
+                libtype (str, optional): The library type of the filter field.
+
+            Example:
+
+                .. code-block:: python
+
+                    actorIds = library.resolveFilterChoices('actor', ['Keanu Reeves', 'Carrie-Anne Moss'])
+
+        """
+        index = self._filterChoicesIndex(field, libtype)
+        results = []
+        for value in values:
+            if isinstance(value, FilterChoice):
+                results.append(value.key)
+                continue
+            if isinstance(value, (media.MediaTag, LibraryMediaTag)):
+                value = str(value.id or value.tag)
+            results.append(index.get(str(value).lower(), str(value)))
+        return results
+
+    def clearFilterChoices(self):
+        """ Clears the cached filter choices so they are requested again the next time a
+            tag filter is used in a search.
+        """
+        self._choicesIndex = {}
 
     def _validateSortFields(self, sort, libtype=None):
         """ Validates a list of filter sort fields is available for the library. Sort fields can be a
@@ -1547,6 +1675,86 @@ class LibrarySection(PlexObject):
         return self.fetchItems(
             key, container_start=container_start, container_size=container_size, maxresults=maxresults, **kwargs)
 
+    def iterSearch(self, title=None, sort=None, maxresults=None, libtype=None,
+                   container_start=None, container_size=None, limit=None, filters=None, **kwargs):
+        """ Same as :func:`~plexapi.library.LibrarySection.search` but returns a generator which yields
+            the results one page at a time. Only the current page of results is kept in memory and the
+            remaining pages are not requested if the loop is stopped early. See
+            :func:`~plexapi.library.LibrarySection.search` for the parameters and filtering details.
+
+            Example:
+
+                .. code-block:: python
+
+                    for track in library.iterSearch(libtype='track', sort='addedAt:desc'):
+                        if track.viewCount == 0:
+                            break
+
+        """
+        key, kwargs = self._buildSearchKey(
+            title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, returnKwargs=True, **kwargs)
+        return self.fetchItemsIter(
+            key, container_start=container_start, container_size=container_size, maxresults=maxresults, **kwargs)
+
+    def searchColumns(self, fields, title=None, sort=None, maxresults=None, libtype=None,
+                      container_start=None, container_size=None, limit=None, filters=None, **kwargs):
+        """ Same as :func:`~plexapi.library.LibrarySection.search` but returns the requested XML attributes
+            of the results as a dictionary of ``{field: [values]}`` columns instead of building the
+            Python objects. See :func:`~plexapi.base.PlexObject.fetchColumns` for the fields and
+            :func:`~plexapi.library.LibrarySection.search` for the other parameters.
+
+            Example:
+
+                .. code-block:: python
+
+                    columns = library.searchColumns(['ratingKey', 'title', 'year', 'Genre__tag'], libtype='movie')
+
+        """
+        key, kwargs = self._buildSearchKey(
+            title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, returnKwargs=True, **kwargs)
+        return self.fetchColumns(
+            key, fields, container_start=container_start, container_size=container_size, maxresults=maxresults,
+            **kwargs)
+
+    def searchFrame(self, fields, **kwargs):
+        """ Same as :func:`~plexapi.library.LibrarySection.searchColumns` but returns a ``pandas.DataFrame``
+            with a column for each field.
+
+            Note: ``pandas`` must be installed in order to use this feature.
+
+            .. code-block:: python
+
+                >> pip install pandas
+
+            Example:
+
+                .. code-block:: python
+
+                    df = library.searchFrame(['title', 'year', 'duration', 'viewCount'], libtype='movie')
+                    df.groupby('year')['duration'].sum()
+
+        """
+        if pandas is None:
+            raise Unsupported('pandas must be installed to use searchFrame.')
+        return pandas.DataFrame(self.searchColumns(fields, **kwargs), columns=list(fields))
+
+    def searchQuery(self, title=None, sort=None, libtype=None, limit=None, filters=None, **kwargs):
+        """ Validates the search filters once and returns a reusable :class:`~plexapi.library.SearchQuery`.
+            The query can be run many times with different paging without validating the filters or
+            looking up the tag values again. See :func:`~plexapi.library.LibrarySection.search` for
+            the parameters and filtering details.
+
+            Example:
+
+                .. code-block:: python
+
+                    query = library.searchQuery(libtype='episode', unwatched=True, sort='addedAt:desc')
+                    firstPage = query.search(maxresults=50)
+                    secondPage = query.search(maxresults=50, container_start=50)
+
+        """
+        return SearchQuery(self, title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, **kwargs)
+
     def _locations(self):
         """ Returns a list of :class:`~plexapi.library.Location` objects
         """
@@ -2141,6 +2349,83 @@ class PhotoSection(LibrarySection, PhotoalbumEditMixins, PhotoEditMixins):
         return super(PhotoSection, self).sync(**kwargs)
 
 
+class SearchQuery:
+    """ A compiled :func:`~plexapi.library.LibrarySection.search` query. The filters, sort fields and
+        tag values are validated against the library once when the query is created, so running the
+        query again only sends the search request itself. Queries are hashable and compare equal when
+        they resolve to the same search key and PlexAPI operators, so they can be used as dictionary
+        keys or stored in a set. Use :func:`~plexapi.library.LibrarySection.searchQuery` to create a
+        new query.
+
+        Attributes:
+            key (str): The validated search API key (``/library/sections/<sectionKey>/all?<params>``).
+            kwargs (dict): The PlexAPI operators applied to the results.
+            libtype (str): The library type of the results (or None).
+
+        Example:
+
+            .. code-block:: python
+
+                query = library.searchQuery(libtype='movie', genre='Action', sort='addedAt:desc')
+                newest = query.search(maxresults=10)
+                for movie in query.iterSearch(container_start=100):
+                    print(movie.title)
+
+    """
+
+    def __init__(self, section, title=None, sort=None, libtype=None, limit=None, filters=None, **kwargs):
+        self._section = section
+        self.libtype = libtype
+        self.key, self.kwargs = section._buildSearchKey(
+            title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, returnKwargs=True, **kwargs)
+        self._frozen = (self.key, _freeze(self.kwargs))
+        self._hash = hash(self._frozen)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.key}>'
+
+    def __eq__(self, other):
+        return isinstance(other, SearchQuery) and self._frozen == other._frozen
+
+    def __hash__(self):
+        return self._hash
+
+    def search(self, maxresults=None, container_start=None, container_size=None):
+        """ Runs the query and returns the list of results.
+            See :func:`~plexapi.library.LibrarySection.search` for the parameters.
+        """
+        return self._section.fetchItems(
+            self.key, container_start=container_start, container_size=container_size, maxresults=maxresults,
+            **self.kwargs)
+
+    def iterSearch(self, maxresults=None, container_start=None, container_size=None):
+        """ Runs the query and returns a generator yielding the results one page at a time.
+            See :func:`~plexapi.library.LibrarySection.iterSearch` for the parameters.
+        """
+        return self._section.fetchItemsIter(
+            self.key, container_start=container_start, container_size=container_size, maxresults=maxresults,
+            **self.kwargs)
+
+    def searchColumns(self, fields, maxresults=None, container_start=None, container_size=None):
+        """ Runs the query and returns the requested XML attributes of the results as columns.
+            See :func:`~plexapi.library.LibrarySection.searchColumns` for the parameters.
+        """
+        return self._section.fetchColumns(
+            self.key, fields, container_start=container_start, container_size=container_size,
+            maxresults=maxresults, **self.kwargs)
+
+
+def _freeze(value):
+    """ Returns a hashable copy of the (nested) dict, list or set value. """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
 @utils.registerPlexObject
 class LibraryTimeline(PlexObject):
     """Represents a LibrarySection timeline.
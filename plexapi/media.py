@@ -736,6 +736,7 @@ class MediaTag(PlexObject):
             tagKey (str): Plex GUID for the actor/actress for :class:`~plexapi.media.Role` only.
             thumb (str): URL to thumbnail image for :class:`~plexapi.media.Role` only.
     """
+    _SHAREABLE = True
 
     def __str__(self):
         """ Returns the tag name. """
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+import math
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlsplit
+
+from plexapi import log
+
+# Registered callbacks receiving every RequestEvent and BuildEvent
+_listeners = []
+_listenersLock = threading.Lock()
+
+
+def addListener(callback):
+    """ Registers a callback which is called with every :class:`~plexapi.metrics.RequestEvent`
+        and :class:`~plexapi.metrics.BuildEvent`. Callbacks are called from the thread sending
+        the request, so they should return quickly.
+
+        Parameters:
+            callback (func): Function accepting a single event argument.
+    """
+    with _listenersLock:
+        if callback not in _listeners:
+            _listeners.append(callback)
+    return callback
+
+
+def removeListener(callback):
+    """ Unregisters a callback previously registered with :func:`~plexapi.metrics.addListener`. """
+    with _listenersLock:
+        if callback in _listeners:
+            _listeners.remove(callback)
+
+
+def enabled():
+    """ Returns True if any listener is registered. """
+    return bool(_listeners)
+
+
+def emit(event):
+    """ Sends the event to all registered listeners. Exceptions raised by a listener are logged
+        and ignored so instrumentation can never break a request.
+    """
+    for callback in list(_listeners):
+        try:
+            callback(event)
+        except Exception as e:
+            log.exception('Metrics listener %s failed: %s', callback, e)
+
+
+def pathTemplate(url):
+    """ Returns the path of the URL with the query string removed and numeric IDs replaced
+        by ``{id}``, e.g. ``/library/metadata/123/children`` becomes ``/library/metadata/{id}/children``.
+    """
+    path = urlsplit(url).path or '/'
+    return re.sub(r'/\d+(,\d+)*(?=/|$)', '/{id}', path)
+
+
+class RequestEvent:
+    """ Emitted after every request sent by :func:`~plexapi.server.PlexServer.query`,
+        :func:`~plexapi.myplex.MyPlexAccount.query`, :func:`~plexapi.client.PlexClient.query`
+        and :func:`~plexapi.aio.AsyncPlexServer.query`.
+
+        Attributes:
+            source (str): Where the request was sent from (server, myplex, client or aio).
+            method (str): HTTP method (GET, POST, ...).
+            url (str): Full URL of the request.
+            path (str): Path template of the request (see :func:`~plexapi.metrics.pathTemplate`).
+            status (int): HTTP status code or None if the request failed before a response.
+            bytes (int): Size of the response body in bytes.
+            latency (float): Seconds until the response was received.
+            parseTime (float): Seconds spent handling and parsing the response.
+            cached (bool): True if the response was returned from the response cache.
+            error (str): Name of the exception raised while sending the request (or None).
+    """
+
+    def __init__(self, source, method, url, status=None, bytes=0, latency=0.0, parseTime=0.0,
+                 cached=False, error=None):
+        self.source = source
+        self.method = method
+        self.url = url
+        self.path = pathTemplate(url)
+        self.status = status
+        self.bytes = bytes
+        self.latency = latency
+        self.parseTime = parseTime
+        self.cached = cached
+        self.error = error
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.method}:{self.path}:{self.status}>'
+
+    @property
+    def endpoint(self):
+        """ Returns the ``METHOD path`` string used to group the requests. """
+        return f'{self.method} {self.path}'
+
+
+class BuildEvent:
+    """ Emitted after a page of response data is built into PlexAPI objects.
+
+        Attributes:
+            key (str): The key the data was fetched from.
+            path (str): Path template of the key (see :func:`~plexapi.metrics.pathTemplate`).
+            count (int): Number of objects built.
+            buildTime (float): Seconds spent building the objects.
+    """
+
+    def __init__(self, key, count, buildTime):
+        self.key = key
+        self.path = pathTemplate(key)
+        self.count = count
+        self.buildTime = buildTime
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.path}:{self.count}>'
+
+    @property
+    def endpoint(self):
+        """ Returns the ``BUILD path`` string used to group the builds. """
+        return f'BUILD {self.path}'
+
+
+class _RequestTracker:
+    """ Context manager measuring a single request and emitting a
+        :class:`~plexapi.metrics.RequestEvent` when it exits.
+    """
+
+    def __init__(self, source, method, url):
+        self.event = RequestEvent(source, method, url)
+        self._start = time.perf_counter()
+        self._received = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exctype, excvalue, traceback):
+        end = time.perf_counter()
+        if self._received is None:
+            self.event.latency = end - self._start
+        else:
+            self.event.parseTime = end - self._received
+        if exctype is not None:
+            self.event.error = exctype.__name__
+        emit(self.event)
+
+    def response(self, response=None, status=None, content=None):
+        """ Records the received response. ``status`` and ``content`` are read from the
+            response unless specified.
+        """
+        self._received = time.perf_counter()
+        self.event.latency = self._received - self._start
+        self.event.status = status if status is not None else getattr(response, 'status_code', None)
+        content = content if content is not None else getattr(response, 'content', None)
+        self.event.bytes = len(content or b'')
+
+    def cached(self, content):
+        """ Records a response returned from the response cache. """
+        self.response(status=200, content=content)
+        self.event.cached = True
+
+
+class _NullTracker:
+    """ Tracker used when no listeners are registered. """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def response(self, response=None, status=None, content=None):
+        pass
+
+    def cached(self, content):
+        pass
+
+
+_NULL_TRACKER = _NullTracker()
+
+
+def track(source, method, url):
+    """ Returns a context manager measuring a single request. A no-op tracker is
+        returned when no listeners are registered.
+
+        Parameters:
+            source (str): Where the request was sent from (server, myplex, client or aio).
+            method (str): HTTP method name.
+            url (str): Full URL of the request.
+    """
+    if not _listeners:
+        return _NULL_TRACKER
+    return _RequestTracker(source, method.upper(), url)
+
+
+def _percentile(values, percent):
+    """ Returns the nearest-rank percentile of the sorted list of values. """
+    if not values:
+        return None
+    rank = math.ceil(percent / 100 * len(values))
+    return values[max(0, min(len(values), rank) - 1)]
+
+
+class MetricsAggregator:
+    """ Listener collecting call counts and latency percentiles per endpoint. Requests are
+        grouped by method and path template, object builds are grouped as ``BUILD <path>``.
+
+        Parameters:
+            samples (int): Max number of recent timings kept per endpoint (default 1000).
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi import metrics
+                from plexapi.server import PlexServer
+
+                aggregator = metrics.MetricsAggregator()
+                metrics.addListener(aggregator)
+                plex = PlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx')
+                plex.library.section('Movies').all()
+                print(aggregator.report())
+                metrics.removeListener(aggregator)
+
+    """
+
+    def __init__(self, samples=1000):
+        self.samples = samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event):
+        if isinstance(event, BuildEvent):
+            timing, size = event.buildTime, event.count
+        else:
+            timing, size = event.latency, event.bytes
+        with self._lock:
+            stats = self._stats[event.endpoint]
+            stats['count'] += 1
+            stats['size'] += size or 0
+            stats['timings'].append(timing)
+            if isinstance(event, RequestEvent):
+                stats['parse'].append(event.parseTime)
+                if event.cached:
+                    stats['cached'] += 1
+                if event.error or (event.status is not None and event.status >= 400):
+                    stats['errors'] += 1
+
+    def reset(self):
+        """ Removes all collected statistics. """
+        with self._lock:
+            self._stats = defaultdict(lambda: {
+                'count': 0, 'cached': 0, 'errors': 0, 'size': 0,
+                'timings': deque(maxlen=self.samples), 'parse': deque(maxlen=self.samples),
+            })
+
+    def stats(self):
+        """ Returns a dictionary of ``{endpoint: stats}``. The stats contain the call ``count``,
+            the number of ``cached`` and ``errors`` responses, the total ``size`` (bytes received
+            or objects built) and the ``p50``, ``p95`` and ``p99`` timings in seconds.
+        """
+        results = {}
+        with self._lock:
+            for endpoint, stats in self._stats.items():
+                timings = sorted(stats['timings'])
+                parse = sorted(stats['parse'])
+                results[endpoint] = {
+                    'count': stats['count'],
+                    'cached': stats['cached'],
+                    'errors': stats['errors'],
+                    'size': stats['size'],
+                    'p50': _percentile(timings, 50),
+                    'p95': _percentile(timings, 95),
+                    'p99': _percentile(timings, 99),
+                    'parse_p50': _percentile(parse, 50),
+                }
+        return results
+
+    def report(self):
+        """ Returns the statistics as a text table sorted by the total number of calls. """
+        stats = sorted(self.stats().items(), key=lambda item: item[1]['count'], reverse=True)
+        lines = [f'{"endpoint":<60} {"count":>7} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}']
+        for endpoint, data in stats:
+            timings = ' '.join(f'{data[p] * 1000:>9.1f}' for p in ('p50', 'p95', 'p99'))
+            lines.append(f'{endpoint:<60} {data["count"]:>7} {timings}')
+        return '\n'.join(lines)
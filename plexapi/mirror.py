@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+import threading
+from datetime import datetime
+from xml.etree import ElementTree
+
+from plexapi import X_PLEX_CONTAINER_SIZE, base, log, utils
+from plexapi.exceptions import NotFound, Unsupported
+
+# Timeline entry state of a deleted item in the alert websocket
+TIMELINE_STATE_DELETED = 9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    ratingKey INTEGER PRIMARY KEY,
+    type TEXT,
+    title TEXT COLLATE NOCASE,
+    guid TEXT,
+    addedAt INTEGER,
+    updatedAt INTEGER,
+    xml BLOB
+);
+CREATE TABLE IF NOT EXISTS guids (guid TEXT, ratingKey INTEGER);
+CREATE TABLE IF NOT EXISTS files (file TEXT, ratingKey INTEGER);
+CREATE TABLE IF NOT EXISTS tags (tagType TEXT, tag TEXT COLLATE NOCASE, ratingKey INTEGER);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE INDEX IF NOT EXISTS items_title ON items (title);
+CREATE INDEX IF NOT EXISTS items_type ON items (type);
+CREATE INDEX IF NOT EXISTS guids_guid ON guids (guid);
+CREATE INDEX IF NOT EXISTS guids_ratingKey ON guids (ratingKey);
+CREATE INDEX IF NOT EXISTS files_file ON files (file);
+CREATE INDEX IF NOT EXISTS files_ratingKey ON files (ratingKey);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tagType, tag);
+CREATE INDEX IF NOT EXISTS tags_ratingKey ON tags (ratingKey);
+"""
+
+
+class LibraryMirror:
+    """ Local SQLite mirror of the items in a :class:`~plexapi.library.LibrarySection`. The raw XML
+        of every item is stored by ratingKey along with indexes on the title, guids, file paths and
+        tags, so lookups are answered locally instead of scanning the section on the server.
+
+        The items are streamed from the server a page at a time with
+        :func:`~plexapi.library.LibrarySection.iterSearch` and stored with their guids. Like the results
+        of :func:`~plexapi.library.LibrarySection.search`, the items returned by the mirror are partial
+        objects built from the library listing: tags may be truncated and the full media details are
+        missing. Call :func:`~plexapi.base.PlexPartialObject.reload` on an item to load all of its data.
+
+        The first :func:`~plexapi.mirror.LibraryMirror.sync` downloads every item. Following syncs only
+        request the items updated since the previous sync (``updatedAt>>``). Deleted items are removed
+        when a full sync is run or when the deletion is received from the alert websocket with
+        :func:`~plexapi.mirror.LibraryMirror.handleAlert`.
+
+        Parameters:
+            section (:class:`~plexapi.library.LibrarySection`): The library section to mirror.
+            path (str): Path of the SQLite database file (default ``:memory:``).
+            libtypes (list<str>, optional): The library types to mirror (e.g. ``['show', 'episode']``).
+                Default is the type of the library section.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.mirror import LibraryMirror
+
+                mirror = LibraryMirror(plex.library.section('Movies'), path='movies.db')
+                mirror.sync()
+                movie = mirror.getGuid('imdb://tt0133093')
+                movies = mirror.search(tag='Action', tagType='genre')
+
+                # Keep the mirror up to date from the alert websocket
+                plex.startAlertListener(mirror.handleAlert)
+                mirror.sync()  # Only refreshes the updated and deleted items
+
+    """
+
+    def __init__(self, section, path=':memory:', libtypes=None):
+        self._section = section
+        self._server = section._server
+        self.path = path
+        self.libtypes = libtypes or [section.TYPE]
+        self._lock = threading.RLock()
+        self._dirty = set()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self._section.title}:{self.path}>'
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def close(self):
+        """ Closes the SQLite database. """
+        with self._lock:
+            self._db.close()
+
+    def sync(self, full=False):
+        """ Updates the mirror from the server and returns the number of items added or updated.
+
+            Parameters:
+                full (bool): True to download every item and remove the items which no longer exist
+                    on the server. Default is to only download the items updated since the last sync
+                    and the items received from :func:`~plexapi.mirror.LibraryMirror.handleAlert`.
+        """
+        if base.LEAN_OBJECTS:
+            raise Unsupported('LibraryMirror stores the full XML data of the items and does not support lean objects.')
+        count = 0
+        for libtype in self.libtypes:
+            updatedAt = None if full else self._getMeta(f'updatedAt:{libtype}')
+            filters = None
+            if updatedAt is not None:
+                # Subtract one second since the filter is exclusive and updatedAt has a one second resolution
+                filters = {'updatedAt>>': datetime.fromtimestamp(int(updatedAt) - 1)}
+            items = self._section.iterSearch(libtype=libtype, filters=filters, includeGuids=True)
+            synced = self._storeAll(items, libtype=libtype if full else None)
+            count += synced
+            log.debug('Mirrored %s %s items from %s', synced, libtype, self._section.title)
+
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if dirty:
+            dirty = sorted(dirty)
+            items = self._server.fetchItemsByRatingKeys(dirty)
+            count += self._store([item for item in items if item is not None and item.type in self.libtypes])
+            self._delete({key for key, item in zip(dirty, items) if item is None})
+        return count
+
+    def handleAlert(self, data):
+        """ Callback for :func:`~plexapi.server.PlexServer.startAlertListener` which queues the updated
+            items of the section for the next :func:`~plexapi.mirror.LibraryMirror.sync` and removes
+            the deleted items from the mirror.
+        """
+        if data.get('type') != 'timeline':
+            return
+        deleted = set()
+        for entry in data.get('TimelineEntry', []):
+            if utils.cast(int, entry.get('sectionID')) != self._section.key:
+                continue
+            ratingKey = utils.cast(int, entry.get('itemID'))
+            if entry.get('state') == TIMELINE_STATE_DELETED:
+                deleted.add(ratingKey)
+            else:
+                with self._lock:
+                    self._dirty.add(ratingKey)
+        if deleted:
+            self._delete(deleted)
+
+    def get(self, ratingKey):
+        """ Returns the mirrored item with the specified ratingKey.
+
+            Raises:
+                :exc:`~plexapi.exceptions.NotFound`: The ratingKey is not found in the mirror.
+        """
+        items = self._query('SELECT xml FROM items WHERE ratingKey = ?', (ratingKey,))
+        if not items:
+            raise NotFound(f'ratingKey {ratingKey} is not found in the mirror')
+        return items[0]
+
+    def getGuid(self, guid):
+        """ Returns the mirrored item with the specified Plex, IMDB, TMDB, or TVDB guid.
+            See :func:`~plexapi.library.LibrarySection.getGuid`.
+
+            Raises:
+                :exc:`~plexapi.exceptions.NotFound`: The guid is not found in the mirror.
+        """
+        items = self._query(
+            'SELECT xml FROM items WHERE ratingKey IN (SELECT ratingKey FROM guids WHERE guid = ?)', (guid,))
+        if not items:
+            raise NotFound(f"Guid '{guid}' is not found in the mirror")
+        return items[0]
+
+    def getFile(self, file):
+        """ Returns the mirrored item with a media part at the specified file path.
+
+            Raises:
+                :exc:`~plexapi.exceptions.NotFound`: The file is not found in the mirror.
+        """
+        items = self._query(
+            'SELECT xml FROM items WHERE ratingKey IN (SELECT ratingKey FROM files WHERE file = ?)', (file,))
+        if not items:
+            raise NotFound(f"File '{file}' is not found in the mirror")
+        return items[0]
+
+    def search(self, title=None, libtype=None, tag=None, tagType=None):
+        """ Returns a list of mirrored items matching all the specified (case-insensitive) values.
+
+            Parameters:
+                title (str, optional): Title of the items to return.
+                libtype (str, optional): Type of the items to return (e.g. ``movie``, ``episode``).
+                tag (str, optional): Tag of the items to return (e.g. ``Action``).
+                tagType (str, optional): Type of the tag (e.g. ``genre``, ``collection``, ``label``).
+        """
+        where, args = [], []
+        if title is not None:
+            where.append('title = ?')
+            args.append(title)
+        if libtype is not None:
+            where.append('type = ?')
+            args.append(libtype)
+        if tag is not None or tagType is not None:
+            tagWhere, tagArgs = [], []
+            if tag is not None:
+                tagWhere.append('tag = ?')
+                tagArgs.append(tag)
+            if tagType is not None:
+                tagWhere.append('tagType = ?')
+                tagArgs.append(tagType.lower())
+            where.append(f'ratingKey IN (SELECT ratingKey FROM tags WHERE {" AND ".join(tagWhere)})')
+            args.extend(tagArgs)
+        sql = 'SELECT xml FROM items'
+        if where:
+            sql += f' WHERE {" AND ".join(where)}'
+        return self._query(f'{sql} ORDER BY ratingKey', args)
+
+    def _query(self, sql, args=()):
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        initpath = f'/library/sections/{self._section.key}/all'
+        return [self._section._buildItemOrNone(ElementTree.fromstring(row[0]), initpath=initpath) for row in rows]
+
+    def _storeAll(self, items, libtype=None):
+        """ Stores the items streamed from the server one page at a time and returns the number of
+            items stored. When libtype is specified, all other items of that type are removed from
+            the mirror once every item was stored.
+        """
+        if libtype is not None:
+            with self._lock, self._db:
+                self._db.execute('CREATE TEMP TABLE IF NOT EXISTS synced (ratingKey INTEGER PRIMARY KEY)')
+                self._db.execute('DELETE FROM synced')
+        count, batch = 0, []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= X_PLEX_CONTAINER_SIZE:
+                count += self._store(batch, synced=libtype is not None)
+                batch = []
+        if batch:
+            count += self._store(batch, synced=libtype is not None)
+        if libtype is not None:
+            with self._lock, self._db:
+                stale = self._db.execute(
+                    'SELECT ratingKey FROM items WHERE type = ? AND ratingKey NOT IN (SELECT ratingKey FROM synced)',
+                    (libtype,)).fetchall()
+                self._deleteRows({row[0] for row in stale})
+        return count
+
+    def _store(self, items, synced=False):
+        """ Inserts or replaces the items in the mirror. When synced is True, the ratingKeys are
+            recorded to remove the items which no longer exist at the end of a full sync.
+        """
+        with self._lock, self._db:
+            if synced:
+                self._db.executemany('INSERT OR IGNORE INTO synced VALUES (?)', [(item.ratingKey,) for item in items])
+
+            keys = [(item.ratingKey,) for item in items]
+            for table in ('guids', 'files', 'tags'):
+                self._db.executemany(f'DELETE FROM {table} WHERE ratingKey = ?', keys)
+            for item in items:
+                self._storeItem(item._data)
+
+            updatedAt = {}
+            for item in items:
+                value = utils.cast(int, item._data.attrib.get('updatedAt'))
+                if value and value > updatedAt.get(item.type, 0):
+                    updatedAt[item.type] = value
+            for itemtype, value in updatedAt.items():
+                current = self._getMeta(f'updatedAt:{itemtype}')
+                if current is None or value > int(current):
+                    self._setMeta(f'updatedAt:{itemtype}', value)
+        return len(items)
+
+    def _storeItem(self, elem):
+        ratingKey = utils.cast(int, elem.attrib.get('ratingKey'))
+        self._db.execute(
+            'INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)', (
+                ratingKey,
+                elem.attrib.get('type'),
+                elem.attrib.get('title'),
+                elem.attrib.get('guid'),
+                utils.cast(int, elem.attrib.get('addedAt')),
+                utils.cast(int, elem.attrib.get('updatedAt')),
+                ElementTree.tostring(elem),
+            ))
+        guids = {elem.attrib.get('guid')} | {guid.attrib.get('id') for guid in elem.iter('Guid')}
+        self._db.executemany('INSERT INTO guids VALUES (?, ?)', [(guid, ratingKey) for guid in guids if guid])
+        files = {part.attrib.get('file') for part in elem.iter('Part')}
+        self._db.executemany('INSERT INTO files VALUES (?, ?)', [(file, ratingKey) for file in files if file])
+        tags = {
+            (child.tag.lower(), child.attrib['tag']) for child in elem
+            if child.tag not in ('Guid', 'Media') and 'tag' in child.attrib
+        }
+        self._db.executemany('INSERT INTO tags VALUES (?, ?, ?)', [(t, tag, ratingKey) for t, tag in tags])
+
+    def _delete(self, ratingKeys):
+        with self._lock, self._db:
+            self._deleteRows(ratingKeys)
+
+    def _deleteRows(self, ratingKeys):
+        if not ratingKeys:
+            return
+        keys = [(key,) for key in ratingKeys]
+        for table in ('items', 'guids', 'files', 'tags'):
+            self._db.executemany(f'DELETE FROM {table} WHERE ratingKey = ?', keys)
+        log.debug('Removed %s items from the mirror of %s', len(keys), self._section.title)
+
+    def _getMeta(self, key):
+        row = self._db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _setMeta(self, key, value):
+        self._db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, str(value)))
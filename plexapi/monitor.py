@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+import threading
+from xml.etree.ElementTree import Element
+
+from plexapi import log, utils
+from plexapi.media import TranscodeSession
+
+# Transcode decision attributes compared to emit transcode events
+TRANSCODE_DECISIONS = ('videoDecision', 'audioDecision', 'subtitleDecision', 'transcodeHwRequested', 'throttled')
+
+
+class SessionEvent:
+    """ Emitted by the :class:`~plexapi.monitor.SessionMonitor` when a session changes.
+
+        Attributes:
+            type (str): The type of event: ``start``, ``stop``, ``pause``, ``resume``, ``buffering``,
+                ``progress`` or ``transcode``.
+            session (:class:`~plexapi.base.PlexSession`): The session object
+                (e.g. :class:`~plexapi.video.MovieSession`).
+            sessionKey (int): The session key of the session.
+            state (str): The player state (playing, paused, buffering or stopped).
+            viewOffset (int): The view offset of the session in milliseconds.
+            bitrate (int): The streaming bitrate of the session in kbps. This is the bandwidth
+                reserved for the session by the server, or the bitrate of the media when the
+                server does not report it.
+            changes (dict): Dictionary of ``{attribute: (old, new)}`` transcode decision changes
+                for ``transcode`` events.
+    """
+
+    def __init__(self, type, session, changes=None):
+        self.type = type
+        self.session = session
+        self.sessionKey = session.sessionKey
+        self.state = session.player.state if session.player else None
+        self.viewOffset = session.viewOffset
+        self.bitrate = _bitrate(session)
+        self.changes = changes or {}
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.type}:{self.sessionKey}>'
+
+
+class SessionMonitor:
+    """ Keeps the current sessions of a :class:`~plexapi.server.PlexServer` up to date from the
+        ``playing`` and ``transcodeSession`` alerts. The sessions are kept by ``sessionKey`` and
+        patched in place with the state and view offset of every alert, so ``/status/sessions`` is
+        only requested again when a new session starts. Subscribers receive a
+        :class:`~plexapi.monitor.SessionEvent` when a session starts, stops, pauses, resumes,
+        buffers, progresses or changes its transcode decisions.
+
+        The monitor can be used as the callback of :func:`~plexapi.server.PlexServer.startAlertListener`
+        or subscribed to an :class:`~plexapi.alert.AsyncAlertListener`. Use
+        :func:`~plexapi.monitor.SessionMonitor.start` to load the current sessions and start a new
+        alert listener.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The server to monitor.
+
+        Attributes:
+            sessions (dict): Dictionary of ``{sessionKey: session}`` of the active sessions.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.monitor import SessionMonitor
+
+                def onEvent(event):
+                    print(event.type, event.session.title, event.session.player.title, event.bitrate)
+
+                monitor = SessionMonitor(plex)
+                monitor.subscribe(onEvent, ['start', 'stop', 'pause', 'transcode'])
+                monitor.start()
+                ...
+                monitor.stop()
+
+    """
+    EVENTS = ('start', 'stop', 'pause', 'resume', 'buffering', 'progress', 'transcode')
+
+    def __init__(self, server):
+        self._server = server
+        self.sessions = {}
+        self._subscribers = []
+        self._lock = threading.RLock()
+        self._listener = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self._server._baseurl}:{len(self.sessions)} sessions>'
+
+    def __call__(self, data):
+        self.handleAlert(data)
+
+    def subscribe(self, callback, events=None):
+        """ Registers a callback for the specified session events and returns the callback.
+
+            Parameters:
+                callback (func): Function accepting a single :class:`~plexapi.monitor.SessionEvent` argument.
+                events (str or list<str>, optional): The event types to receive (see
+                    :attr:`~plexapi.monitor.SessionEvent.type`). Default receives all events.
+        """
+        if isinstance(events, str):
+            events = [events]
+        self._subscribers.append((set(events) if events else None, callback))
+        return callback
+
+    def unsubscribe(self, callback):
+        """ Removes all subscriptions of the callback. """
+        self._subscribers = [(events, cb) for events, cb in self._subscribers if cb != callback]
+
+    def start(self, callbackError=None):
+        """ Loads the current sessions and starts an :class:`~plexapi.alert.AlertListener`
+            feeding the monitor. Returns the alert listener.
+        """
+        self.refresh()
+        self._listener = self._server.startAlertListener(self.handleAlert, callbackError)
+        return self._listener
+
+    def stop(self):
+        """ Stops the alert listener started by :func:`~plexapi.monitor.SessionMonitor.start`. """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def refresh(self):
+        """ Requests the current sessions from the server, emits the ``start`` and ``stop`` events
+            for the sessions which were added or removed, and returns the list of sessions.
+        """
+        key = '/status/sessions'
+        data = self._server.query(key)
+        current, events = {}, []
+        with self._lock:
+            for elem in data:
+                sessionKey = utils.cast(int, elem.attrib.get('sessionKey'))
+                session = self.sessions.get(sessionKey)
+                if session is None:
+                    session = self._server._buildItemOrNone(elem, initpath=key)
+                    if session is None:
+                        continue
+                    events.append(SessionEvent('start', session))
+                else:
+                    # Reload the known sessions in place instead of building new objects
+                    previousState = session.player.state if session.player else None
+                    previousTranscode = session.transcodeSession
+                    session._loadData(elem)
+                    session._leanData()
+                    events.extend(self._compare(session, previousState, previousTranscode))
+                current[sessionKey] = session
+            for sessionKey in set(self.sessions) - set(current):
+                events.append(SessionEvent('stop', self.sessions[sessionKey]))
+            self.sessions = current
+        self._emit(events)
+        return list(current.values())
+
+    def handleAlert(self, data):
+        """ Updates the sessions from an alert. Accepts the data dictionary sent to the
+            :class:`~plexapi.alert.AlertListener` callback or an :class:`~plexapi.alert.AlertEvent`.
+        """
+        data = getattr(data, 'data', data)
+        alertType = data.get('type')
+        if alertType == 'playing':
+            self._handlePlaying(data.get('PlaySessionStateNotification', []))
+        elif alertType in ('transcodeSession.start', 'transcodeSession.update'):
+            self._handleTranscode(data.get('TranscodeSession', []))
+
+    def _handlePlaying(self, notifications):
+        events, refresh = [], False
+        with self._lock:
+            for notification in notifications:
+                sessionKey = utils.cast(int, notification.get('sessionKey'))
+                state = notification.get('state')
+                session = self.sessions.get(sessionKey)
+                if session is None:
+                    refresh = refresh or state != 'stopped'
+                    continue
+                if state == 'stopped':
+                    del self.sessions[sessionKey]
+                    if session.player:
+                        session.player.state = state
+                    events.append(SessionEvent('stop', session))
+                    continue
+                previousState = session.player.state if session.player else None
+                if 'viewOffset' in notification:
+                    session.viewOffset = utils.cast(int, notification['viewOffset'])
+                if session.player:
+                    session.player.state = state
+                events.append(SessionEvent(_stateEvent(previousState, state), session))
+        self._emit(events)
+        if refresh:
+            log.debug('New session started, refreshing the sessions of %s', self._server._baseurl)
+            self.refresh()
+
+    def _handleTranscode(self, notifications):
+        events = []
+        with self._lock:
+            for notification in notifications:
+                key = notification.get('key')
+                session = next((
+                    s for s in self.sessions.values()
+                    if s.transcodeSession is not None and s.transcodeSession.key == key
+                ), None)
+                if session is None:
+                    continue
+                attrs = {k: str(int(v) if isinstance(v, bool) else v) for k, v in notification.items()
+                         if not isinstance(v, (dict, list))}
+                transcodeSession = TranscodeSession(self._server, Element('TranscodeSession', attrs))
+                changes = _transcodeChanges(session.transcodeSession, transcodeSession)
+                session.transcodeSession = transcodeSession
+                session.transcodeSessions = [transcodeSession]
+                if changes:
+                    events.append(SessionEvent('transcode', session, changes))
+        self._emit(events)
+
+    def _compare(self, session, previousState, previousTranscode):
+        """ Returns the events between the previous and the reloaded state of the session. """
+        state = session.player.state if session.player else None
+        events = []
+        if previousState != state:
+            events.append(SessionEvent(_stateEvent(previousState, state), session))
+        changes = _transcodeChanges(previousTranscode, session.transcodeSession)
+        if changes:
+            events.append(SessionEvent('transcode', session, changes))
+        return events
+
+    def _emit(self, events):
+        for event in events:
+            for types, callback in list(self._subscribers):
+                if types is not None and event.type not in types:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    log.exception('SessionMonitor callback %s failed: %s', callback, e)
+
+
+def _stateEvent(previousState, state):
+    """ Returns the event type for a player state change. """
+    if state == 'paused' and previousState != 'paused':
+        return 'pause'
+    if state == 'playing' and previousState in ('paused', 'buffering'):
+        return 'resume'
+    if state == 'buffering' and previousState != 'buffering':
+        return 'buffering'
+    return 'progress'
+
+
+def _transcodeChanges(previous, current):
+    """ Returns a dictionary of ``{attribute: (old, new)}`` for the changed transcode decisions. """
+    changes = {}
+    for attr in TRANSCODE_DECISIONS:
+        old = getattr(previous, attr, None) if previous is not None else None
+        new = getattr(current, attr, None) if current is not None else None
+        if old != new:
+            changes[attr] = (old, new)
+    return changes
+
+
+def _bitrate(session):
+    """ Returns the reserved bandwidth of the session or the bitrate of the media in kbps. """
+    if session.session is not None and session.session.bandwidth:
+        return session.session.bandwidth
+    media = getattr(session, 'media', None) or []
+    return media[0].bitrate if media else None
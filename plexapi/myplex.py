@@ -3,14 +3,13 @@ import copy
 import html
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
-from xml.etree import ElementTree
 
-import requests
-
-from plexapi import (BASE_HEADERS, CONFIG, TIMEOUT, X_PLEX_ENABLE_FAST_CONNECT, X_PLEX_IDENTIFIER,
-                     log, logfilter, utils)
+from plexapi import (BASE_HEADERS, CONFIG, TIMEOUT, X_PLEX_CONNECTION_CACHE, X_PLEX_ENABLE_FAST_CONNECT,
+                     X_PLEX_IDENTIFIER, log, logfilter, metrics, utils)
 from plexapi.base import PlexObject
+from plexapi.cache import ConnectionCache, defaultConnectionCache
 from plexapi.client import PlexClient
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized, TwoFactorRequired
 from plexapi.library import LibrarySection
@@ -118,7 +117,7 @@ class MyPlexAccount(PlexObject):
 
     def __init__(self, username=None, password=None, token=None, session=None, timeout=None, code=None, remember=True):
         self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
-        self._session = session or requests.Session()
+        self._session = session or utils.defaultSession()
         self._timeout = timeout or TIMEOUT
         self._sonos_cache = []
         self._sonos_cache_timestamp = 0
@@ -231,27 +230,28 @@ class MyPlexAccount(PlexObject):
         timeout = timeout or self._timeout
         log.debug('%s %s %s', method.__name__.upper(), url, kwargs.get('json', ''))
         headers = self._headers(**headers or {})
-        response = method(url, headers=headers, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201, 204):  # pragma: no cover
-            codename = codes.get(response.status_code)[0]
-            errtext = response.text.replace('\n', ' ')
-            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-            if response.status_code == 401:
-                if "verification code" in response.text:
-                    raise TwoFactorRequired(message)
-                raise Unauthorized(message)
-            elif response.status_code == 404:
-                raise NotFound(message)
-            elif response.status_code == 422 and "Invalid token" in response.text:
-                raise Unauthorized(message)
-            else:
-                raise BadRequest(message)
-        if 'application/json' in response.headers.get('Content-Type', ''):
-            return response.json()
-        elif 'text/plain' in response.headers.get('Content-Type', ''):
-            return response.text.strip()
-        data = utils.cleanXMLString(response.text).encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+        with metrics.track('myplex', method.__name__, url) as request:
+            response = method(url, headers=headers, timeout=timeout, **kwargs)
+            request.response(response)
+            if response.status_code not in (200, 201, 204):  # pragma: no cover
+                codename = codes.get(response.status_code)[0]
+                errtext = response.text.replace('\n', ' ')
+                message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+                if response.status_code == 401:
+                    if "verification code" in response.text:
+                        raise TwoFactorRequired(message)
+                    raise Unauthorized(message)
+                elif response.status_code == 404:
+                    raise NotFound(message)
+                elif response.status_code == 422 and "Invalid token" in response.text:
+                    raise Unauthorized(message)
+                else:
+                    raise BadRequest(message)
+            if 'application/json' in response.headers.get('Content-Type', ''):
+                return response.json()
+            elif 'text/plain' in response.headers.get('Content-Type', ''):
+                return response.text.strip()
+            return utils.parseXML(response.content)
 
     def ping(self):
         """ Ping the Plex.tv API.
@@ -1507,17 +1507,27 @@ class MyPlexResource(PlexObject):
         timeout=None,
         locations=None,
         schemes=None,
+        cache=None,
     ):
         """ Returns a new :class:`~plexapi.server.PlexServer` or :class:`~plexapi.client.PlexClient` object.
             Uses `MyPlexResource.preferred_connections()` to generate the priority order of connection addresses.
             After trying to connect to all available addresses for this resource and
             assuming at least one connection was successful, the PlexServer object is built and returned.
 
+            Servers are connected to by probing the ``/identity`` endpoint of all addresses in parallel,
+            and only the chosen address builds the :class:`~plexapi.server.PlexServer`. When a
+            :class:`~plexapi.cache.ConnectionCache` is used, the chosen address is remembered and probed
+            first the next time. A remembered address which does not answer is forgotten and all the
+            addresses are probed again within the same call.
+
             Parameters:
                 ssl (bool, optional): Set True to only connect to HTTPS connections. Set False to
                     only connect to HTTP connections. Set None (default) to connect to any
                     HTTP or HTTPS connection.
                 timeout (int, optional): The timeout in seconds to attempt each connection.
+                cache (:class:`~plexapi.cache.ConnectionCache` or bool, optional): Cache of the chosen server
+                    addresses. Set True to use :func:`~plexapi.cache.defaultConnectionCache`. Default only
+                    uses the default cache when the ``plexapi.connection_cache`` file is configured.
 
             Raises:
                 :exc:`~plexapi.exceptions.NotFound`: When unable to connect to any addresses for this resource.
@@ -1528,14 +1538,58 @@ class MyPlexResource(PlexObject):
             schemes = self.DEFAULT_SCHEME_ORDER[:]
 
         connections = self.preferred_connections(ssl, locations, schemes)
+        if 'server' in self.provides:
+            if cache is True or (cache is None and X_PLEX_CONNECTION_CACHE):
+                cache = defaultConnectionCache()
+            return self._connectServer(connections, timeout, cache if isinstance(cache, ConnectionCache) else None)
         # Try connecting to all known resource connections in parallel, but
-        # only return the first server (in order) that provides a response.
-        cls = PlexServer if 'server' in self.provides else PlexClient
+        # only return the first client (in order) that provides a response.
+        cls = PlexClient
         listargs = [[cls, url, self.accessToken, self._server._session, timeout] for url in connections]
         log.debug('Testing %s resource connections..', len(listargs))
         results = utils.threaded(_connect, listargs)
         return _chooseConnection('Resource', self.name, results)
 
+    def _connectServer(self, connections, timeout=None, cache=None):
+        """ Connects to the remembered server address or the best address answering the identity probe.
+            Addresses which answer the probe but fail to connect are skipped and the remaining
+            addresses are probed again.
+        """
+        session = self._server._session
+        candidates = list(connections)
+        url = cache.get(self.clientIdentifier) if cache is not None else None
+        if url is not None:
+            server = None
+            if url in candidates and _probe(url, self.accessToken, session, timeout, self.clientIdentifier):
+                server = self._buildServer(url, session, timeout)
+                if server is None:
+                    candidates.remove(url)
+            if server is not None:
+                cache.set(self.clientIdentifier, url)
+                return server
+            log.debug('Remembered resource address %s failed, probing all addresses', url)
+            cache.remove(self.clientIdentifier)
+        while candidates:
+            url = _raceConnections(candidates, self.accessToken, session, timeout, self.clientIdentifier)
+            if url is None:
+                break
+            server = self._buildServer(url, session, timeout)
+            if server is not None:
+                if cache is not None:
+                    cache.set(self.clientIdentifier, url)
+                return server
+            candidates.remove(url)
+        raise NotFound(f'Unable to connect to resource: {self.name}')
+
+    def _buildServer(self, url, session, timeout):
+        """ Returns the :class:`~plexapi.server.PlexServer` at the url or None if connecting fails. """
+        log.debug('Connecting to Resource: %s', url)
+        try:
+            return PlexServer(baseurl=url, token=self.accessToken, session=session, timeout=timeout)
+        except Exception as e:
+            log.debug('Unable to connect to resource %s at %s: %s', self.name, url, e)
+            return None
+
 
 class ResourceConnection(PlexObject):
     """ Represents a Resource Connection object found within the
@@ -1691,7 +1745,7 @@ class MyPlexPinLogin:
 
     def __init__(self, session=None, requestTimeout=None, headers=None, oauth=False):
         super(MyPlexPinLogin, self).__init__()
-        self._session = session or requests.Session()
+        self._session = session or utils.defaultSession()
         self._requestTimeout = requestTimeout or TIMEOUT
         self.headers = headers
 
@@ -1879,8 +1933,7 @@ class MyPlexPinLogin:
             codename = codes.get(response.status_code)[0]
             errtext = response.text.replace('\n', ' ')
             raise BadRequest(f'({response.status_code}) {codename} {response.url}; {errtext}')
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+        return utils.parseXML(response.content)
 
 
 def _connect(cls, url, token, session, timeout, results, i, job_is_done_event=None):
@@ -1912,6 +1965,50 @@ def _connect(cls, url, token, session, timeout, results, i, job_is_done_event=No
         results[i] = (url, token, None, runtime)
 
 
+def _probe(url, token, session, timeout, identifier=None):
+    """ Returns True if the Plex Media Server at the url answers the identity request with the
+        expected machine identifier.
+    """
+    try:
+        response = session.get(
+            f'{url}/identity', headers={**BASE_HEADERS, 'X-Plex-Token': token}, timeout=timeout or TIMEOUT)
+        if response.status_code != 200:
+            log.debug('Probe %s: (%s)', url, response.status_code)
+            return False
+        data = utils.parseXML(response.content)
+        return identifier is None or data.attrib.get('machineIdentifier') == identifier
+    except Exception as e:
+        log.debug('Probe %s: %s', url, e)
+        return False
+
+
+def _raceConnections(urls, token, session, timeout, identifier=None):
+    """ Probes all urls in parallel and returns the first url (in order) which answers, without
+        waiting for the lower priority urls. With X_PLEX_ENABLE_FAST_CONNECT the first url to answer
+        is returned. Returns None if no url answers.
+    """
+    if not urls:
+        return None
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    try:
+        futures = {executor.submit(_probe, url, token, session, timeout, identifier): i for i, url in enumerate(urls)}
+        results = [None] * len(urls)
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if X_PLEX_ENABLE_FAST_CONNECT and results[i]:
+                return urls[i]
+            for j, ok in enumerate(results):
+                if ok is None:
+                    break
+                if ok:
+                    return urls[j]
+        return None
+    finally:
+        # Do not wait for the slower probes once an address is chosen
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _chooseConnection(ctype, name, results):
     """ Chooses the first (best) connection from the given _connect results. """
     # At this point we have a list of result tuples containing (url, token, PlexServer, runtime)
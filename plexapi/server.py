@@ -1,18 +1,18 @@
 # -*- coding: utf-8 -*-
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from urllib.parse import urlencode
-from xml.etree import ElementTree
 
-import requests
-
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter
-from plexapi import utils
+from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, X_PLEX_CONTAINER_WORKERS, log, logfilter
+from plexapi import metrics, utils
 from plexapi.alert import AlertListener
-from plexapi.base import PlexObject
+from plexapi.base import PlexObject, PlexPartialObject
 from plexapi.client import PlexClient
 from plexapi.collection import Collection
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
+from plexapi.history import HistoryExporter
 from plexapi.library import Hub, Library, Path, File
 from plexapi.media import Conversion, Optimized
 from plexapi.playlist import Playlist
@@ -44,6 +44,8 @@ class PlexServer(PlexObject):
                 cache the http responses from the server.
             timeout (int, optional): Timeout in seconds on initial connection to the server
                 (default config.TIMEOUT).
+            cache (:class:`~plexapi.cache.ResponseCache`, optional): Response cache used to avoid
+                requesting near-static endpoints repeatedly (default None, no caching).
 
         Attributes:
             allowCameraUpload (bool): True if server allows camera upload.
@@ -100,21 +102,27 @@ class PlexServer(PlexObject):
             _baseurl (str): HTTP address of the client.
             _token (str): Token used to access this client.
             _session (obj): Requests session object used to access this client.
+            _cache (:class:`~plexapi.cache.ResponseCache`): Response cache used by this server (or None).
     """
     key = '/'
 
-    def __init__(self, baseurl=None, token=None, session=None, timeout=None):
+    def __init__(self, baseurl=None, token=None, session=None, timeout=None, cache=None):
+        self._setup(baseurl, token, session, timeout, cache)
+        data = self.query(self.key, timeout=self._timeout)
+        super(PlexServer, self).__init__(self, data, self.key)
+
+    def _setup(self, baseurl=None, token=None, session=None, timeout=None, cache=None):
+        """ Sets up the connection attributes without requesting anything from the server. """
         self._baseurl = baseurl or CONFIG.get('auth.server_baseurl', 'http://localhost:32400')
         self._baseurl = self._baseurl.rstrip('/')
         self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
         self._showSecrets = CONFIG.get('log.show_secrets', '').lower() == 'true'
-        self._session = session or requests.Session()
+        self._session = session or utils.defaultSession()
         self._timeout = timeout or TIMEOUT
+        self._cache = cache
         self._myPlexAccount = None   # cached myPlexAccount
         self._systemAccounts = None   # cached list of SystemAccount
         self._systemDevices = None   # cached list of SystemDevice
-        data = self.query(self.key, timeout=self._timeout)
-        super(PlexServer, self).__init__(self, data, self.key)
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -274,7 +282,7 @@ class PlexServer(PlexObject):
             session = self._session
         if timeout is None:
             timeout = self._timeout
-        return PlexServer(self._baseurl, token=userToken, session=session, timeout=timeout)
+        return PlexServer(self._baseurl, token=userToken, session=session, timeout=timeout, cache=self._cache)
 
     def systemAccounts(self):
         """ Returns a list of :class:`~plexapi.server.SystemAccount` objects this server contains. """
@@ -678,6 +686,13 @@ class PlexServer(PlexObject):
         key = f'/status/sessions/history/all{utils.joinArgs(args)}'
         return self.fetchItems(key, maxresults=maxresults)
 
+    def historyExporter(self, **kwargs):
+        """ Returns a :class:`~plexapi.history.HistoryExporter` streaming the watch history of the server
+            as lightweight rows. Use this instead of :func:`~plexapi.server.PlexServer.history` to export
+            a large history. See :class:`~plexapi.history.HistoryExporter` for the parameters.
+        """
+        return HistoryExporter(self, **kwargs)
+
     def playlists(self, playlistType=None, sectionId=None, title=None, sort=None, **kwargs):
         """ Returns a list of all :class:`~plexapi.playlist.Playlist` objects on the server.
 
@@ -747,6 +762,230 @@ class PlexServer(PlexObject):
         """ Returns list of all :class:`~plexapi.media.TranscodeJob` objects running or paused on server. """
         return self.fetchItems('/status/sessions/background')
 
+    def fetchItemsByRatingKeys(self, items, chunksize=100, workers=None, **kwargs):
+        """ Returns a list of full media objects for many ratingKeys using as few requests as possible.
+            The ratingKeys are split into URL-safe batches of at most ``chunksize`` keys which are
+            fetched concurrently from ``/library/metadata/<key1,key2,...>``. Partial objects passed
+            in are reloaded in place.
+
+            Parameters:
+                items (list): List of ratingKeys (int or str) or :class:`~plexapi.base.PlexPartialObject`.
+                chunksize (int, optional): Max number of ratingKeys per request (default 100).
+                workers (int, optional): Number of requests to send concurrently
+                    (default ``plexapi.container_workers`` from the config).
+                **kwargs (dict): XML include parameters to include/exclude or override.
+                    See :class:`~plexapi.base.PlexPartialObject` for all the available include parameters.
+
+            Returns:
+                List of full objects in the same order as the input. The list contains None
+                for ratingKeys which do not exist on the server.
+
+            Example:
+
+                .. code-block:: python
+
+                    movies = plex.library.section('Movies').all()
+                    plex.fetchItemsByRatingKeys(movies, includeMarkers=False)  # Reloads all movies in place
+                    items = plex.fetchItemsByRatingKeys([1234, 5678])
+
+        """
+        query = urlencode(sorted(PlexPartialObject._buildDetailsParams(**kwargs).items()))
+        ratingKeys = [str(item.ratingKey) if isinstance(item, PlexObject) else str(item) for item in items]
+        partials = defaultdict(list)
+        for item, ratingKey in zip(items, ratingKeys):
+            if isinstance(item, PlexObject):
+                partials[ratingKey].append(item)
+
+        # Limit the number of keys and the length of the URL for each request
+        chunks, chunk, length = [], [], 0
+        for ratingKey in dict.fromkeys(ratingKeys):
+            if chunk and (len(chunk) >= chunksize or length + len(ratingKey) > 2000):
+                chunks.append(chunk)
+                chunk, length = [], 0
+            chunk.append(ratingKey)
+            length += len(ratingKey) + 1
+        if chunk:
+            chunks.append(chunk)
+        if not chunks:
+            return []
+
+        def _fetchChunk(chunk):
+            key = f"/library/metadata/{','.join(chunk)}"
+            return self.query(f'{key}?{query}' if query else key)
+
+        workers = min(workers or X_PLEX_CONTAINER_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            datas = list(executor.map(_fetchChunk, chunks))
+
+        results = {}
+        for data in datas:
+            for elem in data:
+                ratingKey = elem.attrib.get('ratingKey')
+                details_key = f'/library/metadata/{ratingKey}'
+                details_key = f'{details_key}?{query}' if query else details_key
+                for item in partials.get(ratingKey, []):
+                    item._initpath = details_key
+                    item._overwriteNone = False
+                    item._loadData(elem)
+                    item._leanData()
+                    item._overwriteNone = True
+                if ratingKey in partials:
+                    results[ratingKey] = partials[ratingKey][0]
+                else:
+                    results[ratingKey] = self._buildItemOrNone(elem, initpath=details_key)
+
+        return [
+            item if isinstance(item, PlexObject) and ratingKey in results else results.get(ratingKey)
+            for item, ratingKey in zip(items, ratingKeys)
+        ]
+
+    def markPlayed(self, items, rollup=True, workers=None, rate=None):
+        """ Marks many items as played using as few requests as possible. Episodes and tracks are
+            rolled up to a single ``/:/scrobble`` request for their season, show or album when all
+            of its children are either in the list or already played. The remaining requests are
+            sent concurrently.
+
+            Parameters:
+                items (list): List of ratingKeys (int or str) or :class:`~plexapi.base.PlexPartialObject`.
+                rollup (bool, optional): False to send one request per item (default True).
+                workers (int, optional): Number of requests to send concurrently
+                    (default ``plexapi.container_workers`` from the config).
+                rate (float, optional): Max number of requests to send per second. Default is no limit.
+
+            Returns:
+                List of :class:`~plexapi.server.WatchedStateResult` in the same order as the input.
+
+            Example:
+
+                .. code-block:: python
+
+                    episodes = plex.library.section('TV Shows').searchEpisodes(unwatched=True)
+                    results = plex.markPlayed(episodes, workers=4, rate=10)
+                    failed = [result.item for result in results if not result.success]
+
+        """
+        return self._batchWatchedState('/:/scrobble', items, True, rollup, workers, rate)
+
+    def markUnplayed(self, items, rollup=True, workers=None, rate=None):
+        """ Marks many items as unplayed using as few ``/:/unscrobble`` requests as possible.
+            See :func:`~plexapi.server.PlexServer.markPlayed` for the parameters.
+        """
+        return self._batchWatchedState('/:/unscrobble', items, False, rollup, workers, rate)
+
+    def updateProgress(self, progress, state='stopped', workers=None, rate=None):
+        """ Sets the watched progress of many items with concurrent ``/:/progress`` requests.
+
+            Parameters:
+                progress (dict or list): Dictionary of ``{item: time}`` or list of ``(item, time)`` pairs where
+                    the item is a ratingKey (int or str) or :class:`~plexapi.base.PlexPartialObject`
+                    and the time is the milliseconds watched.
+                state (str, optional): State of the items, default 'stopped'.
+                workers (int, optional): Number of requests to send concurrently
+                    (default ``plexapi.container_workers`` from the config).
+                rate (float, optional): Max number of requests to send per second. Default is no limit.
+
+            Returns:
+                List of :class:`~plexapi.server.WatchedStateResult` in the same order as the input.
+        """
+        pairs = list(progress.items() if isinstance(progress, dict) else progress)
+        items = [item for item, _ in pairs]
+        ratingKeys = [_ratingKey(item) for item in items]
+        pending = {}
+        for ratingKey, (_, time) in zip(ratingKeys, pairs):
+            pending[ratingKey] = {'time': int(time), 'state': state}
+        errors = self._sendWatchedState('/:/progress', pending, workers, rate)
+        return [
+            WatchedStateResult(item, ratingKey, ratingKey, errors.get(ratingKey))
+            for item, ratingKey in zip(items, ratingKeys)
+        ]
+
+    def _batchWatchedState(self, key, items, played, rollup, workers, rate):
+        """ Sends the scrobble or unscrobble requests for the items and returns the results. """
+        items = list(items)
+        ratingKeys = [_ratingKey(item) for item in items]
+        rollups = self._rollupWatchedState(items, ratingKeys, played) if rollup else {}
+        pending = {}
+        for ratingKey in ratingKeys:
+            pending.setdefault(rollups.get(ratingKey, ratingKey), {})
+        log.debug('Updating the watched state of %s items with %s requests', len(items), len(pending))
+        errors = self._sendWatchedState(key, pending, workers, rate)
+        results = []
+        for item, ratingKey in zip(items, ratingKeys):
+            requestKey = rollups.get(ratingKey, ratingKey)
+            results.append(WatchedStateResult(item, ratingKey, requestKey, errors.get(requestKey)))
+        return results
+
+    def _rollupWatchedState(self, items, ratingKeys, played):
+        """ Returns a dictionary of ``{ratingKey: parent ratingKey}`` for the episodes and tracks which
+            can be updated with a single request to their season, show or album.
+        """
+        # Load the ratingKeys passed in without an object to get their type and parents
+        missing = [ratingKey for item, ratingKey in zip(items, ratingKeys) if not isinstance(item, PlexObject)]
+        loaded = dict(zip(missing, self.fetchItemsByRatingKeys(missing))) if missing else {}
+        leaves = {}
+        for item, ratingKey in zip(items, ratingKeys):
+            obj = item if isinstance(item, PlexObject) else loaded.get(ratingKey)
+            if obj is not None and obj.TYPE in ('episode', 'track'):
+                leaves[ratingKey] = obj
+
+        parents, grandparents = defaultdict(set), defaultdict(set)
+        for ratingKey, leaf in leaves.items():
+            parents[leaf.parentRatingKey].add(ratingKey)
+            if leaf.TYPE == 'episode':
+                grandparents[leaf.grandparentRatingKey].add(ratingKey)
+        candidates = [
+            ratingKey for groups in (grandparents, parents)
+            for ratingKey, group in groups.items() if ratingKey and len(group) > 1
+        ]
+        if not candidates:
+            return {}
+        containers = {
+            container.ratingKey: container
+            for container in self.fetchItemsByRatingKeys(list(dict.fromkeys(candidates)))
+            if container is not None
+        }
+
+        def _matches(container, group):
+            # All children not in the group must already be in the requested state
+            if container is None or container.leafCount is None:
+                return False
+            viewed = container.viewedLeafCount or 0
+            viewedInGroup = sum(1 for ratingKey in group if leaves[ratingKey].viewCount)
+            if played:
+                return viewed - viewedInGroup == container.leafCount - len(group)
+            return viewed == viewedInGroup
+
+        rollups = {}
+        for groups in (grandparents, parents):
+            for parentKey, group in groups.items():
+                if len(group) > 1 and not group & rollups.keys() and _matches(containers.get(parentKey), group):
+                    rollups.update(dict.fromkeys(group, parentKey))
+        return rollups
+
+    def _sendWatchedState(self, key, pending, workers=None, rate=None):
+        """ Sends the ``{ratingKey: params}`` requests concurrently and returns a dictionary of
+            ``{ratingKey: exception}`` for the requests which failed.
+        """
+        if not pending:
+            return {}
+        limiter = utils.RateLimiter(rate)
+
+        def _send(ratingKey):
+            limiter.wait()
+            params = {'key': ratingKey, 'identifier': 'com.plexapp.plugins.library', **pending[ratingKey]}
+            self.query(key, params=params)
+
+        workers = min(workers or X_PLEX_CONTAINER_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = {ratingKey: executor.submit(_send, ratingKey) for ratingKey in pending}
+        errors = {}
+        for ratingKey, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                log.warning('Unable to update the watched state of %s: %s', ratingKey, error)
+                errors[ratingKey] = error
+        return errors
+
     def query(self, key, method=None, headers=None, params=None, timeout=None, **kwargs):
         """ Main method used to handle HTTPS requests to the Plex server. This method helps
             by encoding the response to utf-8 and parsing the returned XML into and
@@ -757,19 +996,40 @@ class PlexServer(PlexObject):
         timeout = timeout or self._timeout
         log.debug('%s %s', method.__name__.upper(), url)
         headers = self._headers(**headers or {})
-        response = method(url, headers=headers, params=params, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201, 204):
-            codename = codes.get(response.status_code)[0]
-            errtext = response.text.replace('\n', ' ')
-            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-            if response.status_code == 401:
-                raise Unauthorized(message)
-            elif response.status_code == 404:
-                raise NotFound(message)
-            else:
-                raise BadRequest(message)
-        data = utils.cleanXMLString(response.text).encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+
+        with metrics.track('server', method.__name__, url) as request:
+            cacheKey, cached = None, None
+            invalidate = self._cache is not None and self._cache.changesState(method.__name__, url)
+            if self._cache is not None and not invalidate and self._cache.cacheable(url):
+                cacheKey = self._cache.key('get', url, params, headers)
+                cached = self._cache.get(cacheKey)
+                if cached is not None and cached.fresh:
+                    log.debug('Using cached response for %s', url)
+                    request.cached(cached.content)
+                    return utils.parseXML(cached.content)
+                if cached is not None:
+                    headers.update(cached.conditionalHeaders())
+
+            response = method(url, headers=headers, params=params, timeout=timeout, **kwargs)
+            request.response(response)
+            if invalidate:
+                self._cache.invalidateRequest(url, params)
+            if cached is not None and response.status_code == 304:
+                self._cache.revalidated(cacheKey, url)
+                return utils.parseXML(cached.content)
+            if response.status_code not in (200, 201, 204):
+                codename = codes.get(response.status_code)[0]
+                errtext = response.text.replace('\n', ' ')
+                message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+                if response.status_code == 401:
+                    raise Unauthorized(message)
+                elif response.status_code == 404:
+                    raise NotFound(message)
+                else:
+                    raise BadRequest(message)
+            if cacheKey is not None:
+                self._cache.set(cacheKey, url, response)
+            return utils.parseXML(response.content)
 
     def search(self, query, mediatype=None, limit=None, sectionId=None):
         """ Returns a list of media items or filter categories from the resulting
@@ -1305,3 +1565,42 @@ class Identity(PlexObject):
         self.claimed = utils.cast(bool, data.attrib.get('claimed'))
         self.machineIdentifier = data.attrib.get('machineIdentifier')
         self.version = data.attrib.get('version')
+
+
+class WatchedStateResult:
+    """ Result of updating the watched state of a single item with
+        :func:`~plexapi.server.PlexServer.markPlayed`, :func:`~plexapi.server.PlexServer.markUnplayed`
+        or :func:`~plexapi.server.PlexServer.updateProgress`.
+
+        Attributes:
+            item (int, str or :class:`~plexapi.base.PlexPartialObject`): The item as passed in.
+            ratingKey (int): The ratingKey of the item.
+            requestKey (int): The ratingKey the request was sent for. This is the ratingKey of the
+                season, show or album when the item was rolled up with its siblings.
+            error (Exception): The exception raised by the request or None if it succeeded.
+    """
+
+    def __init__(self, item, ratingKey, requestKey, error=None):
+        self.item = item
+        self.ratingKey = ratingKey
+        self.requestKey = requestKey
+        self.error = error
+
+    def __repr__(self):
+        status = 'ok' if self.success else 'failed'
+        return f'<{self.__class__.__name__}:{self.ratingKey}:{self.requestKey}:{status}>'
+
+    @property
+    def success(self):
+        """ Returns True if the watched state of the item was updated. """
+        return self.error is None
+
+    @property
+    def rolledUp(self):
+        """ Returns True if the item was updated by a request for its season, show or album. """
+        return self.requestKey != self.ratingKey
+
+
+def _ratingKey(item):
+    """ Returns the ratingKey of a :class:`~plexapi.base.PlexObject` or a ratingKey as an int. """
+    return utils.cast(int, item.ratingKey if isinstance(item, PlexObject) else item)
@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
-import requests
-
-from plexapi import CONFIG, X_PLEX_IDENTIFIER, TIMEOUT
+from plexapi import CONFIG, X_PLEX_IDENTIFIER, TIMEOUT, utils
 from plexapi.client import PlexClient
 from plexapi.exceptions import BadRequest
 from plexapi.playqueue import PlayQueue
@@ -60,7 +58,7 @@ class PlexSonosClient(PlexClient):
         self._baseurl = "https://sonos.plex.tv"
         self._commandId = 0
         self._token = account._token
-        self._session = account._session or requests.Session()
+        self._session = account._session or utils.defaultSession()
 
         # Dummy values for PlexClient inheritance
         self._last_call = 0
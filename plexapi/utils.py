@@ -15,11 +15,14 @@ from collections import deque
 from datetime import datetime, timedelta
 from getpass import getpass
 from hashlib import sha1
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from urllib.parse import quote
+from xml.etree import ElementTree
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.status_codes import _codes as codes
+from urllib3.util.retry import Retry
 
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
 
@@ -28,6 +31,11 @@ try:
 except ImportError:
     tqdm = None
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 log = logging.getLogger('plexapi')
 
 # Search Types - Plex uses these to filter specific media types when searching.
@@ -121,6 +129,30 @@ class SecretsFilter(logging.Filter):
         return True
 
 
+class RateLimiter:
+    """ Thread-safe limiter spacing calls evenly to at most ``rate`` calls per second.
+
+        Parameters:
+            rate (float): Max number of calls per second. None or 0 to disable the limit.
+    """
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0
+        self._next = 0
+        self._lock = Lock()
+
+    def wait(self):
+        """ Blocks until the next call is allowed. """
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
 def registerPlexObject(cls):
     """ Registry of library types we may come across when parsing XML. This allows us to
         define a few helper functions to dynamically convert the XML into objects. See
@@ -422,7 +454,60 @@ def downloadSessionImages(server, filename=None, height=150, width=150,
     return info
 
 
-def download(url, token, filename=None, savepath=None, session=None, chunksize=4096,   # noqa: C901
+_sharedSession = None
+_sharedSessionLock = Lock()
+
+
+def createSession(poolConnections=None, poolSize=None, maxRetries=None, backoffFactor=None):
+    """ Returns a new :class:`requests.Session` with pooled keep-alive connections. The defaults
+        are read from the ``plexapi.pool_connections``, ``plexapi.pool_size``, ``plexapi.max_retries``
+        and ``plexapi.retry_backoff`` config settings.
+
+        Parameters:
+            poolConnections (int, optional): Number of hosts to keep a connection pool for.
+            poolSize (int, optional): Max number of connections kept open to a single host.
+                Set this to at least ``plexapi.container_workers`` when fetching pages concurrently.
+            maxRetries (int, optional): Number of times to retry a failed connection or a
+                502, 503 or 504 response for idempotent requests (0 to disable).
+            backoffFactor (float, optional): Backoff factor in seconds between retries.
+    """
+    from plexapi import X_PLEX_MAX_RETRIES, X_PLEX_POOL_CONNECTIONS, X_PLEX_POOL_SIZE, X_PLEX_RETRY_BACKOFF
+    poolConnections = poolConnections or X_PLEX_POOL_CONNECTIONS
+    poolSize = poolSize or X_PLEX_POOL_SIZE
+    maxRetries = X_PLEX_MAX_RETRIES if maxRetries is None else maxRetries
+    backoffFactor = X_PLEX_RETRY_BACKOFF if backoffFactor is None else backoffFactor
+
+    retries = 0
+    if maxRetries:
+        retries = Retry(
+            total=maxRetries,
+            backoff_factor=backoffFactor,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+    adapter = HTTPAdapter(pool_connections=poolConnections, pool_maxsize=poolSize, max_retries=retries)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def defaultSession():
+    """ Returns the session to use when none is specified. This is a single shared session
+        created with :func:`~plexapi.utils.createSession` if ``plexapi.shared_session`` is enabled
+        in the config, otherwise a new session is created for every call.
+    """
+    global _sharedSession
+    from plexapi import X_PLEX_SHARED_SESSION
+    if not X_PLEX_SHARED_SESSION:
+        return createSession()
+    with _sharedSessionLock:
+        if _sharedSession is None:
+            _sharedSession = createSession()
+        return _sharedSession
+
+
+def download(url, token, filename=None, savepath=None, session=None, chunksize=1024 * 1024,   # noqa: C901
              unpack=False, mocked=False, showstatus=False):
     """ Helper to download a thumb, videofile or other media item. Returns the local
         path to the downloaded file.
@@ -442,7 +527,7 @@ def download(url, token, filename=None, savepath=None, session=None, chunksize=4
             /path/to/file
     """
     # fetch the data to be saved
-    session = session or requests.Session()
+    session = session or defaultSession()
     headers = {'X-Plex-Token': token}
     response = session.get(url, headers=headers, stream=True)
     if response.status_code not in (200, 201, 204):
@@ -718,3 +803,46 @@ _illegal_XML_re = re.compile(fr'[{"".join(_illegal_XML_ranges)}]')
 
 def cleanXMLString(s):
     return _illegal_XML_re.sub('', s)
+
+
+def parseXML(content, parser=None):
+    """ Returns the parsed XML root element from the specified response content or None
+        if the content is empty. The content is parsed directly from the raw bytes and
+        illegal XML characters are only removed if parsing the content fails.
+
+        Parameters:
+            content (bytes or str): The XML content to parse.
+            parser (str, optional): The XML parser to use, ``etree`` (:mod:`xml.etree.ElementTree`)
+                or ``lxml`` (only if installed). Default is ``plexapi.xml_parser`` from the config.
+    """
+    if not content or content.isspace():
+        return None
+    if parser is None:
+        from plexapi import X_PLEX_XML_PARSER
+        parser = X_PLEX_XML_PARSER
+    fromstring = _lxmlFromstring if parser == 'lxml' and lxml_etree is not None else ElementTree.fromstring
+    try:
+        return fromstring(content)
+    except ElementTree.ParseError:
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+        return fromstring(cleanXMLString(content).encode('utf8'))
+
+
+def _lxmlFromstring(content):
+    """ Parse the XML content with lxml, skipping comments and processing instructions
+        so the elements behave the same as :mod:`xml.etree.ElementTree` elements.
+        Syntax errors are raised as :class:`xml.etree.ElementTree.ParseError`.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf8')
+    try:
+        return lxml_etree.fromstring(content, parser=_LXML_PARSER)
+    except lxml_etree.XMLSyntaxError as e:
+        raise ElementTree.ParseError(str(e)) from e
+
+
+# Entities are never expanded and no DTD is fetched from the network when parsing the responses
+_LXML_PARSER = lxml_etree.XMLParser(
+    remove_comments=True, remove_pis=True, resolve_entities=False, no_network=True
+) if lxml_etree else None
@@ -15,7 +15,7 @@ from plexapi.myplex import MyPlexAccount
 from plexapi.server import PlexServer
 from plexapi.utils import createMyPlexDevice
 
-from .payloads import ACCOUNT_XML
+from .payloads import ACCOUNT_XML, SERVER_XML
 
 try:
     from unittest.mock import patch, MagicMock, mock_open
@@ -164,6 +164,12 @@ def mocked_account(requests_mock):
     return MyPlexAccount(token="faketoken")
 
 
+@pytest.fixture()
+def mocked_plex(requests_mock):
+    requests_mock.get("http://mocked-plex:32400/", text=SERVER_XML)
+    return PlexServer("http://mocked-plex:32400", token="faketoken")
+
+
 @pytest.fixture(scope="session")
 def plex(request, sess):
     assert SERVER_BASEURL, "Required SERVER_BASEURL not specified."
@@ -352,7 +358,7 @@ def monkeydownload(request, monkeypatch):
 def callable_http_patch():
     """This is intended to stop some http requests inside some tests."""
     return patch(
-        "plexapi.server.requests.sessions.Session.send",
+        "requests.sessions.Session.send",
         return_value=MagicMock(status_code=200, text="<xml><child></child></xml>"),
     )
 
@@ -367,7 +373,7 @@ def empty_response(mocker):
 def patched_http_call(mocker):
     """This will stop any http calls inside any test."""
     return mocker.patch(
-        "plexapi.server.requests.sessions.Session.send",
+        "requests.sessions.Session.send",
         return_value=MagicMock(status_code=200, text="<xml><child></child></xml>"),
     )
 
@@ -44,3 +44,17 @@ MYPLEX_INVITE = """<MediaContainer friendlyName="myPlex" identifier="com.plexapp
 </Invite>
 </MediaContainer>
 """
+
+SERVER_XML = """<MediaContainer size="1" friendlyName="Test Server" machineIdentifier="abcdef0123456789" myPlex="1" platform="Linux" version="1.40.0.7998-c29d4c0c8">
+</MediaContainer>
+"""
+
+LIBRARY_SECTIONS = """<MediaContainer size="2" allowSync="0" title1="Plex Library">
+<Directory allowSync="1" art="/:/resources/movie-fanart.jpg" key="1" type="movie" title="Movies" agent="tv.plex.agents.movie" scanner="Plex Movie" language="en-US" uuid="1c2b3a4f-0000-0000-0000-000000000001" updatedAt="1700000000" createdAt="1600000000" scannedAt="1700000000" content="1" directory="1" contentChangedAt="100" hidden="0">
+<Location id="1" path="/data/Movies" />
+</Directory>
+<Directory allowSync="1" art="/:/resources/show-fanart.jpg" key="2" type="show" title="TV Shows" agent="tv.plex.agents.series" scanner="Plex TV Series" language="en-US" uuid="1c2b3a4f-0000-0000-0000-000000000002" updatedAt="1700000000" createdAt="1600000000" scannedAt="1700000000" content="1" directory="1" contentChangedAt="200" hidden="0">
+<Location id="2" path="/data/TV Shows" />
+</Directory>
+</MediaContainer>
+"""
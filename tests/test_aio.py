@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+from plexapi import utils
+from plexapi.cache import ResponseCache
+from plexapi.video import Movie
+
+pytest.importorskip("aiohttp")
+from plexapi.aio import AsyncPlexServer  # noqa: E402
+
+
+def test_aio_server(plex, movies):
+    async def run():
+        async with await AsyncPlexServer.connect(plex._baseurl, plex._token) as aplex:
+            assert aplex.server.machineIdentifier == plex.machineIdentifier
+            items = await aplex.fetchItems(f"/library/sections/{movies.key}/all", container_size=2)
+            assert [item.ratingKey for item in items] == [item.ratingKey for item in movies.all()]
+            assert all(item.librarySectionID == movies.key for item in items)
+            some_items = await aplex.fetchItems(f"/library/sections/{movies.key}/all", container_size=2, maxresults=3)
+            assert len(some_items) == 3
+            movie = await aplex.fetchItem(items[0].ratingKey, cls=Movie)
+            assert movie.isPartialObject()
+            await aplex.reload(movie)
+            assert movie.isFullObject()
+            assert movie.title == items[0].title
+
+    asyncio.run(run())
+
+
+def test_aio_fetchItems_filtered_maxresults(mocked_plex):
+    requests = []
+
+    async def query(key, headers=None, params=None):
+        start = int(headers["X-Plex-Container-Start"])
+        size = int(headers["X-Plex-Container-Size"])
+        requests.append((start, size))
+        tracks = "".join(
+            f'<Track type="track" ratingKey="{i}" index="{i % 2}" />' for i in range(start, min(start + size, 2000))
+        )
+        return utils.parseXML(f'<MediaContainer totalSize="2000">{tracks}</MediaContainer>')
+
+    async def run():
+        aplex = AsyncPlexServer(mocked_plex, maxConcurrency=4)
+        aplex.query = query
+        return await aplex.fetchItems("/library/sections/1/all", container_size=100, maxresults=4, index=1)
+
+    items = asyncio.run(run())
+    assert [item.ratingKey for item in items] == [1, 3, 5, 7]
+    assert len(requests) <= 5
+    assert all(size == 100 for _, size in requests[1:])
+
+
+class _AioResponse:
+    def __init__(self, url, status=200, content=b"<MediaContainer size='0'/>"):
+        self.url = url
+        self.status = status
+        self.content = content
+        self.headers = {}
+
+    async def read(self):
+        return self.content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class _AioSession:
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        return _AioResponse(url)
+
+
+def test_aio_query_cache(mocked_plex):
+    cache = mocked_plex._cache = ResponseCache()
+    session = _AioSession()
+    aplex = AsyncPlexServer(mocked_plex, session=session)
+    assert aplex._semaphore is None
+
+    async def run():
+        await aplex.query("/library/sections")
+        await aplex.query("/library/sections")
+        await aplex.query("/library/sections/1/refresh", method="put")
+        await aplex.query("/library/sections")
+
+    asyncio.run(run())
+    assert [method for method, _ in session.requests] == ["get", "put", "get"]
+    assert cache.hits == 1
+    assert len(cache) == 1
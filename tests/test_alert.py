@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from plexapi.alert import AlertEvent, AsyncAlertListener  # noqa: E402
+
+
+def _message(type, **entries):
+    return json.dumps({"NotificationContainer": {"type": type, "size": 1, **entries}})
+
+
+class _Server:
+    def __init__(self, baseurl):
+        self._baseurl = baseurl
+
+    def url(self, key, includeToken=False):
+        return f"{self._baseurl}{key}"
+
+
+def test_alert_AlertEvent():
+    event = AlertEvent(_message("timeline", TimelineEntry=[{"itemID": "1", "state": 5}]))
+    assert event.type == "timeline"
+    assert event._data is None
+    assert event.entries == [{"itemID": "1", "state": 5}]
+    assert AlertEvent('{"NotificationContainer": {"size": 0, "type": "activity"}}').type == "activity"
+
+
+def test_alert_AsyncAlertListener():
+    connections = []
+
+    async def websocket(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connections.append(ws)
+        await ws.send_str(_message("timeline", TimelineEntry=[{"itemID": str(len(connections))}]))
+        await ws.send_str(_message("transcodeSession.update", TranscodeSession=[{"key": "a"}]))
+        await ws.send_str(_message("playing", PlaySessionStateNotification=[{"state": "playing"}]))
+        if len(connections) == 1:
+            await ws.close()  # Drop the first connection to test the reconnect
+        else:
+            await ws.receive()  # Wait until the listener closes the connection
+        return ws
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/:/websockets/notifications", websocket)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        timeline, transcode, received = [], [], []
+
+        async def onTimeline(event):
+            await asyncio.sleep(0)
+            timeline.extend(entry["itemID"] for entry in event.entries)
+
+        listener = AsyncAlertListener(_Server(f"http://127.0.0.1:{port}"), backoff=0.05)
+        listener.subscribe(onTimeline, "timeline")
+        listener.subscribe(lambda event: transcode.append(event.type), "transcodeSession.*")
+        listener.subscribe(received.append)
+        async with listener:
+            for _ in range(100):
+                if len(received) >= 6:
+                    break
+                await asyncio.sleep(0.05)
+            assert listener.connected
+        await runner.cleanup()
+        return timeline, transcode, received
+
+    timeline, transcode, received = asyncio.run(run())
+    assert len(connections) == 2
+    assert timeline == ["1", "2"]
+    assert transcode == ["transcodeSession.update"] * 2
+    assert len(received) == 6
+
+
+def test_alert_AsyncAlertListener_overflow():
+    async def run(overflow):
+        listener = AsyncAlertListener(_Server("http://127.0.0.1:1"), queueSize=2, overflow=overflow)
+        listener._queue = asyncio.Queue(maxsize=2)
+        for i in range(4):
+            await listener._enqueue(str(i))
+        queued = [listener._queue.get_nowait() for _ in range(listener._queue.qsize())]
+        return queued, listener.dropped
+
+    assert asyncio.run(run("dropOldest")) == (["2", "3"], 2)
+    assert asyncio.run(run("dropNewest")) == (["0", "1"], 2)
+
+
+def test_alert_AsyncAlertListener_sync_callbacks():
+    received = []
+
+    def blocking(event):
+        time.sleep(0.3)  # e.g. a call to the synchronous PlexServer API
+
+    def broken(event):
+        raise ValueError("boom")
+
+    async def run():
+        listener = AsyncAlertListener(_Server("http://127.0.0.1:1"))
+        listener.subscribe(blocking)
+        listener.subscribe(broken)
+        listener.subscribe(received.append)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await listener._handle(AlertEvent(_message("timeline")))
+        task.cancel()
+        return ticks
+
+    # The event loop keeps running while the blocking callback runs in a thread
+    assert asyncio.run(run()) >= 10
+    assert [event.type for event in received] == ["timeline"]
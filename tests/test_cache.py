@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+import requests
+from xml.etree.ElementTree import Element
+
+from plexapi.cache import CacheInvalidator, ConnectionCache, ResponseCache
+from plexapi.exceptions import NotFound
+from plexapi.myplex import MyPlexResource, _raceConnections
+
+from .payloads import LIBRARY_SECTIONS, SERVER_XML
+
+
+def test_cache_query(mocked_plex, requests_mock):
+    cache = mocked_plex._cache = ResponseCache()
+    adapter = requests_mock.get("http://mocked-plex:32400/library/sections", text=LIBRARY_SECTIONS)
+    for _ in range(3):
+        sections = mocked_plex.query("/library/sections")
+        assert len(sections) == 2
+    assert adapter.call_count == 1
+    assert cache.hits == 2
+
+    # Endpoints without a time-to-live are never cached
+    adapter = requests_mock.get("http://mocked-plex:32400/status/sessions", text="<MediaContainer size='0'/>")
+    mocked_plex.query("/status/sessions")
+    mocked_plex.query("/status/sessions")
+    assert adapter.call_count == 2
+
+    cache.invalidate(r"^/library/sections")
+    assert len(cache) == 0
+    mocked_plex.query("/library/sections")
+    assert len(cache) == 1
+
+    # Requests which may change the server state remove the cached responses they change
+    requests_mock.put("http://mocked-plex:32400/library/sections/1/refresh", text="")
+    mocked_plex.query("/library/sections/1/refresh", method=mocked_plex._session.put)
+    assert len(cache) == 0
+
+
+def test_cache_invalidateRequest(mocked_plex, requests_mock):
+    cache = mocked_plex._cache = ResponseCache(ttls={r"^/library/": 60, r"^/:/prefs$": 60, r"^/status/": 0})
+    urls = ["/library/sections", "/library/sections/1/all", "/library/metadata/1", "/library/metadata/2", "/:/prefs"]
+    for url in urls:
+        requests_mock.get(f"http://mocked-plex:32400{url}", text="<MediaContainer size='0'/>")
+        mocked_plex.query(url)
+    assert len(cache) == 5
+
+    # Watched state GET requests remove the item and the section listings
+    scrobble = requests_mock.get("http://mocked-plex:32400/:/scrobble", text="")
+    mocked_plex.query("/:/scrobble", params={"key": 1, "identifier": "com.plexapp.plugins.library"})
+    mocked_plex.query("/:/scrobble", params={"key": 1, "identifier": "com.plexapp.plugins.library"})
+    assert scrobble.call_count == 2
+    assert {key[1] for key in cache._entries} == {
+        "http://mocked-plex:32400/library/sections",
+        "http://mocked-plex:32400/library/metadata/2",
+        "http://mocked-plex:32400/:/prefs",
+    }
+
+    # Other requests remove the responses below their path
+    requests_mock.put("http://mocked-plex:32400/:/prefs", text="")
+    mocked_plex.query("/:/prefs?FriendlyName=Plex", method=mocked_plex._session.put)
+    assert len(cache) == 2
+
+    # Endpoints which can never be cached are not looked up
+    hits, misses = cache.hits, cache.misses
+    requests_mock.get("http://mocked-plex:32400/status/sessions", text="<MediaContainer size='0'/>")
+    mocked_plex.query("/status/sessions")
+    assert (cache.hits, cache.misses) == (hits, misses)
+    assert len(cache) == 2
+
+
+def test_cache_conditional(mocked_plex, requests_mock):
+    cache = mocked_plex._cache = ResponseCache(ttls={r"^/:/prefs$": 0}, conditional=True)
+    url = "http://mocked-plex:32400/:/prefs"
+    requests_mock.get(url, text="<MediaContainer size='0'/>", headers={"ETag": '"abc"'})
+    mocked_plex.query("/:/prefs")
+    requests_mock.get(url, status_code=304)
+    time.sleep(0.01)
+    assert mocked_plex.query("/:/prefs").tag == "MediaContainer"
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+    assert cache.hits == 1
+
+
+def test_cache_lru():
+    cache = ResponseCache(maxsize=2, ttls={r".*": 60})
+
+    class Response:
+        content = b"<MediaContainer />"
+        headers = {}
+
+    keys = [cache.key("get", f"http://plex/{i}") for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.set(key, f"http://plex/{i}", Response())
+    assert len(cache) == 2
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]).content == Response.content
+
+
+def test_cache_connections(tmp_path):
+    path = str(tmp_path / "plexapi" / "connections.json")
+    cache = ConnectionCache(path)
+    cache.set("abc", "https://10-0-0-2.abc.plex.direct:32400")
+    other = ConnectionCache(path)
+    assert other.get("abc") == "https://10-0-0-2.abc.plex.direct:32400"
+    other.remove("abc")
+    assert cache.get("abc") is None
+
+    expired = ConnectionCache(path, ttl=0)
+    expired.set("abc", "http://10.0.0.2:32400")
+    assert expired.get("abc") is None
+    assert ConnectionCache(path).get("abc") == "http://10.0.0.2:32400"
+
+
+def test_cache_raceConnections(requests_mock):
+    identity = '<MediaContainer machineIdentifier="{}"/>'
+    requests_mock.get("http://local:32400/identity", status_code=401)
+    requests_mock.get("http://other:32400/identity", text=identity.format("other"))
+    requests_mock.get("http://remote:32400/identity", text=identity.format("abc"))
+    requests_mock.get("http://relay:32400/identity", text=identity.format("abc"))
+    urls = ["http://local:32400", "http://other:32400", "http://remote:32400", "http://relay:32400"]
+    session = requests.Session()
+    assert _raceConnections(urls, "token", session, 1, "abc") == "http://remote:32400"
+    assert _raceConnections(urls[:2], "token", session, 1, "abc") is None
+    assert _raceConnections([], "token", session, 1, "abc") is None
+
+
+def test_cache_connectServer_stale(mocked_plex, requests_mock, tmp_path):
+    resource = MyPlexResource(mocked_plex, Element(
+        "resource", name="Test Server", clientIdentifier="abcdef0123456789", accessToken="token", provides="server"))
+    urls = ["http://stale:32400", "http://fresh:32400"]
+    stale = requests_mock.get("http://stale:32400/identity", exc=requests.exceptions.ConnectTimeout)
+    fresh = requests_mock.get(
+        "http://fresh:32400/identity", text='<MediaContainer machineIdentifier="abcdef0123456789"/>')
+    requests_mock.get("http://fresh:32400/", text=SERVER_XML)
+    cache = ConnectionCache(str(tmp_path / "connections.json"))
+    cache.set("abcdef0123456789", "http://stale:32400")
+
+    # The remembered address is forgotten and all addresses are probed in the same call
+    server = resource._connectServer(urls, timeout=1, cache=cache)
+    assert server._baseurl == "http://fresh:32400"
+    assert cache.get("abcdef0123456789") == "http://fresh:32400"
+    assert stale.call_count == 2
+
+    # The next call only probes the remembered address
+    resource._connectServer(urls, timeout=1, cache=cache)
+    assert stale.call_count == 2
+    assert fresh.call_count == 2
+
+
+def test_cache_connectServer_failed(mocked_plex, requests_mock, tmp_path):
+    resource = MyPlexResource(mocked_plex, Element(
+        "resource", name="Test Server", clientIdentifier="abcdef0123456789", accessToken="token", provides="server"))
+    identity = '<MediaContainer machineIdentifier="abcdef0123456789"/>'
+    urls = ["http://broken:32400", "http://fresh:32400"]
+    requests_mock.get("http://broken:32400/identity", text=identity)
+    broken = requests_mock.get("http://broken:32400/", exc=requests.exceptions.ConnectionError)
+    requests_mock.get("http://fresh:32400/identity", text=identity)
+    requests_mock.get("http://fresh:32400/", text=SERVER_XML)
+    cache = ConnectionCache(str(tmp_path / "connections.json"))
+    cache.set("abcdef0123456789", "http://broken:32400")
+
+    # The remembered address answers the probe but fails to connect, the other addresses are raced
+    server = resource._connectServer(urls, timeout=1, cache=cache)
+    assert server._baseurl == "http://fresh:32400"
+    assert cache.get("abcdef0123456789") == "http://fresh:32400"
+    assert broken.call_count == 1
+
+    # The addresses failing to connect after the race raise NotFound
+    with pytest.raises(NotFound):
+        resource._connectServer(urls[:1], timeout=1)
+
+
+def test_cache_CacheInvalidator(mocked_plex, requests_mock):
+    cache = mocked_plex._cache = ResponseCache()
+    requests_mock.get("http://mocked-plex:32400/library", text="<MediaContainer/>")
+    sections = requests_mock.get("http://mocked-plex:32400/library/sections", text=LIBRARY_SECTIONS)
+    requests_mock.get("http://mocked-plex:32400/library/metadata/3", text=(
+        '<MediaContainer size="1"><Video ratingKey="3" key="/library/metadata/3" type="movie" title="Ran">'
+        '<Guid id="imdb://tt0089881"/></Video></MediaContainer>'
+    ))
+    movies = mocked_plex.library.sectionByID(1)
+    movies._guidIndex = {"imdb://tt0078748": 1, "tmdb://348": 1, "imdb://tt0113277": 2}
+    movies.__dict__["totalSize"] = 2
+    movie = mocked_plex.fetchItem(3)
+
+    invalidator = CacheInvalidator(mocked_plex)
+    invalidator.track(movie)
+    invalidator({"type": "timeline", "TimelineEntry": [
+        {"identifier": "com.plexapp.plugins.library", "sectionID": "1", "itemID": "1", "state": 9},
+        {"identifier": "com.plexapp.plugins.library", "sectionID": "1", "itemID": "3", "state": 5},
+        {"identifier": "com.plexapp.plugins.library", "sectionID": "1", "itemID": "4", "state": 1},
+    ]})
+    assert "totalSize" not in movies.__dict__
+    assert invalidator.stale == {3}
+    assert movies.buildGuidIndex() == {"imdb://tt0113277": 2, "imdb://tt0089881": 3}
+    assert invalidator.refreshStale() == [movie]
+    assert invalidator.stale == set()
+
+    # Responses of the changed section are removed from the response cache
+    mocked_plex.query("/library/sections")
+    assert len(cache) == 1
+    invalidator({"type": "activity", "ActivityNotification": [
+        {"event": "ended", "Activity": {"type": "library.update.section", "Context": {"librarySectionID": "2"}}},
+    ]})
+    assert len(cache) == 0
+
+    # Changes in an unknown section reload the library sections
+    invalidator({"type": "timeline", "TimelineEntry": [{"sectionID": "7", "itemID": "8", "state": 0}]})
+    assert mocked_plex.library._sectionsByID == {}
+    count = sections.call_count
+    mocked_plex.library.sectionByID(2)
+    assert sections.call_count == count + 1
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+import requests
+from plexapi import download
+from plexapi.download import DownloadManager
+from plexapi.exceptions import BadRequest
+
+URL = "http://mocked-plex:32400/library/parts/1/file.mkv?download=1"
+CONTENT = bytes(range(256)) * 64
+
+
+def _rangeResponse(request, context):
+    byterange = request.headers.get("Range")
+    if not byterange:
+        return CONTENT
+    start, end = byterange[len("bytes="):].split("-")
+    end = int(end) if end else len(CONTENT) - 1
+    context.status_code = 206
+    return CONTENT[int(start):end + 1]
+
+
+def test_download_resume(mocked_plex, requests_mock, tmp_path):
+    adapter = requests_mock.get(URL, content=_rangeResponse)
+    manager = DownloadManager(mocked_plex, chunksize=1024)
+    job = manager.add(URL, "file.mkv", savepath=str(tmp_path), size=len(CONTENT))
+    with open(job.partpath, "wb") as handle:
+        handle.write(CONTENT[:5000])
+
+    assert manager.run() == [job.filepath]
+    assert adapter.last_request.headers["Range"] == "bytes=5000-"
+    with open(job.filepath, "rb") as handle:
+        assert handle.read() == CONTENT
+    assert not os.path.exists(job.partpath)
+
+    # Complete files are not downloaded again
+    manager.add(URL, "file.mkv", savepath=str(tmp_path), size=len(CONTENT))
+    assert manager.run() == [job.filepath]
+    assert adapter.call_count == 1
+
+
+def test_download_segmented(mocked_plex, requests_mock, tmp_path, monkeypatch):
+    monkeypatch.setattr(download, "MIN_SEGMENT_SIZE", 1024)
+    adapter = requests_mock.get(URL, content=_rangeResponse)
+    manager = DownloadManager(mocked_plex, workers=2, segments=4, chunksize=1024)
+    job = manager.add(URL, "file.mkv", savepath=str(tmp_path), size=len(CONTENT))
+    assert manager.run() == [job.filepath]
+    assert adapter.call_count == 4
+    assert sorted(r.headers["Range"] for r in adapter.request_history)[0] == "bytes=0-4095"
+    with open(job.filepath, "rb") as handle:
+        assert handle.read() == CONTENT
+    assert not os.path.exists(job.statepath)
+
+
+def test_download_size_mismatch(mocked_plex, requests_mock, tmp_path):
+    requests_mock.get(URL, content=CONTENT)
+    manager = DownloadManager(mocked_plex)
+    job = manager.add(URL, "file.mkv", savepath=str(tmp_path), size=len(CONTENT) + 1)
+    assert manager.run() == []
+    assert isinstance(job.error, BadRequest)
+    with pytest.raises(BadRequest):
+        manager.download(job)
+
+
+def test_download_session_settings(mocked_plex):
+    mocked_plex._session = requests.Session()
+    mocked_plex._session.verify = "/etc/ssl/plex-ca.pem"
+    mocked_plex._session.proxies = {"https": "http://proxy:3128"}
+    mocked_plex._session.headers["X-Custom"] = "1"
+    manager = DownloadManager(mocked_plex, workers=3, segments=2)
+    session = manager._session
+    assert session is not mocked_plex._session
+    assert session.verify == "/etc/ssl/plex-ca.pem"
+    assert session.proxies == {"https": "http://proxy:3128"}
+    assert session.headers["X-Custom"] == "1"
+    assert session.get_adapter("https://plex")._pool_maxsize == 6
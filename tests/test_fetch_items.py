@@ -1,7 +1,10 @@
+from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
+import plexapi.base
+import pytest
 from plexapi.audio import Track
-from plexapi.base import MediaContainer
+from plexapi.base import AttrFilter, MediaContainer
 
 
 def test_media_container_is_list():
@@ -39,3 +42,92 @@ def test_find_items_empty_data(plex):
     assert len(result) == 0
     result = plex.findItems(Element("MediaContainer"))
     assert isinstance(result, MediaContainer)
+
+
+class _PagedServer:
+    """ Fake server returning a paged listing of tracks. """
+
+    def __init__(self, total_size):
+        self.total_size = total_size
+        self.requests = []
+
+    def query(self, key, headers=None, params=None):
+        start = int(headers['X-Plex-Container-Start'])
+        size = int(headers['X-Plex-Container-Size'])
+        self.requests.append((start, size))
+        data = Element('MediaContainer', totalSize=str(self.total_size))
+        for ratingKey in range(start, min(start + size, self.total_size)):
+            data.append(Element('Track', type='track', ratingKey=str(ratingKey), index=str(ratingKey % 2)))
+        data.attrib['size'] = str(len(data))
+        return data
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_fetch_items_pages(monkeypatch, workers):
+    monkeypatch.setattr(plexapi.base, 'X_PLEX_CONTAINER_WORKERS', workers)
+    server = _PagedServer(total_size=25)
+    obj = Track(server, None)
+
+    items = obj.fetchItems('/library/sections/1/all', Track, container_size=10)
+    assert [item.ratingKey for item in items] == list(range(25))
+    assert sorted(start for start, _ in server.requests) == [0, 10, 20]
+
+    items = obj.fetchItems('/library/sections/1/all', Track, container_start=3, container_size=10, maxresults=12)
+    assert [item.ratingKey for item in items] == list(range(3, 15))
+
+    items = obj.fetchItems('/library/sections/1/all', Track, container_size=5, maxresults=4, index=1)
+    assert [item.ratingKey for item in items] == [1, 3, 5, 7]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fetch_items_iter(monkeypatch, workers):
+    monkeypatch.setattr(plexapi.base, 'X_PLEX_CONTAINER_WORKERS', workers)
+    server = _PagedServer(total_size=50)
+    obj = Track(server, None)
+
+    items = obj.fetchItemsIter('/library/sections/1/all', Track, container_size=10)
+    assert [item.ratingKey for item in items] == list(range(50))
+
+    server.requests.clear()
+    for item in obj.fetchItemsIter('/library/sections/1/all', Track, container_size=10):
+        if item.ratingKey == 12:
+            break
+    assert len(server.requests) <= 2 + workers
+
+    items = obj.fetchItemsIter('/library/sections/1/all', Track, container_size=10, maxresults=15, index=0)
+    assert [item.ratingKey for item in items] == list(range(0, 30, 2))
+
+
+def test_attr_filter():
+    elem = ElementTree.fromstring(
+        '<Video type="movie" title="Big Buck Bunny" viewCount="2" rating="7.5">'
+        '<Genre tag="Animation" /><Genre tag="Comedy" />'
+        '<Media videoCodec="h264"><Part file="/data/Movies/Big Buck Bunny.mp4" /></Media>'
+        '</Video>'
+    )
+    assert AttrFilter(etag='Video', type='movie')(elem)
+    assert AttrFilter(title__icontains='bunny', viewCount__gte=2)(elem)
+    assert not AttrFilter(title__icontains='bunny', viewCount__gt=2)(elem)
+    assert AttrFilter(viewCount__gte=1, viewCount__lte=2)(elem)
+    assert not AttrFilter(viewCount__gte=1, viewCount__lte=1)(elem)
+    assert AttrFilter(rating__gt=7)(elem)
+    assert AttrFilter(Genre__tag='Comedy')(elem)
+    assert AttrFilter(genre__tag__in=['Drama', 'Animation'])(elem)
+    assert AttrFilter(Media__Part__file__startswith='/data/Movies')(elem)
+    assert AttrFilter(media__part__file__iregex=r'big buck bunny\.MP4$')(elem)
+    assert not AttrFilter(Media__Part__file__regex=r'\.mkv$')(elem)
+    assert AttrFilter(title__exists=True, summary__exists=False)(elem)
+    assert not AttrFilter(summary__exists=True)(elem)
+    assert AttrFilter(summary=None, title='Not the title')(elem)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_fetch_items_filtered_maxresults(monkeypatch, workers):
+    monkeypatch.setattr(plexapi.base, 'X_PLEX_CONTAINER_WORKERS', workers)
+    server = _PagedServer(total_size=2000)
+    obj = Track(server, None)
+
+    items = obj.fetchItems('/library/sections/1/all', Track, container_size=100, maxresults=4, index=1)
+    assert [item.ratingKey for item in items] == [1, 3, 5, 7]
+    assert len(server.requests) <= 2 + workers
+    assert all(size == 100 for _, size in server.requests[1:])
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import time
+from datetime import datetime
+
+from plexapi.exceptions import BadRequest
+from plexapi.fleet import PlexFleet
+
+
+class _Item:
+    def __init__(self, server, title, viewedAt=None):
+        self._server = server
+        self.title = title
+        self.viewedAt = viewedAt
+
+
+class _Server:
+    def __init__(self, name, history=(), delay=0, error=None):
+        self._baseurl = f"http://{name}:32400"
+        self.friendlyName = name
+        self._history = [_Item(self, title, datetime(2024, 1, day)) for title, day in history]
+        self._delay = delay
+        self._error = error
+
+    def history(self, maxresults=None, mindate=None):
+        time.sleep(self._delay)
+        if self._error:
+            raise self._error
+        return self._history[:maxresults]
+
+    def sessions(self):
+        return [_Item(self, "session")]
+
+
+def test_fleet_history_merge():
+    a = _Server("a", [("four", 4), ("one", 1)])
+    b = _Server("b", [("three", 3), ("two", 2)])
+    c = _Server("c", error=BadRequest("boom"))
+    fleet = PlexFleet([a, b, c])
+    results = fleet.history()
+    assert [item.title for item in results] == ["four", "three", "two", "one"]
+    assert list(results.errors) == [c]
+    assert isinstance(results.errors[c], BadRequest)
+    assert [item.title for item in results.bySource()[b]] == ["three", "two"]
+    assert [item.title for item in fleet.history(maxresults=1)] == ["four"]
+
+
+def test_fleet_timeout():
+    fast = _Server("fast", [("one", 1)])
+    slow = _Server("slow", [("two", 2)], delay=1)
+    fleet = PlexFleet([fast, slow], timeout=0.2)
+    start = time.monotonic()
+    results = fleet.history()
+    assert time.monotonic() - start < 0.9
+    assert [item.title for item in results] == ["one"]
+    assert isinstance(results.errors[slow], TimeoutError)
+
+
+def test_fleet_merge_sort():
+    a, b = _Server("a"), _Server("b")
+    fleet = PlexFleet([a, b])
+    results = fleet.merge(lambda server: [_Item(server, server.friendlyName, None)], sort="viewedAt")
+    assert [item.title for item in results] == ["a", "b"]
+    assert [item._server for item in fleet.sessions()] == [a, b]
+
+
+class _Section:
+    TYPE = "movie"
+
+    def __init__(self, items):
+        self._items = items
+
+    def search(self, title=None, libtype=None, sort=None, maxresults=None, **kwargs):
+        return list(self._items)
+
+
+class _Library:
+    def __init__(self, items):
+        self._sections = [_Section(items)]
+
+    def sections(self):
+        return self._sections
+
+
+def test_fleet_librarySearch_sort():
+    a, b = _Server("a"), _Server("b")
+    a.library = _Library([_Item(a, "a1", datetime(2024, 1, 1)), _Item(a, "a-none"), _Item(a, "a3", datetime(2024, 1, 3))])
+    b.library = _Library([_Item(b, "b2", datetime(2024, 1, 2)), _Item(b, "b-none")])
+    fleet = PlexFleet([a, b])
+
+    def titles(sort):
+        return [item.title for item in fleet.librarySearch(libtype="movie", sort=sort)]
+
+    assert titles("viewedAt") == ["a-none", "b-none", "a1", "b2", "a3"]
+    assert titles("viewedAt:asc") == ["a-none", "b-none", "a1", "b2", "a3"]
+    assert titles("viewedAt:nullsLast") == ["a1", "b2", "a3", "a-none", "b-none"]
+    assert titles("viewedAt:desc") == ["a3", "b2", "a1", "a-none", "b-none"]
+    assert titles("viewedAt:desc,title") == ["a3", "b2", "a1", "a-none", "b-none"]
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+import re
+
+import pytest
+from plexapi.exceptions import BadRequest
+from plexapi.history import HistoryExporter
+
+# (historyKey, viewedAt) with several rows in the same second across the page boundaries
+HISTORY = [(1, 100), (2, 100), (3, 100), (4, 101), (5, 102), (6, 102), (7, 103)]
+ROW = '<Video historyKey="/status/sessions/history/{0}" ratingKey="{0}0" accountID="1" deviceID="{1}" viewedAt="{2}" />'
+
+
+def _mockHistory(requests_mock, history):
+    def callback(request, context):
+        viewedAt = int(request.qs.get("viewedat>", [0])[0])
+        start = int(request.headers["X-Plex-Container-Start"])
+        size = int(request.headers["X-Plex-Container-Size"])
+        rows = [(key, at) for key, at in history if at >= viewedAt][start:start + size]
+        return "<MediaContainer>%s</MediaContainer>" % "".join(ROW.format(key, key % 2, at) for key, at in rows)
+
+    return requests_mock.get(re.compile(r".*/status/sessions/history/all"), text=callback)
+
+
+def test_history_exporter_HistoryExporter(mocked_plex, requests_mock, tmp_path):
+    checkpoint = str(tmp_path / "history.checkpoint")
+    path = str(tmp_path / "history.jsonl")
+    _mockHistory(requests_mock, HISTORY[:5])
+    assert HistoryExporter(mocked_plex, checkpoint=checkpoint, pagesize=2).export(path) == 5
+
+    # Resuming only appends the new rows
+    _mockHistory(requests_mock, HISTORY)
+    exporter = mocked_plex.historyExporter(checkpoint=checkpoint, pagesize=2)
+    assert exporter.export(path) == 2
+    assert exporter.exported == 7
+    assert exporter.cursor == 103
+    with open(path) as handle:
+        rows = [json.loads(line) for line in handle]
+    assert [row["historyKey"] for row in rows] == [f"/status/sessions/history/{key}" for key, _ in HISTORY]
+    assert rows[0] == {
+        "historyKey": "/status/sessions/history/1", "ratingKey": 10, "accountID": 1, "deviceID": 1, "viewedAt": 100
+    }
+    assert mocked_plex.historyExporter(checkpoint=checkpoint).export(path) == 0
+
+
+def test_history_exporter_HistoryExporter_same_second(mocked_plex, requests_mock):
+    # More rows in the same second than the page size
+    history = [(key, 100) for key in range(1, 6)] + [(6, 101)]
+    _mockHistory(requests_mock, history)
+    rows = list(HistoryExporter(mocked_plex, fields=["historyKey"], pagesize=2).rows())
+    assert [row["historyKey"][-1] for row in rows] == ["1", "2", "3", "4", "5", "6"]
+
+
+def test_history_exporter_HistoryExporter_csv_join(mocked_plex, requests_mock, tmp_path):
+    _mockHistory(requests_mock, HISTORY[:2])
+    requests_mock.get("http://mocked-plex:32400/accounts", text=(
+        '<MediaContainer><Account id="1" key="/accounts/1" name="owner" /></MediaContainer>'))
+    devices = requests_mock.get("http://mocked-plex:32400/devices", text=(
+        '<MediaContainer><Device id="1" name="TV" platform="Android" /></MediaContainer>'))
+    path = str(tmp_path / "history.csv")
+    exporter = HistoryExporter(mocked_plex, fields=["ratingKey", "viewedAt"], join=True)
+    assert exporter.export(path) == 2
+    with open(path, newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0] == {
+        "ratingKey": "10", "viewedAt": "100", "accountName": "owner", "deviceName": "TV", "devicePlatform": "Android"
+    }
+    assert rows[1]["deviceName"] == ""
+    assert devices.call_count == 1
+
+    with pytest.raises(BadRequest):
+        exporter.export(str(tmp_path / "history.xml"))
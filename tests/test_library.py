@@ -2,12 +2,19 @@
 from collections import namedtuple
 from datetime import datetime, timedelta
 from urllib.parse import quote_plus
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
 
 import pytest
 import plexapi.base
+import plexapi.library
 from plexapi.exceptions import BadRequest, NotFound
+from plexapi.library import FilterChoice, MovieSection
+from plexapi.media import SearchResult
+from plexapi.video import Movie
 
 from . import conftest as utils
+from .payloads import LIBRARY_SECTIONS
 
 
 def test_library_Library_section(plex):
@@ -71,6 +78,132 @@ def test_library_MovieSection_getGuid(movies, movie):
         movies.getGuid(guid='imdb://tt00000000')
 
 
+def test_library_MovieSection_guidIndex(mocked_plex, requests_mock, monkeypatch):
+    movies = MovieSection(mocked_plex, ElementTree.fromstring(LIBRARY_SECTIONS)[0], "/library/sections")
+    videos = {
+        "plex://movie/1": (
+            '<Video ratingKey="1" key="/library/metadata/1" type="movie" title="Alien" guid="plex://movie/1">'
+            '<Guid id="imdb://tt0078748"/><Guid id="tmdb://348"/></Video>'
+        ),
+        "plex://movie/2": '<Video ratingKey="2" key="/library/metadata/2" type="movie" title="Heat" guid="plex://movie/2"/>',
+    }
+
+    def library(request, context):
+        guid = request.qs.get("guid", [None])[0]
+        items = [video for key, video in videos.items() if guid in (None, key)]
+        return f'<MediaContainer size="{len(items)}" totalSize="{len(items)}">{"".join(items)}</MediaContainer>'
+
+    listing = requests_mock.get("http://mocked-plex:32400/library/sections/1/all", text=library)
+    requests_mock.get("http://mocked-plex:32400/library/metadata/1", text=(
+        '<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" title="Alien"/>'
+        '</MediaContainer>'
+    ))
+    assert movies.getGuid("imdb://tt0078748").title == "Alien"
+    assert movies.getGuid("tmdb://348").ratingKey == 1
+    assert movies.buildGuidIndex() == {
+        "plex://movie/1": 1, "imdb://tt0078748": 1, "tmdb://348": 1, "plex://movie/2": 2
+    }
+    assert listing.call_count == 1
+    movies.clearGuidIndex()
+    movies.buildGuidIndex()
+    assert listing.call_count == 2
+
+    # Guids missing from the index are looked up on the server and added to the index
+    videos["plex://movie/3"] = (
+        '<Video ratingKey="3" key="/library/metadata/3" type="movie" title="Ran" guid="plex://movie/3"/>'
+    )
+    matches = {"imdb-tt0089881": [SearchResult(mocked_plex, Element("SearchResult", guid="plex://movie/3"))]}
+    monkeypatch.setattr(Movie, "matches", lambda self, agent=None, title=None, **kwargs: matches.get(title, []))
+    searches = []
+
+    def search(title=None, guid=None, maxresults=None, **kwargs):
+        searches.append(guid)
+        filters = {"guid": guid} if guid else {}
+        items = movies.fetchItems("/library/sections/1/all", **filters)
+        return items[:maxresults]
+
+    monkeypatch.setattr(movies, "search", search)
+    assert movies.getGuid("imdb://tt0089881").ratingKey == 3
+    assert movies.buildGuidIndex()["imdb://tt0089881"] == 3
+    with pytest.raises(NotFound):
+        movies.getGuid("imdb://tt00000000")
+
+    # Plex guids are always searched for on the server
+    del searches[:]
+    assert movies.getGuid("plex://movie/2").title == "Heat"
+    assert searches == ["plex://movie/2"]
+
+    # Items deleted since the index was built are looked up again
+    requests_mock.get("http://mocked-plex:32400/library/metadata/1", status_code=404)
+    del videos["plex://movie/1"]
+    with pytest.raises(NotFound):
+        movies.getGuid("tmdb://348")
+    assert "tmdb://348" not in movies.buildGuidIndex()
+
+
+def test_library_MovieSection_searchColumns(mocked_plex, requests_mock):
+    movies = MovieSection(mocked_plex, ElementTree.fromstring(LIBRARY_SECTIONS)[0], "/library/sections")
+    requests_mock.get("http://mocked-plex:32400/library/sections/1/all", text=(
+        '<MediaContainer size="3" totalSize="3">'
+        '<Video ratingKey="1" type="movie" title="Alien" year="1979" addedAt="1700000000" rating="8.5">'
+        '<Genre tag="Horror"/><Genre tag="Sci-Fi"/></Video>'
+        '<Video ratingKey="2" type="movie" title="Heat" year="1995"/>'
+        '<Video ratingKey="3" type="movie" title="Ran" year="1985"><Genre tag="Drama"/></Video>'
+        '</MediaContainer>'
+    ))
+    columns = movies.searchColumns(["ratingKey", "title", "addedAt", "rating", "Genre__tag"])
+    assert columns["ratingKey"] == [1, 2, 3]
+    assert columns["title"] == ["Alien", "Heat", "Ran"]
+    assert columns["addedAt"] == [datetime.fromtimestamp(1700000000), None, None]
+    assert columns["rating"] == [8.5, None, None]
+    assert columns["Genre__tag"] == [["Horror", "Sci-Fi"], [], ["Drama"]]
+    columns = movies.searchColumns({"year": None}, year__gt=1980, maxresults=1)
+    assert columns == {"year": ["1995"]}
+
+
+def test_library_MovieSection_searchQuery(mocked_plex, requests_mock):
+    movies = MovieSection(mocked_plex, ElementTree.fromstring(LIBRARY_SECTIONS)[0], "/library/sections")
+    listing = requests_mock.get("http://mocked-plex:32400/library/sections/1/all", text=(
+        '<MediaContainer size="2" totalSize="2">'
+        '<Video ratingKey="1" key="/library/metadata/1" type="movie" title="Alien" year="1979"/>'
+        '<Video ratingKey="2" key="/library/metadata/2" type="movie" title="Heat" year="1995"/>'
+        '</MediaContainer>'
+    ))
+    query = movies.searchQuery(title="a", year__in=["1979", "1995"], ratingKey__gte=1)
+    assert query.key == "/library/sections/1/all?includeGuids=1&title=a"
+    assert query == movies.searchQuery(title="a", ratingKey__gte=1, year__in=["1979", "1995"])
+    assert query != movies.searchQuery(title="a")
+    assert len({query, movies.searchQuery(title="a", year__in=["1979", "1995"], ratingKey__gte=1)}) == 1
+    assert [movie.title for movie in query.search()] == ["Alien", "Heat"]
+    assert [movie.title for movie in query.iterSearch(maxresults=1)] == ["Alien"]
+    assert query.searchColumns(["ratingKey"]) == {"ratingKey": [1, 2]}
+    assert listing.call_count == 3
+
+
+def test_library_MovieSection_filterChoicesIndex(mocked_plex, monkeypatch):
+    movies = MovieSection(mocked_plex, ElementTree.fromstring(LIBRARY_SECTIONS)[0], "/library/sections")
+    calls = []
+
+    def listFilterChoices(field, libtype=None):
+        calls.append((field, libtype))
+        return [
+            FilterChoice(mocked_plex, ElementTree.fromstring(f'<Directory key="{key}" title="{title}"/>'))
+            for key, title in ((12, "Keanu Reeves"), (34, "Carrie-Anne Moss"))
+        ]
+
+    monkeypatch.setattr(movies, "listFilterChoices", listFilterChoices)
+    assert movies.resolveFilterChoices("actor", ["keanu reeves", "CARRIE-ANNE MOSS", 34, "Unknown"]) == [
+        "12", "34", "34", "Unknown"
+    ]
+    assert movies.resolveFilterChoices("actor", ["Keanu Reeves"]) == ["12"]
+    assert len(calls) == 1
+    monkeypatch.setattr(plexapi.library, "X_PLEX_FILTER_CHOICES_TTL", 0)
+    movies.clearFilterChoices()
+    movies.resolveFilterChoices("actor", ["Keanu Reeves"])
+    movies.resolveFilterChoices("actor", ["Keanu Reeves"])
+    assert len(calls) == 3
+
+
 def test_library_section_movies_all(movies):
     assert movies.totalSize == 4
     assert len(movies.all(container_start=0, container_size=1, maxresults=1)) == 1
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import pytest
+from plexapi import metrics
+from plexapi.exceptions import NotFound
+from plexapi.library import LibrarySection
+
+from .payloads import LIBRARY_SECTIONS
+
+
+@pytest.fixture()
+def aggregator():
+    aggregator = metrics.addListener(metrics.MetricsAggregator())
+    yield aggregator
+    metrics.removeListener(aggregator)
+
+
+def test_metrics_pathTemplate():
+    assert metrics.pathTemplate("http://mocked-plex:32400/library/metadata/123/children?X-Plex-Token=x") == \
+        "/library/metadata/{id}/children"
+    assert metrics.pathTemplate("/library/metadata/1,2,3") == "/library/metadata/{id}"
+    assert metrics.pathTemplate("/library/sections/1/all") == "/library/sections/{id}/all"
+
+
+def test_metrics_query(mocked_plex, requests_mock, aggregator):
+    events = []
+    metrics.addListener(events.append)
+    try:
+        requests_mock.get("http://mocked-plex:32400/library/sections", text=LIBRARY_SECTIONS)
+        requests_mock.get("http://mocked-plex:32400/library/metadata/1", status_code=404)
+        for _ in range(3):
+            mocked_plex.fetchItems("/library/sections", cls=LibrarySection)
+        with pytest.raises(NotFound):
+            mocked_plex.query("/library/metadata/1")
+    finally:
+        metrics.removeListener(events.append)
+
+    requests = [event for event in events if isinstance(event, metrics.RequestEvent)]
+    assert len(requests) == 4
+    assert requests[0].source == "server"
+    assert requests[0].endpoint == "GET /library/sections"
+    assert requests[0].status == 200
+    assert requests[0].bytes == len(LIBRARY_SECTIONS.encode("utf-8"))
+    assert requests[0].latency >= 0 and requests[0].parseTime >= 0
+    assert requests[-1].status == 404
+    assert requests[-1].error == "NotFound"
+
+    stats = aggregator.stats()
+    assert stats["GET /library/sections"]["count"] == 3
+    assert stats["GET /library/sections"]["p99"] >= stats["GET /library/sections"]["p50"]
+    assert stats["GET /library/metadata/{id}"]["errors"] == 1
+    assert stats["BUILD /library/sections"]["count"] == 3
+    assert stats["BUILD /library/sections"]["size"] == 6
+    assert "GET /library/sections" in aggregator.report()
+    aggregator.reset()
+    assert aggregator.stats() == {}
+
+
+def test_metrics_disabled(mocked_plex, requests_mock):
+    assert not metrics.enabled()
+    assert metrics.track("server", "get", "/library/sections") is metrics._NULL_TRACKER
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+from xml.etree import ElementTree
+
+import plexapi.mirror
+import pytest
+from plexapi.exceptions import NotFound
+from plexapi.library import MovieSection
+from plexapi.mirror import LibraryMirror
+from plexapi.video import Movie
+
+from .payloads import LIBRARY_SECTIONS
+
+MOVIE_XML = (
+    '<Video ratingKey="{key}" key="/library/metadata/{key}" type="movie" title="{title}" '
+    'guid="plex://movie/{key}" updatedAt="{updatedAt}" addedAt="1600000000">'
+    '<Media id="{key}"><Part id="{key}" file="/data/Movies/{title}.mkv"/></Media>'
+    '<Genre tag="{genre}"/><Guid id="imdb://tt{key}"/></Video>'
+)
+
+
+def _movies(section, *movies):
+    return [
+        Movie(section._server, ElementTree.fromstring(MOVIE_XML.format(**movie)), section.key)
+        for movie in movies
+    ]
+
+
+class _Search:
+    """ Replaces LibrarySection.iterSearch and records the calls. """
+
+    def __init__(self, results):
+        self.__qualname__ = "LibrarySection.iterSearch"
+        self.results = results
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return iter(self.results)
+
+
+@pytest.fixture()
+def section(mocked_plex):
+    data = ElementTree.fromstring(LIBRARY_SECTIONS)
+    return MovieSection(mocked_plex, data[0], "/library/sections")
+
+
+def test_mirror_sync(section):
+    search = section.iterSearch = _Search(_movies(
+        section,
+        {"key": 1, "title": "Alien", "updatedAt": 1700000000, "genre": "Horror"},
+        {"key": 2, "title": "Heat", "updatedAt": 1700000100, "genre": "Action"},
+    ))
+    mirror = LibraryMirror(section)
+    assert mirror.sync() == 2
+    assert len(mirror) == 2
+    assert search.calls == [{"libtype": "movie", "filters": None, "includeGuids": True}]
+
+    assert mirror.get(1).title == "Alien"
+    assert mirror.get(1).isPartialObject()
+    assert mirror.getGuid("imdb://tt2").title == "Heat"
+    assert mirror.getGuid("plex://movie/1").ratingKey == 1
+    assert mirror.getFile("/data/Movies/Heat.mkv").ratingKey == 2
+    assert [m.title for m in mirror.search(tag="action", tagType="Genre")] == ["Heat"]
+    assert [m.title for m in mirror.search(title="alien", libtype="movie")] == ["Alien"]
+    with pytest.raises(NotFound):
+        mirror.getGuid("imdb://tt3")
+
+    # Incremental sync only requests the updated items
+    search.results = _movies(section, {"key": 2, "title": "Heat", "updatedAt": 1700000200, "genre": "Crime"})
+    assert mirror.sync() == 1
+    assert search.calls[-1]["filters"]["updatedAt>>"].timestamp() == 1700000099
+    assert mirror.search(tag="Action") == []
+    assert mirror.search(tag="Crime")[0].title == "Heat"
+
+    # Full sync removes the items which no longer exist
+    mirror.sync(full=True)
+    assert len(mirror) == 1
+    with pytest.raises(NotFound):
+        mirror.get(1)
+
+
+def test_mirror_alerts(section, mocker):
+    section.iterSearch = _Search(_movies(
+        section,
+        {"key": 1, "title": "Alien", "updatedAt": 1700000000, "genre": "Horror"},
+        {"key": 2, "title": "Heat", "updatedAt": 1700000100, "genre": "Action"},
+    ))
+    mirror = LibraryMirror(section)
+    mirror.sync()
+
+    mirror.handleAlert({"type": "timeline", "TimelineEntry": [
+        {"sectionID": "1", "itemID": "1", "state": 9},
+        {"sectionID": "1", "itemID": "2", "state": 5},
+        {"sectionID": "2", "itemID": "3", "state": 5},
+    ]})
+    assert len(mirror) == 1
+    assert mirror._dirty == {2}
+
+    section.iterSearch.results = []
+    fetch = mocker.patch.object(section._server, "fetchItemsByRatingKeys", return_value=_movies(
+        section, {"key": 2, "title": "Heat (1995)", "updatedAt": 1700000300, "genre": "Action"}))
+    mirror.sync()
+    fetch.assert_called_once_with([2])
+    assert mirror.get(2).title == "Heat (1995)"
+
+
+def test_mirror_sync_batches(section, monkeypatch):
+    monkeypatch.setattr(plexapi.mirror, "X_PLEX_CONTAINER_SIZE", 2)
+    movies = [{"key": key, "title": f"Movie {key}", "updatedAt": 1700000000, "genre": "Drama"} for key in range(1, 6)]
+    section.iterSearch = _Search(_movies(section, *movies))
+    mirror = LibraryMirror(section)
+    assert mirror.sync(full=True) == 5
+
+    # Items stored in earlier batches are kept when a full sync removes the deleted items
+    section.iterSearch.results = _movies(section, *movies[1:])
+    assert mirror.sync(full=True) == 4
+    assert sorted(m.ratingKey for m in mirror.search()) == [2, 3, 4, 5]
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from plexapi.monitor import SessionMonitor
+
+SESSIONS = """<MediaContainer size="{size}">{videos}</MediaContainer>"""
+VIDEO = """<Video sessionKey="{key}" ratingKey="{key}" key="/library/metadata/{key}" type="movie" title="Movie {key}"
+    viewOffset="1000">
+<Media bitrate="8000" />
+<User id="1" title="user" />
+<Player title="Player {key}" state="{state}" machineIdentifier="player{key}" />
+<Session id="session{key}" bandwidth="{bandwidth}" location="lan" />
+<TranscodeSession key="/transcode/sessions/tc{key}" videoDecision="copy" audioDecision="transcode" />
+</Video>"""
+
+
+def _sessions(*sessions):
+    videos = "".join(VIDEO.format(key=key, state=state, bandwidth=bandwidth) for key, state, bandwidth in sessions)
+    return SESSIONS.format(size=len(sessions), videos=videos)
+
+
+def _playing(sessionKey, state, viewOffset):
+    return {"type": "playing", "size": 1, "PlaySessionStateNotification": [
+        {"sessionKey": str(sessionKey), "state": state, "viewOffset": viewOffset}
+    ]}
+
+
+def test_monitor_SessionMonitor(mocked_plex, requests_mock):
+    adapter = requests_mock.get("http://mocked-plex:32400/status/sessions", text=_sessions((1, "playing", 4000)))
+    monitor = SessionMonitor(mocked_plex)
+    events = []
+    monitor.subscribe(events.append)
+    transcodes = monitor.subscribe(lambda event: None, "transcode")
+    monitor.unsubscribe(transcodes)
+
+    monitor.refresh()
+    assert [(e.type, e.sessionKey, e.bitrate) for e in events] == [("start", 1, 4000)]
+    session = monitor.sessions[1]
+
+    # Known sessions are patched in place without requesting the sessions again
+    monitor.handleAlert(_playing(1, "playing", 5000))
+    monitor.handleAlert(_playing(1, "paused", 6000))
+    monitor.handleAlert(_playing(1, "playing", 6000))
+    assert [e.type for e in events[1:]] == ["progress", "pause", "resume"]
+    assert monitor.sessions[1] is session
+    assert session.viewOffset == 6000
+    assert adapter.call_count == 1
+
+    monitor.handleAlert({"type": "transcodeSession.update", "TranscodeSession": [
+        {"key": "/transcode/sessions/tc1", "videoDecision": "transcode", "audioDecision": "transcode",
+         "throttled": False, "progress": 12.5}
+    ]})
+    assert events[-1].type == "transcode"
+    assert events[-1].changes == {"videoDecision": ("copy", "transcode")}
+    assert session.transcodeSession.progress == 12.5
+
+    # A new session requests the sessions again
+    adapter = requests_mock.get(
+        "http://mocked-plex:32400/status/sessions", text=_sessions((1, "playing", 4000), (2, "playing", 0)))
+    del events[:]
+    monitor.handleAlert(_playing(2, "playing", 0))
+    assert ("start", 2, 8000) in [(e.type, e.sessionKey, e.bitrate) for e in events]
+    assert adapter.call_count == 1
+    assert monitor.sessions[1] is session
+
+    monitor.handleAlert(_playing(1, "stopped", 7000))
+    assert events[-1].type == "stop"
+    assert list(monitor.sessions) == [2]
@@ -571,3 +571,46 @@ def test_server_agents(plex):
 def test_server_identity(plex):
     identity = plex.identity()
     assert identity.machineIdentifier == plex.machineIdentifier
+
+
+def test_server_markPlayed_batch(mocked_plex, requests_mock):
+    episode = (
+        '<Video ratingKey="{0}" key="/library/metadata/{0}" type="episode" title="e{0}" parentRatingKey="{1}" '
+        'grandparentRatingKey="1" />'
+    )
+    items = "".join([
+        episode.format(11, 10), episode.format(12, 10), episode.format(31, 30),
+        '<Video ratingKey="20" key="/library/metadata/20" type="movie" title="m" />',
+    ])
+    requests_mock.get(re.compile(r".*/library/metadata/11,12,31,20"), text=f"<MediaContainer>{items}</MediaContainer>")
+    containers = (
+        '<MediaContainer><Directory ratingKey="1" key="/library/metadata/1/children" type="show" title="s" leafCount="5" '
+        'viewedLeafCount="1" /><Directory ratingKey="10" key="/library/metadata/10/children" type="season" title="s1" '
+        'parentRatingKey="1" leafCount="3" viewedLeafCount="1" /></MediaContainer>'
+    )
+    requests_mock.get(re.compile(r".*/library/metadata/1,10"), text=containers)
+
+    def scrobble(request, context):
+        if request.qs["key"] == ["20"]:
+            context.status_code = 500
+        return ""
+
+    adapter = requests_mock.get("http://mocked-plex:32400/:/scrobble", text=scrobble)
+    results = mocked_plex.markPlayed([11, "12", 31, 20], workers=2, rate=100)
+    assert [(r.ratingKey, r.requestKey, r.success) for r in results] == [
+        (11, 10, True), (12, 10, True), (31, 31, True), (20, 20, False)
+    ]
+    assert results[0].rolledUp and not results[2].rolledUp
+    assert isinstance(results[3].error, BadRequest)
+    assert sorted(request.qs["key"][0] for request in adapter.request_history) == ["10", "20", "31"]
+
+    # Rolling up is skipped when a sibling outside the batch is not played
+    requests_mock.get(re.compile(r".*/library/metadata/11,12\?"), text=f"<MediaContainer>{items}</MediaContainer>")
+    requests_mock.get(re.compile(r".*/library/metadata/1,10"), text=containers.replace('viewedLeafCount="1"', ""))
+    results = mocked_plex.markPlayed([11, 12])
+    assert [r.requestKey for r in results] == [11, 12]
+
+    adapter = requests_mock.get("http://mocked-plex:32400/:/progress", text="")
+    results = mocked_plex.updateProgress({11: 5000, 12: 6000})
+    assert all(r.success for r in results)
+    assert sorted(request.qs["time"][0] for request in adapter.request_history) == ["5000", "6000"]
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import time
 
+import plexapi
 import plexapi.utils as utils
 import pytest
 from plexapi.exceptions import NotFound
@@ -101,3 +102,50 @@ def test_millisecondToHumanstr():
 
 def test_toJson(movie):
     assert utils.toJson(movie)
+
+
+def test_utils_parseXML():
+    data = utils.parseXML(b'<MediaContainer size="1"><Video title="Movie"/></MediaContainer>')
+    assert data.attrib['size'] == '1'
+    assert data[0].attrib['title'] == 'Movie'
+    data = utils.parseXML(b'<MediaContainer><Video title="Bad\x0bTitle"/></MediaContainer>')
+    assert data[0].attrib['title'] == 'BadTitle'
+    assert utils.parseXML(b'') is None
+    assert utils.parseXML(b'  \n') is None
+    assert utils.parseXML(b'<MediaContainer/>', parser='lxml').tag == 'MediaContainer'
+
+
+def test_utils_parseXML_lxml_entities():
+    pytest.importorskip('lxml')
+    content = b'<!DOCTYPE MediaContainer [<!ENTITY title "Expanded">]><MediaContainer title="&title;"/>'
+    data = utils.parseXML(content, parser='lxml')
+    assert data.attrib.get('title') != 'Expanded'
+
+
+def test_utils_createSession(monkeypatch):
+    session = utils.createSession(poolConnections=4, poolSize=32, maxRetries=3, backoffFactor=1)
+    adapter = session.get_adapter("https://plex.tv")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 1
+    assert session.get_adapter("http://localhost:32400") is adapter
+    assert utils.createSession(maxRetries=0).get_adapter("https://plex.tv").max_retries.total == 0
+
+    monkeypatch.setattr(plexapi, "X_PLEX_SHARED_SESSION", False)
+    assert utils.defaultSession() is not utils.defaultSession()
+    monkeypatch.setattr(plexapi, "X_PLEX_SHARED_SESSION", True)
+    monkeypatch.setattr(utils, "_sharedSession", None)
+    assert utils.defaultSession() is utils.defaultSession()
+
+
+def test_utils_RateLimiter():
+    limiter = utils.RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.09
+    start = time.monotonic()
+    for _ in range(100):
+        utils.RateLimiter().wait()
+    assert time.monotonic() - start < 0.05
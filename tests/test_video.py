@@ -2,11 +2,16 @@
 import os
 from datetime import datetime
 from time import sleep
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
+from xml.etree import ElementTree
 
+import plexapi
 import pytest
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.base import AUTORELOAD_STATS, AutoReloadBatch
+from plexapi.exceptions import BadRequest, NotFound, ReloadRequired
+from plexapi.server import PlexServer
 from plexapi.sync import VIDEO_QUALITY_3_MBPS_720p
+from plexapi.video import Movie
 
 from . import conftest as utils
 from . import test_media, test_mixins
@@ -379,6 +384,107 @@ def test_video_Movie_isPartialObject(movie):
     movie._autoReload = True
 
 
+class _MetadataServer(PlexServer):
+    """ Fake server returning full metadata for /library/metadata/<key1,key2,...> requests. """
+
+    def __init__(self):
+        self._setup("http://fake-plex:32400", "faketoken")
+        super(PlexServer, self).__init__(self, ElementTree.Element("MediaContainer"), self.key)
+        self.keys = []
+
+    def query(self, key, **kwargs):
+        self.keys.append(key)
+        data = ElementTree.Element("MediaContainer")
+        for ratingKey in urlparse(key).path.rsplit("/", 1)[-1].split(","):
+            ElementTree.SubElement(
+                data, "Video", type="movie", ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}",
+                title=f"Movie {ratingKey}", studio="Studio"
+            )
+        return data
+
+
+def _partialMovies(server, count):
+    return [
+        Movie(server, ElementTree.Element(
+            "Video", type="movie", ratingKey=str(i), key=f"/library/metadata/{i}", title=f"Movie {i}"
+        ), initpath="/library/sections/1/all")
+        for i in range(1, count + 1)
+    ]
+
+
+def test_video_Movie_autoReloadBatch():
+    server = _MetadataServer()
+    with AutoReloadBatch(_partialMovies(server, 5), chunksize=2) as movies:
+        assert all(movie.isPartialObject() for movie in movies)
+        assert [movie.studio for movie in movies] == ["Studio"] * 5
+    assert len(server.keys) == 3
+    assert server.keys[0].startswith("/library/metadata/1,2?")
+    assert all(movie.isFullObject() for movie in movies)
+
+
+def test_video_fetchItemsByRatingKeys():
+    server = _MetadataServer()
+    partial = _partialMovies(server, 1)[0]
+    items = server.fetchItemsByRatingKeys([3, partial, "2", 3], chunksize=2, workers=2)
+    assert len(server.keys) == 2
+    assert items[1] is partial and partial.isFullObject() and partial.studio == "Studio"
+    assert [item.ratingKey for item in items] == [3, 1, 2, 3]
+    assert all(isinstance(item, Movie) and item.isFullObject() for item in items)
+
+    server.fetchItemsByRatingKeys([4], includeMarkers=False)
+    assert "includeMarkers" not in server.keys[-1]
+
+
+def test_video_Movie_autoReloadStrict(monkeypatch):
+    server = _MetadataServer()
+    movie = _partialMovies(server, 1)[0]
+    AUTORELOAD_STATS.clear()
+    monkeypatch.setattr(plexapi.base, "AUTORELOAD_STRICT", True)
+    with pytest.raises(ReloadRequired):
+        movie.studio
+    assert not server.keys
+    assert AUTORELOAD_STATS[("Movie", "studio")] == 1
+
+
+def test_video_Movie_lazyItems():
+    server = _MetadataServer()
+    data = ElementTree.Element("Video", type="movie", ratingKey="1", key="/library/metadata/1", title="Movie 1")
+    ElementTree.SubElement(data, "Genre", tag="Action", id="1")
+    movie = Movie(server, data, initpath="/library/metadata/1")
+    assert "genres" not in movie.__dict__
+    assert [genre.tag for genre in movie.genres] == ["Action"]
+    assert movie.genres is movie.genres
+
+    # Loading new data clears the cached child objects
+    movie._autoReload = False
+    movie._loadData(ElementTree.Element("Video", type="movie", ratingKey="1", key="/library/metadata/1"))
+    assert "genres" not in movie.__dict__
+    assert movie.genres == []
+    assert not server.keys
+
+
+def test_video_Movie_leanObjects(monkeypatch):
+    monkeypatch.setattr(plexapi.base, "LEAN_OBJECTS", True)
+    server = _MetadataServer()
+    movies = []
+    for i in (1, 2):
+        data = ElementTree.Element(
+            "Video", type="movie", ratingKey=str(i), key=f"/library/metadata/{i}", title=f"Movie {i}",
+            librarySectionKey="/library/sections/1"
+        )
+        ElementTree.SubElement(data, "Genre", tag="Action", filter="genre=1", id="1")
+        ElementTree.SubElement(data, "Genre", tag=f"Genre {i}", filter=f"genre={i + 1}", id=str(i + 1))
+        ElementTree.SubElement(data, "Media", id=str(i + 10), videoResolution="1080")
+        movies.append(Movie(server, data, initpath="/library/sections/1/all"))
+
+    assert all(len(movie._data) == 0 and movie._data.attrib["ratingKey"] for movie in movies)
+    assert movies[0].genres[0] is movies[1].genres[0]
+    assert movies[0].genres[0].key == "/library/sections/1/all?genre=1&type=1"
+    assert movies[0].genres[1] is not movies[1].genres[1]
+    assert [genre.tag for genre in movies[1].genres] == ["Action", "Genre 2"]
+    assert movies[0].media[0]._parentKey == movies[0].key == "/library/metadata/1"
+
+
 def test_video_Movie_media_delete(movie, patched_http_call):
     for media in movie.media:
         media.delete()
@@ -43,15 +43,20 @@ if __name__ == '__main__':
     datestr = lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # noqa
     print(f'{datestr()} Starting plex-markwatched script..')
     plex = PlexServer()
+    items = []
     for section in plex.library.sections():
         print(f'{datestr()} Checking {section.title} for unwatched items..')
         for item in _iter_items(section.search(collection='markwatched')):
             if not item.isWatched:
                 print(f'{datestr()}  Marking {_get_title(item)} watched.')
-                item.markWatched()
+                items.append(item)
     # Check all OnDeck items
     print(f'{datestr()} Checking OnDeck for unwatched items.')
     for item in plex.library.onDeck():
         if not item.isWatched and _has_markwatched_tag(item):
             print(f'{datestr()}  Marking {_get_title(item)} watched.')
-            item.markWatched()
+            items.append(item)
+    # Mark all items watched at once, rolling up complete seasons and shows
+    for result in plex.markPlayed(items, workers=4):
+        if not result.success:
+            print(f'{datestr()}  Unable to mark {_get_title(result.item)} watched: {result.error}')